@@ -1,14 +1,15 @@
 import bpy
 
 from .config import __addon_name__
-from .functions.AddonFunctions import load_icon_preview, get_preferences
+from .functions.AddonFunctions import load_icon_preview, get_preferences, warm_shape_library, mapping_undo_handler, \
+    mapping_depsgraph_handler
 from .i18n.dictionary import dictionary
 from .properties.AddonProperties import BoneDisplaySettings, RenameTool, BoneMappingSettings, \
     DeformSettings
 from ...common.class_loader import auto_load
 from ...common.class_loader.auto_load import add_properties, remove_properties
 from ...common.i18n.dictionary import common_dictionary
-from ...common.i18n.i18n import load_dictionary
+from ...common.i18n.i18n import load_dictionary, subscribe_language, unsubscribe_language
 
 bl_info = {
     "name": "BL Rig Tool",
@@ -33,8 +34,17 @@ _addon_properties = {
 def init_pref_defaults():
     try:
         pref = get_preferences()
+        warm_shape_library()
         if not pref.general.is_initialized:
             pref.general.set_defaults()
+            #shape names are checked against the library once the UI is up
+            bpy.app.timers.register(resolve_pref_shapes, first_interval=2.0)
+    except Exception:
+        pass
+
+def resolve_pref_shapes():
+    try:
+        get_preferences().general.resolve_pending_shapes()
     except Exception:
         pass
 
@@ -52,9 +62,16 @@ def register():
     #Load bone Shape Icon
     if load_icon_preview() not in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.append(load_icon_preview())
+    #Refresh the retarget list after undo, redo and bone renames
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if mapping_undo_handler not in handlers:
+            handlers.append(mapping_undo_handler)
+    if mapping_depsgraph_handler not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(mapping_depsgraph_handler)
     # Internationalization
     load_dictionary(dictionary)
     bpy.app.translations.register(__addon_name__, common_dictionary)
+    subscribe_language()
     #Register ue5 manny add menu
     bpy.types.VIEW3D_MT_armature_add.append(ue5_manny_add)
     #Register basic shape configs in preference
@@ -65,10 +82,16 @@ def register():
 def unregister():
     #Remove bone Shape Icon
     bpy.app.handlers.load_post.remove(load_icon_preview())
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if mapping_undo_handler in handlers:
+            handlers.remove(mapping_undo_handler)
+    if mapping_depsgraph_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(mapping_depsgraph_handler)
     # Remove ue5 manny add menu
     bpy.types.VIEW3D_MT_armature_add.remove(ue5_manny_add)
     # Internationalization
     bpy.app.translations.unregister(__addon_name__)
+    unsubscribe_language()
     # unRegister classes
     auto_load.unregister()
     remove_properties(_addon_properties)
@@ -1,22 +1,28 @@
 import difflib
+import hashlib
 import math
-from email.policy import default
+import re
 
 import bpy
 import os
+import tempfile
 import mathutils
+import numpy as np
 
 from bpy.utils import previews
-from numpy.lib.utils import source
-from numpy.matrixlib.defmatrix import matrix
 
 from ..config import __addon_name__
-from ..utils import AddonUtils
+from ..utils import AddonUtils, RigProfiler
+from . import AssetCache, BoneClassifier, BoneMappingStore, BoneTopology, ShapeLibraryIndex, WidgetGenerator
 
 
 def get_preferences():
     return bpy.context.preferences.addons[__addon_name__].preferences
 
+def set_mode(mode):
+    with RigProfiler.profile_phase(f"Mode {mode}", "mode_switch"):
+        bpy.ops.object.mode_set(mode=mode)
+
 def get_selected_bones(context, self):
     pbone = context.selected_pose_bones
 
@@ -52,14 +58,51 @@ def sort_actions(collection):
 
 #__CUSTOM DISPLAY SHAPE__
 preview_collections = {}
+def get_asset_cache_folder():
+    pref = get_preferences()
+    if pref.asset_cache_folder:
+        return os.path.normpath(bpy.path.abspath(pref.asset_cache_folder))
+    return os.path.join(tempfile.gettempdir(), "BLRigTool_assets")
+
+def get_assets_folder():
+    #reads go to the local mirror when the cache is enabled, the share is only used until the first fill
+    pref = get_preferences()
+    path = os.path.normpath(pref.assets_folder)
+    if not pref.use_asset_cache:
+        return path
+    return AssetCache.resolve_root(path, get_asset_cache_folder())
+
+def publish_asset(path):
+    pref = get_preferences()
+    if pref.use_asset_cache:
+        AssetCache.write_back(os.path.normpath(pref.assets_folder), get_asset_cache_folder(), path)
+
+def discard_asset(path):
+    pref = get_preferences()
+    if pref.use_asset_cache:
+        AssetCache.remove_file(os.path.normpath(pref.assets_folder), get_asset_cache_folder(), path)
+
 def get_icon_folder():
-    path = get_preferences().assets_folder
+    path = get_assets_folder()
     return os.path.normpath(os.path.join(path, "icons"))
 
-def get_library_path():
-    path = get_preferences().assets_folder
+def get_library_path(assets_folder=None):
+    path = assets_folder or get_assets_folder()
     return os.path.normpath(os.path.join(path, "BoneShapesLibrary.blend"))
 
+def get_library_paths(assets_folder=None):
+    #highest priority first, the bundled library is always the base layer
+    paths = []
+    for entry in get_preferences().shape_libraries:
+        if entry.enabled and entry.filepath:
+            path = os.path.normpath(bpy.path.abspath(entry.filepath))
+            if path not in paths:
+                paths.append(path)
+    base = get_library_path(assets_folder)
+    if base not in paths:
+        paths.append(base)
+    return paths
+
 def load_icon_preview():
     pcoll = previews.new()
     icon_path = get_icon_folder()
@@ -77,24 +120,24 @@ def unload_icon_preview():
     preview_collections.clear()
 
 def generate_icon(self, context, distance, angle, keep_generated):
-    blend_path = get_library_path()
     icon_path = get_icon_folder()
     os.makedirs(icon_path, exist_ok=True)
 
     selected_name = context.scene.bone_display_settings.bone_shape
     if not selected_name or selected_name == "None":
-        self.report({'INFO'}, f"Bone Shape {blend_path} not found")
+        self.report({'INFO'}, f"Bone Shape {get_library_path()} not found")
         return {'CANCELLED'}
 
+    blend_path = get_shape_library(selected_name)
+    index = get_shape_library_index(selected_name)
     obj = bpy.data.objects.get(selected_name)
     if obj is None:
-        with bpy.data.libraries.load(blend_path, link=False) as (data_from, data_to):
-            if selected_name not in data_from.objects:
-                self.report({'INFO'}, f"Object '{selected_name}' not found in library file")
-                return {'CANCELLED'}
-            data_to.objects = [selected_name]
+        if not library_has_shape(selected_name):
+            self.report({'INFO'}, f"Object '{selected_name}' not found in library file")
+            return {'CANCELLED'}
 
-        obj = bpy.data.objects.get(selected_name)
+        #appended, the temporary bevel/solidify cannot be added to linked data
+        obj = resolve_library_shape(selected_name, link=False)
         if obj is None:
             self.report({'ERROR'}, f"Failed to load object '{selected_name}' from library file")
             return {'CANCELLED'}
@@ -138,10 +181,13 @@ def generate_icon(self, context, distance, angle, keep_generated):
         cam_obj = bpy.data.objects.new(name=cam_name, object_data=cam_data)
         scene.collection.objects.link(cam_obj)
         cam_location = obj.location.copy()
-        cam_offset = mathutils.Vector((0, 0, max(obj.dimensions.z, 1) * distance))
+        #framed from the indexed bounds, the temporary solidify/bevel is not part of the shape
+        info = ShapeLibraryIndex.get_shape_info(index, obj.name)
+        dimensions = mathutils.Vector(info["dimensions"]) if info else obj.dimensions
+        cam_offset = mathutils.Vector((0, 0, max(dimensions.z, 1) * distance))
 
         if angle == "DIAGONAL":
-            cam_offset = mathutils.Vector((1, -1, 1)).normalized() * obj.dimensions.length * distance
+            cam_offset = mathutils.Vector((1, -1, 1)).normalized() * dimensions.length * distance
             cam_obj.rotation_euler = (math.radians(50), 0, math.radians(45))
         else:
             cam_obj.rotation_euler = (math.radians(0), 0, 0)
@@ -201,6 +247,9 @@ def generate_icon(self, context, distance, angle, keep_generated):
                 bpy.data.objects.remove(obj, do_unlink=True)
 
     self.report({'INFO'}, f"Saved icon: {icon_path}")
+    publish_asset(icon_file)
+    if blend_path:
+        ShapeLibraryIndex.record_icon(blend_path, icon_path, selected_name)
     load_icon_preview()
     return {'FINISHED'}
 
@@ -214,33 +263,158 @@ def remove_icon(self, context):
 
     if os.path.exists(icon_file):
         os.remove(icon_file)
+        discard_asset(icon_file)
+        ShapeLibraryIndex.record_icon(get_shape_library(selected_name) or get_library_path(), icon_path, selected_name)
         self.report({'INFO'}, f"Removed icon: {icon_file}")
     else:
         self.report({'WARNING'}, f"Icon not found: {selected_name}, file path: {icon_file}")
 
     return {'FINISHED'}
 
-def get_bone_shapes_library(self, context):
-    blend_path = os.path.abspath(get_library_path())
+_shape_library = {"items": []}
 
-    current_filepath = os.path.abspath(bpy.data.filepath)
+def use_index_folder():
+    #shape library sidecars are kept next to the asset mirror, never in the library folder
+    ShapeLibraryIndex.set_index_folder(os.path.join(get_asset_cache_folder(), "index"))
 
-    items = []
+def get_merged_library_index(load=True):
+    use_index_folder()
+    return ShapeLibraryIndex.get_merged_index(get_library_paths(), get_icon_folder(), load)
+
+def get_library_shape_names(load=True):
+    #object names of all shape libraries, served from the sidecar indexes while the .blend files are unchanged
+    merged = get_merged_library_index(load)
+    return merged["names"] if merged else None
+
+def get_shape_library(shape_name, load=True):
+    return ShapeLibraryIndex.get_shape_owner(get_merged_library_index(load), shape_name)
+
+def get_shape_library_index(shape_name, build=True):
+    blend_path = get_shape_library(shape_name, build)
+    if blend_path is None:
+        return None
+    return ShapeLibraryIndex.get_library_index(blend_path, get_icon_folder(), build)
+
+def resolve_library_shape(shape_name, link=None):
+    #one copy per shape: an existing object is reused, otherwise the shape is linked or appended from its owning library
+    blend_path = get_shape_library(shape_name)
+    obj = bpy.data.objects.get(shape_name)
+    if obj is not None and (obj.library is None or blend_path is None
+                            or os.path.normpath(bpy.path.abspath(obj.library.filepath)) == blend_path):
+        return obj
+    if blend_path is None:
+        return None
 
-    if os.path.exists(blend_path):
-        try:
-            object_names = []
-            if blend_path == current_filepath:
-                object_names = [obj.name for obj in bpy.data.objects]
-            else:
-                with bpy.data.libraries.load(blend_path, link=False) as (data_from, data_to):
-                    object_names = [name for name in data_from.objects if name]
+    if link is None:
+        link = get_preferences().shape_link_mode == 'LINK'
+    with bpy.data.libraries.load(blend_path, link=link) as (data_from, data_to):
+        data_to.objects = [shape_name]
+    return data_to.objects[0] if data_to.objects else None
+
+SHAPE_COPY_PATTERN = re.compile(r"^(.+)\.(\d{3,})$")
+
+def get_geometry_size(obj):
+    #rough bytes of the geometry arrays, used to report what a dedupe freed
+    data = obj.data
+    if obj.type == 'MESH':
+        return len(data.vertices) * 12 + len(data.edges) * 8 + len(data.loops) * 8 + len(data.polygons) * 12
+    if obj.type == 'CURVE':
+        return sum(len(spline.bezier_points) * 40 + len(spline.points) * 16 for spline in data.splines)
+    return 0
+
+def is_same_shape(obj, other):
+    if obj.type != other.type or obj.type not in {'MESH', 'CURVE'}:
+        return False
+    points = ShapeLibraryIndex.get_data_points(obj)
+    other_points = ShapeLibraryIndex.get_data_points(other)
+    return points.shape == other_points.shape and np.allclose(points, other_points, atol=1e-5)
+
+def dedupe_shape_objects():
+    #Circle_0.001 copies left by repeated appends are merged into Circle_0, only copies outside any scene are touched
+    shapes = {pb.custom_shape for obj in bpy.data.objects if obj.type == 'ARMATURE' for pb in obj.pose.bones if pb.custom_shape}
+    groups = {}
+    for obj in shapes:
+        match = SHAPE_COPY_PATTERN.match(obj.name)
+        if match and not obj.library and not obj.users_collection:
+            groups.setdefault(match.group(1), []).append(obj)
+
+    remap = {}
+    for name, copies in groups.items():
+        base = bpy.data.objects.get(name)
+        if base is None:
+            copies.sort(key=lambda obj: obj.name)
+            base = copies.pop(0)
+        for copy in copies:
+            if is_same_shape(base, copy):
+                remap[copy] = base
+
+    result = {"objects": 0, "bones": 0, "bytes": 0}
+    if not remap:
+        return result
+
+    for obj in bpy.data.objects:
+        if obj.type != 'ARMATURE':
+            continue
+        for pb in obj.pose.bones:
+            target = remap.get(pb.custom_shape)
+            if target is not None:
+                pb.custom_shape = target
+                result["bones"] += 1
+
+    for copy in remap:
+        if copy.users:
+            continue
+        data = copy.data
+        collection = bpy.data.meshes if copy.type == 'MESH' else bpy.data.curves
+        result["bytes"] += get_geometry_size(copy)
+        bpy.data.objects.remove(copy)
+        if not data.users:
+            collection.remove(data)
+        result["objects"] += 1
+    return result
+
+def get_manny_path(assets_folder=None):
+    return os.path.normpath(os.path.join(assets_folder or get_assets_folder(), "SKM_Manny.blend"))
+
+def warm_shape_library():
+    use_index_folder()
+    pref = get_preferences()
+    if not pref.use_asset_cache:
+        return ShapeLibraryIndex.warm_library(get_library_paths(), [get_manny_path()])
+
+    #the mirror is revalidated first, the index is then warmed from the files it serves. Both path sets are worked
+    #out here, get_assets_folder would start the sync without this callback and preferences are not read off the main thread
+    share_root = os.path.normpath(pref.assets_folder)
+    cache_root = get_asset_cache_folder()
+    paths = {
+        root: (get_library_paths(root), [get_manny_path(root)])
+        for root in (share_root, cache_root)
+    }
 
+    def on_synced(counts):
+        #the same root resolve_root hands out: the mirror once any sync has finished, else the share
+        blend_paths, extra_paths = paths[cache_root if AssetCache.is_ready(cache_root) else share_root]
+        ShapeLibraryIndex.warm_library(blend_paths, extra_paths)
+
+    return AssetCache.revalidate_async(share_root, cache_root, on_synced)
+
+def library_has_shape(shape_name):
+    return get_shape_library(shape_name) is not None
+
+def get_bone_shapes_library(self, context):
+    items = []
+
+    try:
+        object_names = get_library_shape_names()
+        if object_names is None:
+            print("Blend file not found")
+            items.append(("None", "None", "No library file found", 'ERROR', 0))
+        else:
+            icon_coll = preview_collections.get("custom_icons", {})
             for index, obj_name in enumerate(object_names):
                 if obj_name is None or obj_name.strip() == "":
                     continue
 
-                icon_coll = preview_collections.get("custom_icons", {})
                 icon_id = 'ERROR'
 
                 if icon_coll:
@@ -251,12 +425,11 @@ def get_bone_shapes_library(self, context):
                 items.append((obj_name, obj_name, "Bone Shape Object", icon_id, index))
 
             items.sort(key=lambda x: x[1])
-        except Exception as e:
-            items.append(("None", "None", f"Error loading: {e}", 'ERROR', 0))
-    else:
-        print("Blend file not found")
-        items.append(("None", "None", "No library file found", 'ERROR', 0))
+    except Exception as e:
+        items.append(("None", "None", f"Error loading: {e}", 'ERROR', 0))
 
+    #Blender only borrows the strings of dynamic enum items, keep them alive
+    _shape_library["items"] = items
     return items
 
 def bone_color_items(self, context):
@@ -283,26 +456,17 @@ def bone_color_items(self, context):
     return items
 
 #__GENERATE CONSTRAINT__
-def get_or_create_collection(arm, collection_name):
-    name = str(collection_name)
-    stack = list(arm.collections)
-    while stack:
-        coll = stack.pop()
-        if coll.name == name:
-            return coll
-        stack.extend(coll.children)
-    return arm.collections.new(name)
-
 def apply_child_of_inverse(context, obj, pose_bone, constraint):
     bpy.ops.pose.select_all(action='DESELECT')
 
     obj.data.bones.active = pose_bone.bone
     AddonUtils.Compat.bone_selection(pose_bone, True)
 
-    bpy.ops.constraint.childof_set_inverse(
-        constraint=constraint.name,
-        owner='BONE'
-    )
+    with RigProfiler.profile_phase(constraint.name, "set_inverse"):
+        bpy.ops.constraint.childof_set_inverse(
+            constraint=constraint.name,
+            owner='BONE'
+        )
 
 def create_deform_bone(obj, target_pb, matrix_pb, def_bone_name, mapping, relation='head', parent_name=""):
     arm = obj.data
@@ -351,6 +515,15 @@ def create_deform_bone(obj, target_pb, matrix_pb, def_bone_name, mapping, relati
 
     return created_bone_name
 
+CONNECT_HASH_KEY = "wryc_connect_hash"
+
+def get_bone_rest_hash(bone):
+    parent_name = bone.parent.name if bone.parent else ""
+    values = [round(v, 5) + 0.0 for row in bone.matrix_local for v in row]
+    values += [round(v, 5) + 0.0 for v in bone.tail_local]
+    data = f"{bone.name}|{parent_name}|{values}"
+    return hashlib.md5(data.encode("utf-8")).hexdigest()
+
 def get_or_create_constraint(pb, prefix, ctype):
     con = None
     for existing in pb.constraints:
@@ -362,17 +535,24 @@ def get_or_create_constraint(pb, prefix, ctype):
         con.name = f"{prefix}{ctype.replace('_', ' ').title()}"
     return con
 
+#shapes a two-sided build flips on the left bone only: bone name -> shape rotation axes that are negated
+LEFT_FLIPPED_SHAPE_AXES = {"TB_foot_l": (1,)}
+
+def flip_left_shape(pb):
+    for axis in LEFT_FLIPPED_SHAPE_AXES.get(pb.name, ()):
+        pb.custom_shape_rotation_euler[axis] *= -1
+
 def apply_bone_shape_settings(pb, config=None, armature=None):
     #if config is not None:
     pref = get_preferences()
     settings = getattr(pref.general, config, None)
 
-    shape_name = settings.shape
-    blend_path = get_library_path()
-    with bpy.data.libraries.load(blend_path, link=False) as (data_from, data_to):
-        if shape_name in data_from.objects:
-            data_to.objects = [shape_name]
-    shape_obj = bpy.data.objects.get(shape_name)
+    shape_name = settings.pending_shape or settings.shape
+    if settings.source == 'PROCEDURAL' and WidgetGenerator.is_procedural(shape_name):
+        shape_obj = WidgetGenerator.get_widget(shape_name, settings.segments)
+    else:
+        with RigProfiler.profile_phase(shape_name, "library_load"):
+            shape_obj = resolve_library_shape(shape_name)
 
     if shape_obj:
         pb.custom_shape = shape_obj
@@ -382,25 +562,12 @@ def apply_bone_shape_settings(pb, config=None, armature=None):
     pb.custom_shape_rotation_euler = settings.rot
     pb.custom_shape_scale_xyz = settings.scale
 
-def ensure_target(obj, source_bone, target_bone, config=None, parent_bone=None, use_connect=None, position=None, length=0.1, mode="DEFAULT",ref_name=None):
+def build_target_bone(obj, eb_src, target_name, parent_name=None, use_connect=None, position=None, length=0.1, mode="DEFAULT", ref_name=None):
     arm = obj.data
 
-    source_name = source_bone.name if hasattr(source_bone, "name") else source_bone
-    target_name = target_bone.name if hasattr(target_bone, "name") else target_bone
-    parent_name = parent_bone if isinstance(parent_bone, str) else None
-
-    if target_bone in arm.bones:
-        return obj.pose.bones[target_bone]
-
-    bpy.ops.object.mode_set(mode='EDIT')
-
-    eb_src = arm.edit_bones.get(source_name)
-    if not eb_src:
-        bpy.ops.object.mode_set(mode='POSE')
-        return None
-
     eb_ref = arm.edit_bones.get(ref_name) if ref_name else None
-    new_bone = arm.edit_bones.new(target_name)
+    #an existing bone is placed again, generators re-run with new settings move their targets
+    new_bone = arm.edit_bones.get(target_name) or arm.edit_bones.new(target_name)
 
     if mode == "DEFAULT":
         new_bone.head = eb_src.head
@@ -489,57 +656,131 @@ def ensure_target(obj, source_bone, target_bone, config=None, parent_bone=None,
         new_bone.parent = None
         new_bone.use_connect = bool(use_connect)
 
-    bpy.ops.object.mode_set(mode='POSE')
-    pb_new = obj.pose.bones.get(target_bone)
-
-    if pb_new and config:
-        apply_bone_shape_settings(pb_new, config, obj)
-
-    return pb_new
-
-def compute_pole_position(obj, upper_name, lower_name, end_name, distance=0.3):
-    pb_upper = obj.matrix_world @ obj.pose.bones[upper_name].head
-    pb_lower = obj.matrix_world @ obj.pose.bones[lower_name].head
-    pb_end = obj.matrix_world @ obj.pose.bones[end_name].head
-
-    v_upper = pb_lower - pb_upper
-    v_line = pb_end - pb_upper
+    return new_bone
 
-    #projection
-    proj = v_line.dot(v_upper) / v_line.dot(v_line)
-    pb_proj = pb_upper + proj * v_line
-    pole_dir = (pb_lower - pb_proj).normalized()
-
-    if pole_dir.length < 0.0001:
-        pole_dir = (obj.matrix_world.to_3x3() @ obj.pose.bones[lower_name].x_axis).normalized()
+def ensure_target(obj, source_bone, target_bone, config=None, parent_bone=None, use_connect=None, position=None, length=0.1, mode="DEFAULT",ref_name=None):
+    arm = obj.data
 
-    pole_pos = pb_lower + pole_dir * distance
+    source_name = source_bone.name if hasattr(source_bone, "name") else source_bone
+    target_name = target_bone.name if hasattr(target_bone, "name") else target_bone
+    parent_name = parent_bone if isinstance(parent_bone, str) else None
 
-    return pole_pos
+    if target_bone in arm.bones:
+        return obj.pose.bones[target_bone]
 
-def compute_pole_angle(obj, upper_name, end_name, pole_pos_world):
-    upper = obj.pose.bones[upper_name]
-    end = obj.pose.bones[end_name]
+    set_mode('EDIT')
 
-    pole_pos_pose = obj.matrix_world.inverted() @ pole_pos_world
-    upper_matrix_inv = upper.bone.matrix_local.inverted()
-    pole_local = upper_matrix_inv @ pole_pos_pose
-    head_local = upper_matrix_inv @ upper.head
-    tail_local = upper_matrix_inv @ upper.tail
-    end_tail_local = upper_matrix_inv @ end.head
+    eb_src = arm.edit_bones.get(source_name)
+    if not eb_src:
+        set_mode('POSE')
+        return None
 
-    pole_normal = (end_tail_local - head_local).cross(pole_local - head_local)
-    bone_dir = (tail_local - head_local).normalized()
+    with RigProfiler.profile_phase(target_name, "edit_bone"):
+        build_target_bone(obj, eb_src, target_name, parent_name, use_connect, position, length, mode, ref_name)
 
-    projected_pole_axis = pole_normal.cross(tail_local - head_local)
+    set_mode('POSE')
+    pb_new = obj.pose.bones.get(target_bone)
 
-    x_axis = mathutils.Vector((1, 0, 0))
+    if pb_new and config:
+        apply_bone_shape_settings(pb_new, config, obj)
 
-    angle = x_axis.angle(projected_pole_axis)
-    if x_axis.cross(projected_pole_axis).dot(bone_dir) > 0:
-        angle = -angle
+    return pb_new
 
-    return angle
+def ensure_targets(obj, targets, remove=()):
+    #batched ensure_target: targets are dicts of ensure_target arguments, created in order in one edit session
+    #targets with update=True are placed again when they exist, bones in remove are deleted in the same session
+    arm = obj.data
+    created = {t["target_bone"] for t in targets if t["target_bone"] not in arm.bones}
+    placed = [t for t in targets if t["target_bone"] in created or t.get("update")]
+    remove = [name for name in remove if name in arm.bones]
+
+    if placed or remove:
+        set_mode('EDIT')
+        for name in remove:
+            arm.edit_bones.remove(arm.edit_bones[name])
+        for t in placed:
+            eb_src = arm.edit_bones.get(t["source_bone"])
+            if not eb_src:
+                continue
+            parent_bone = t.get("parent_bone")
+            with RigProfiler.profile_phase(t["target_bone"], "edit_bone"):
+                build_target_bone(
+                    obj,
+                    eb_src,
+                    t["target_bone"],
+                    parent_bone if isinstance(parent_bone, str) else None,
+                    t.get("use_connect"),
+                    t.get("position"),
+                    t.get("length", 0.1),
+                    t.get("mode", "DEFAULT"),
+                    t.get("ref_name"),
+                )
+        set_mode('POSE')
+
+    result = []
+    for t in targets:
+        pb = obj.pose.bones.get(t["target_bone"])
+        if pb and t.get("config") and t["target_bone"] in created:
+            apply_bone_shape_settings(pb, t["config"], obj)
+        result.append(pb)
+    return result
+
+def ensure_hook_curve(context, obj, curve_name, points, hook_bones):
+    #NURBS curve through armature space points, every point hooked to its bone
+    #an existing curve is updated in place so the Spline IK keeps its target, selection and active object are untouched
+    curve_obj = bpy.data.objects.get(curve_name)
+    if curve_obj is not None and curve_obj.type != 'CURVE':
+        bpy.data.objects.remove(curve_obj, do_unlink=True)
+        curve_obj = None
+
+    if curve_obj is None:
+        curve_data = bpy.data.curves.new(curve_name, type='CURVE')
+        curve_data.dimensions = '3D'
+        curve_obj = bpy.data.objects.new(curve_name, curve_data)
+        if obj.users_collection:
+            target_collection = obj.users_collection[0]
+        else:
+            target_collection = context.scene.collection
+        target_collection.objects.link(curve_obj)
+
+    if curve_obj.parent != obj:
+        curve_obj.parent = obj
+
+    curve_data = curve_obj.data
+    spline = curve_data.splines[0] if len(curve_data.splines) == 1 else None
+    rebuild = spline is None or spline.type != 'NURBS' or len(spline.points) != len(points)
+    if rebuild:
+        curve_data.splines.clear()
+        spline = curve_data.splines.new('NURBS')
+        spline.points.add(len(points) - 1)
+        spline.use_endpoint_u = True
+        spline.order_u = min(4, len(points))
+
+    spline.points.foreach_set("co", [v for pos in points for v in (*pos, 1.0)])
+    curve_data.update_tag()
+
+    hook_names = [f"{bone_name} - Hook" for bone_name in hook_bones]
+    hooks = {mod.name: mod for mod in curve_obj.modifiers if mod.type == 'HOOK'}
+    for name, mod in hooks.items():
+        if name not in hook_names:
+            curve_obj.modifiers.remove(mod)
+
+    bones = obj.data.bones
+    for index, (bone_name, hook_name) in enumerate(zip(hook_bones, hook_names)):
+        mod = hooks.get(hook_name)
+        if mod is None:
+            mod = curve_obj.modifiers.new(name=hook_name, type='HOOK')
+            mod.object = obj
+            mod.subtarget = bone_name
+            mod.vertex_indices_set([index])
+        elif rebuild:
+            mod.vertex_indices_set([index])
+
+        matrix_inverse = bones[bone_name].matrix_local.inverted()
+        if mod.matrix_inverse != matrix_inverse:
+            mod.matrix_inverse = matrix_inverse
+
+    return curve_obj
 
 def detect_roll_axis(obj, toe_name):
     toe_bone = obj.data.bones.get(toe_name)
@@ -556,14 +797,19 @@ def detect_roll_axis(obj, toe_name):
     is_positive = local_axes[roll_axis].dot(world_x) > 0
     return roll_axis, is_positive
 
-def collect_bone_chain(root_pbone):
-    chain = []
-    def recure(pb):
-        chain.append(pb)
-        for child in pb.children:
-            recure(child)
-    recure(root_pbone)
-    return chain
+def iter_bone_chain(obj, root_name, stop=None, max_depth=-1, prefix="", deform_only=False, collection=""):
+    within = None
+    if collection:
+        coll = BoneClassifier.CollectionLookup(obj.data).collections.get(collection)
+        within = {bone.name for bone in coll.bones} if coll else set()
+
+    pose_bones = obj.pose.bones
+    topology = BoneTopology.get_topology(obj)
+    for name in topology.iter_chain(root_name, stop, max_depth, prefix, deform_only, within):
+        yield pose_bones[name]
+
+def collect_bone_chain(root_pbone, **filters):
+    return list(iter_bone_chain(root_pbone.id_data, root_pbone.name, **filters))
 
 #__RENAME TOOL__
 def update_selected_target(self, context):
@@ -596,4 +842,68 @@ def target_bone_items(self, context, edit_text):
     tgt_names = [b.name for b in arm.bones]
     matches = difflib.get_close_matches(edit_text, tgt_names, n=5, cutoff=0.3)
 
-    return [m for m in matches]
\ No newline at end of file
+    return [m for m in matches]
+#__RETARGET LIST__
+# Bumped by every mapping edit, the list filter and sort are only recomputed when it changes
+_mapping_generation = {"value": 0}
+_mapping_rows = {}
+
+def bump_mapping_generation(self=None, context=None):
+    _mapping_generation["value"] += 1
+
+@bpy.app.handlers.persistent
+def mapping_undo_handler(scene=None, depsgraph=None):
+    #undo and redo restore mappings without calling their update callbacks
+    bump_mapping_generation()
+
+@bpy.app.handlers.persistent
+def mapping_depsgraph_handler(scene=None, depsgraph=None):
+    #renamed, added or removed bones update the armature data, the target bone check has to run again
+    if depsgraph is not None and depsgraph.id_type_updated('ARMATURE'):
+        bump_mapping_generation()
+
+def get_mapping_rows(settings):
+    #rows of the mappings collection, with compact storage only the current page of all pairs
+    #edits, paging and storage switches all bump the generation, so the pairs are only read on a miss
+    arm = settings.target_armature
+    page_size = len(settings.mappings)
+    #bone renames bump the generation through the depsgraph handler, the key stays a few cheap values
+    key = (
+        _mapping_generation["value"],
+        page_size,
+        arm.name_full if arm else "",
+    )
+    rows = _mapping_rows.get(settings.as_pointer())
+    if rows is not None and rows["key"] == key:
+        return rows
+
+    pairs = BoneMappingStore.get_mapping_pairs(settings)
+    start = BoneMappingStore.get_page_start(settings, len(pairs)) if settings.use_compact_storage else 0
+    #a target used on another page is still a duplicate
+    counts = {}
+    for _, target in pairs:
+        if target:
+            counts[target] = counts.get(target, 0) + 1
+    page = pairs[start:start + page_size]
+    sources = [source for source, _ in page]
+    targets = [target for _, target in page]
+    bone_names = set(arm.bones.keys()) if arm else None
+
+    rows = {
+        "key": key,
+        "search": [f"{source}\n{target}".lower() for source, target in zip(sources, targets)],
+        "unmatched": [not target or (bone_names is not None and target not in bone_names) for target in targets],
+        "duplicate": [bool(target) and counts[target] > 1 for target in targets],
+        "scores": [
+            difflib.SequenceMatcher(None, source.lower(), target.lower()).ratio() if target else 0.0
+            for source, target in zip(sources, targets)
+        ],
+        "filters": {},
+    }
+    _mapping_rows[settings.as_pointer()] = rows
+    return rows
+
+def get_drawn_mapping_rows(settings):
+    #draw_item runs per row right after filter_items, which already checked the key for this redraw
+    rows = _mapping_rows.get(settings.as_pointer())
+    return rows if rows is not None else get_mapping_rows(settings)
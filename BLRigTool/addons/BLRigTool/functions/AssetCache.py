@@ -0,0 +1,225 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+
+#__ASSET CACHE__
+# Read-through mirror of the assets folder on local disk, the share stays the source of truth.
+# A file whose share stamp changed but whose checksum did not is left alone, so caches keyed by its local stamp stay valid.
+# manifest.json in the cache folder:
+# {
+#   "version": 1,
+#   "files": {"icons/Circle_0.png": {"share": {"mtime_ns": ..., "size": ...}, "local": {...}, "sha256": "..."}, ...}
+# }
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+MIRROR_EXTENSIONS = (".blend", ".png")
+# seconds before a mirror that failed to sync is tried again
+RETRY_INTERVAL = 300.0
+
+_manifests = {}
+_lock = threading.Lock()
+_revalidating = {}
+_ready = set()
+_failures = {}
+
+def get_file_stamp(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+def get_manifest(cache_root):
+    manifest = _manifests.get(cache_root)
+    if manifest is None:
+        try:
+            with open(os.path.join(cache_root, MANIFEST_NAME), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+                raise ValueError("Unknown manifest version")
+            manifest = data["files"]
+        except (OSError, ValueError, KeyError):
+            manifest = {}
+        #a saved manifest is only written by a finished sync, a first sync still running has none yet
+        if manifest:
+            _ready.add(cache_root)
+        _manifests[cache_root] = manifest
+    return manifest
+
+def save_manifest(cache_root):
+    manifest_path = os.path.join(cache_root, MANIFEST_NAME)
+    temp_path = f"{manifest_path}.tmp"
+    with _lock:
+        data = {"version": MANIFEST_VERSION, "files": dict(get_manifest(cache_root))}
+    try:
+        os.makedirs(cache_root, exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, ensure_ascii=False)
+        os.replace(temp_path, manifest_path)
+    except OSError as e:
+        print(f"Failed to write asset cache manifest {manifest_path}: {e}")
+
+def get_checksum(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def copy_with_checksum(source, target):
+    #written next to the target first, a broken transfer never replaces a good copy
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    temp_path = f"{target}.tmp"
+    digest = hashlib.sha256()
+    with open(source, "rb") as src, open(temp_path, "wb") as dst:
+        for chunk in iter(lambda: src.read(1 << 20), b""):
+            digest.update(chunk)
+            dst.write(chunk)
+    shutil.copystat(source, temp_path)
+    os.replace(temp_path, target)
+    return digest.hexdigest()
+
+def list_share_files(share_root):
+    #raises OSError when the share cannot be listed, an empty listing must not empty the mirror
+    def on_error(error):
+        raise error
+
+    relpaths = []
+    for folder, _, filenames in os.walk(share_root, onerror=on_error):
+        for filename in filenames:
+            if filename.lower().endswith(MIRROR_EXTENSIONS):
+                relpath = os.path.relpath(os.path.join(folder, filename), share_root)
+                relpaths.append(relpath.replace(os.sep, "/"))
+    return relpaths
+
+def sync_file(share_root, cache_root, relpath):
+    #returns FETCHED, TOUCHED (share stamp changed, same content), UNCHANGED or OFFLINE
+    source = os.path.join(share_root, relpath)
+    target = os.path.join(cache_root, relpath)
+    manifest = get_manifest(cache_root)
+    entry = manifest.get(relpath)
+
+    share_stamp = get_file_stamp(source)
+    if share_stamp is None:
+        return "OFFLINE"
+    local_stamp = get_file_stamp(target)
+
+    if entry and local_stamp == entry["local"]:
+        if share_stamp == entry["share"]:
+            return "UNCHANGED"
+        #a touched or re-uploaded file keeps the local copy, and with it every cache keyed by its stamp
+        if get_checksum(source) == entry["sha256"]:
+            with _lock:
+                manifest[relpath] = dict(entry, share=share_stamp)
+            return "TOUCHED"
+
+    checksum = copy_with_checksum(source, target)
+    with _lock:
+        manifest[relpath] = {"share": share_stamp, "local": get_file_stamp(target), "sha256": checksum}
+    return "FETCHED"
+
+def sync_mirror(share_root, cache_root):
+    if not os.path.isdir(share_root):
+        raise OSError(f"Assets share is not reachable: {share_root}")
+    relpaths = list_share_files(share_root)
+
+    counts = {"FETCHED": 0, "TOUCHED": 0, "UNCHANGED": 0, "OFFLINE": 0, "REMOVED": 0}
+    for relpath in relpaths:
+        try:
+            counts[sync_file(share_root, cache_root, relpath)] += 1
+        except OSError as e:
+            print(f"Failed to cache {relpath}: {e}")
+            counts["OFFLINE"] += 1
+
+    manifest = get_manifest(cache_root)
+    with _lock:
+        removed = set(manifest) - set(relpaths)
+    for relpath in removed:
+        try:
+            os.remove(os.path.join(cache_root, relpath))
+        except OSError:
+            pass
+        with _lock:
+            manifest.pop(relpath, None)
+        counts["REMOVED"] += 1
+
+    save_manifest(cache_root)
+    return counts
+
+def is_ready(cache_root):
+    get_manifest(cache_root)
+    return cache_root in _ready
+
+def resolve_root(share_root, cache_root):
+    #never waits for the share: until the first sync has finished in the background, reads go to the share
+    if is_ready(cache_root):
+        return cache_root
+    failed = _failures.get(cache_root)
+    if failed is None or time.monotonic() - failed > RETRY_INTERVAL:
+        revalidate_async(share_root, cache_root)
+    return share_root
+
+def revalidate_async(share_root, cache_root, callback=None):
+    thread = _revalidating.get(cache_root)
+    if thread is not None and thread.is_alive():
+        return thread
+
+    def worker():
+        try:
+            counts = sync_mirror(share_root, cache_root)
+        except OSError as e:
+            print(f"Asset cache serves the last mirrored files: {e}")
+            _failures[cache_root] = time.monotonic()
+            counts = None
+        else:
+            _failures.pop(cache_root, None)
+            _ready.add(cache_root)
+        if callback:
+            callback(counts)
+
+    thread = threading.Thread(target=worker, name="wryc_asset_cache", daemon=True)
+    _revalidating[cache_root] = thread
+    thread.start()
+    return thread
+
+def get_relpath(cache_root, path):
+    relpath = os.path.relpath(os.path.abspath(path), os.path.abspath(cache_root))
+    if relpath.startswith(".."):
+        return None
+    return relpath.replace(os.sep, "/")
+
+def write_back(share_root, cache_root, path):
+    #files created in the mirror, like rendered icons, are copied to the share
+    relpath = get_relpath(cache_root, path)
+    if relpath is None:
+        return False
+    try:
+        checksum = copy_with_checksum(path, os.path.join(share_root, relpath))
+    except OSError as e:
+        print(f"Failed to write {relpath} back to the assets share: {e}")
+        return False
+    with _lock:
+        get_manifest(cache_root)[relpath] = {
+            "share": get_file_stamp(os.path.join(share_root, relpath)),
+            "local": get_file_stamp(path),
+            "sha256": checksum,
+        }
+    save_manifest(cache_root)
+    return True
+
+def remove_file(share_root, cache_root, path):
+    relpath = get_relpath(cache_root, path)
+    if relpath is None:
+        return False
+    try:
+        os.remove(os.path.join(share_root, relpath))
+    except OSError as e:
+        print(f"Failed to remove {relpath} from the assets share: {e}")
+        return False
+    with _lock:
+        get_manifest(cache_root).pop(relpath, None)
+    save_manifest(cache_root)
+    return True
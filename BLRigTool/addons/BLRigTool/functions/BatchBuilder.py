@@ -0,0 +1,171 @@
+import json
+import os
+import subprocess
+import time
+
+import bpy
+
+from ..config import __addon_name__
+from . import AddonFunctions, BoneClassifier
+from ..utils import AddonUtils
+
+#__BATCH BUILD__
+# step id: (label, operator idname, bones selected before the step: None, "ALL" or a bone collection name)
+BATCH_STEPS = {
+    'MANNY_DEFORM': ("UE5 Manny Deform", "wryc.ot_create_manny_deform_bones", None),
+    'MANNY_CONTROLLER': ("UE5 Manny Controller", "wryc.ot_create_manny_controller", None),
+    'SET_INVERSE': ("Set Inverse All", "wryc.ot_set_inverse_all_child_of", "ALL"),
+    'DISPLAY': ("Display Shapes", "wryc.ot_custom_display_bone", "Deform Bones"),
+}
+BATCH_STEP_ITEMS = [(key, label, f"Run {label}") for key, (label, _, _) in BATCH_STEPS.items()]
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "BatchWorker.py")
+
+def get_operator(idname):
+    category, name = idname.split(".", 1)
+    return getattr(getattr(bpy.ops, category), name)
+
+def ensure_preferences():
+    pref = AddonFunctions.get_preferences()
+    if not pref.general.is_initialized:
+        pref.general.set_defaults()
+
+def select_step_bones(obj, selection):
+    if selection is None:
+        return
+    names = None
+    if isinstance(selection, (list, tuple)):
+        names = set(selection)
+    elif selection != "ALL":
+        coll = BoneClassifier.CollectionLookup(obj.data).collections.get(selection)
+        names = {bone.name for bone in coll.bones} if coll else set()
+
+    for pb in obj.pose.bones:
+        AddonUtils.Compat.bone_selection(pb, names is None or pb.name in names)
+
+def activate_armature(context, obj):
+    if context.object and context.object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+    for selected in context.selected_objects:
+        selected.select_set(False)
+    context.view_layer.objects.active = obj
+    obj.select_set(True)
+    bpy.ops.object.mode_set(mode='POSE')
+
+def run_pipeline(context, obj, steps):
+    result = {"object": obj.name, "ok": True, "steps": [], "time": 0.0}
+    start = time.perf_counter()
+
+    activate_armature(context, obj)
+
+    for step in steps:
+        label, idname, selection = BATCH_STEPS[step]
+        step_start = time.perf_counter()
+        try:
+            select_step_bones(obj, selection)
+            status = ", ".join(sorted(get_operator(idname)('EXEC_DEFAULT')))
+        except RuntimeError as e:
+            status = str(e).strip()
+        result["steps"].append({"step": step, "status": status, "time": time.perf_counter() - step_start})
+
+        #later steps build on the earlier ones, stop at the first failure
+        if status != "FINISHED":
+            result["ok"] = False
+            break
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    result["time"] = time.perf_counter() - start
+    return result
+
+def find_armatures(context, name_filter=""):
+    return [
+        obj for obj in context.view_layer.objects
+        if obj.type == 'ARMATURE' and (not name_filter or name_filter in obj.name)
+    ]
+
+def start_workers(filepaths, steps, processes, save=True, name_filter="", output_dir=""):
+    #splits the files over background Blender processes, poll_workers collects their results as files finish
+    processes = max(1, min(processes, len(filepaths)))
+    output_dir = output_dir or bpy.app.tempdir
+    workers = []
+
+    for index in range(processes):
+        chunk = filepaths[index::processes]
+        output = os.path.join(output_dir, f"wryc_batch_{os.getpid()}_{index}.jsonl")
+        cmd = [
+            bpy.app.binary_path, "-b", "--python", WORKER_SCRIPT, "--",
+            "--addon", __addon_name__,
+            "--module", __name__,
+            "--output", output,
+            "--steps", *steps,
+            "--files", *chunk,
+        ]
+        if save:
+            cmd.append("--save")
+        if name_filter:
+            cmd += ["--name-filter", name_filter]
+        #logs go to files so a chatty worker never blocks on a full pipe
+        log_path = f"{os.path.splitext(output)[0]}.log"
+        with open(log_path, "w", encoding="utf-8") as log:
+            proc = subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT)
+        workers.append({"files": chunk, "output": output, "log": log_path, "proc": proc, "offset": 0, "done": set()})
+
+    return workers
+
+def read_worker_lines(worker):
+    #the worker appends one json line per finished file, a line without its newline is still being written
+    results = []
+    try:
+        with open(worker["output"], "r", encoding="utf-8") as f:
+            f.seek(worker["offset"])
+            for line in iter(f.readline, ""):
+                if not line.endswith("\n"):
+                    break
+                worker["offset"] = f.tell()
+                file_results = json.loads(line)
+                worker["done"].add(file_results[0]["file"])
+                results.extend(file_results)
+    except (OSError, ValueError):
+        pass
+    return results
+
+def poll_workers(workers):
+    #never waits, returns the results of the files finished since the last call
+    results = []
+    for worker in workers:
+        if worker["proc"] is None:
+            continue
+        returncode = worker["proc"].poll()
+        results.extend(read_worker_lines(worker))
+        if returncode is None:
+            continue
+
+        missing = [filepath for filepath in worker["files"] if filepath not in worker["done"]]
+        if missing:
+            error = f"Worker failed with exit code {returncode}, see {worker['log']}"
+            results.extend({"file": filepath, "object": "", "ok": False, "steps": [], "time": 0.0, "error": error} for filepath in missing)
+        else:
+            for path in (worker["output"], worker["log"]):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        worker["proc"] = None
+
+    return results
+
+def workers_finished(workers):
+    return all(worker["proc"] is None for worker in workers)
+
+def stop_workers(workers):
+    for worker in workers:
+        if worker["proc"] is not None:
+            worker["proc"].terminate()
+
+def format_report(results):
+    lines = []
+    for result in results:
+        target = f"{os.path.basename(result['file'])}:{result['object']}" if result.get("file") else result["object"]
+        steps = " > ".join(f"{s['step']} {s['status']} {s['time']:.2f}s" for s in result["steps"])
+        lines.append(f"{'OK  ' if result['ok'] else 'FAIL'} {target} {result['time']:.2f}s {steps or result.get('error', '')}")
+    return "\n".join(lines)
@@ -0,0 +1,56 @@
+# Runs inside a background Blender started by BatchBuilder.start_workers:
+#   blender -b --python BatchWorker.py -- --addon <addon> --module <BatchBuilder module> --output <jsonl> --steps ... --files ...
+import argparse
+import importlib
+import json
+import sys
+
+import addon_utils
+import bpy
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--addon", required=True)
+    parser.add_argument("--module", required=True)
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--steps", nargs="+", required=True)
+    parser.add_argument("--files", nargs="+", required=True)
+    parser.add_argument("--name-filter", default="")
+    parser.add_argument("--save", action="store_true")
+    return parser.parse_args(argv)
+
+def write_results(output, file_results):
+    output.write(json.dumps(file_results) + "\n")
+    output.flush()
+
+def build_file(builder, args, filepath):
+    try:
+        bpy.ops.wm.open_mainfile(filepath=filepath)
+    except RuntimeError as e:
+        return [{"file": filepath, "object": "", "ok": False, "steps": [], "time": 0.0, "error": str(e).strip()}]
+
+    builder.ensure_preferences()
+    file_results = [builder.run_pipeline(bpy.context, obj, args.steps) for obj in builder.find_armatures(bpy.context, args.name_filter)]
+    if not file_results:
+        file_results = [{"object": "", "ok": False, "steps": [], "time": 0.0, "error": "No armature found"}]
+    for result in file_results:
+        result["file"] = filepath
+
+    if args.save and any(result["ok"] for result in file_results):
+        bpy.ops.wm.save_mainfile()
+    return file_results
+
+def main():
+    args = parse_args()
+    if args.addon not in sys.modules:
+        addon_utils.enable(args.addon, default_set=False)
+    builder = importlib.import_module(args.module)
+
+    #one line per file, written as soon as the file is done so the add-on can report progress
+    with open(args.output, "w", encoding="utf-8") as output:
+        for filepath in args.files:
+            write_results(output, build_file(builder, args, filepath))
+
+if __name__ == "__main__":
+    main()
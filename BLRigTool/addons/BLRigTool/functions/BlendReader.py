@@ -0,0 +1,221 @@
+import gzip
+import os
+import struct
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+#__BLEND READER__
+# Reads just enough of a .blend file to list its objects without bpy, so it can run outside the main thread.
+# Old header: BLENDER + pointer size (_ 4 bytes, - 8 bytes) + endian (v little, V big) + version (404)
+# New header: BLENDER + header size (17) + - + file format version (01) + endian + version (0500)
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+OBJECT_CODE = b"OB\x00\x00"
+DNA_CODE = b"DNA1"
+END_CODE = b"ENDB"
+
+# bytes kept from the start of every object block, enough to reach ID.name in every known layout
+ID_HEAD_SIZE = 1024
+
+_names_cache = {}
+
+class BlendReadError(Exception):
+    pass
+
+READ_ERRORS = (OSError, EOFError, ValueError, struct.error, BlendReadError)
+
+def open_blend(filepath):
+    f = open(filepath, "rb")
+    magic = f.read(4)
+    f.seek(0)
+    if magic[:2] == GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=f, mode="rb")
+    if magic == ZSTD_MAGIC:
+        if zstandard is None:
+            f.close()
+            raise BlendReadError(f"{filepath} is zstd compressed and the zstandard module is not available")
+        return zstandard.ZstdDecompressor().stream_reader(f, closefd=True)
+    return f
+
+def read_exact(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise BlendReadError("Unexpected end of file")
+    return data
+
+def skip(f, size):
+    if size <= 0:
+        return
+    if f.seekable():
+        f.seek(size, os.SEEK_CUR)
+        return
+    while size:
+        chunk = f.read(min(size, 1 << 20))
+        if not chunk:
+            raise BlendReadError("Unexpected end of file")
+        size -= len(chunk)
+
+def read_header(f):
+    data = read_exact(f, 12)
+    if data[:7] != b"BLENDER":
+        raise BlendReadError("Not a .blend file")
+
+    if data[7:9].isdigit():
+        header_size = int(data[7:9])
+        data += read_exact(f, header_size - 12)
+        pointer_size = 8 if data[9:10] == b"-" else 4
+        format_version = int(data[10:12])
+        endian = "<" if data[12:13] == b"v" else ">"
+        version = int(data[13:header_size])
+    else:
+        pointer_size = 8 if data[7:8] == b"-" else 4
+        format_version = 0
+        endian = "<" if data[8:9] == b"v" else ">"
+        version = int(data[9:12])
+
+    #file format 1 uses the large block header with 64 bit lengths
+    if format_version >= 1:
+        bhead = struct.Struct(f"{endian}4siQqq")
+        fields = ("code", "sdna", "old", "len", "nr")
+    elif pointer_size == 8:
+        bhead = struct.Struct(f"{endian}4siQii")
+        fields = ("code", "len", "old", "sdna", "nr")
+    else:
+        bhead = struct.Struct(f"{endian}4siIii")
+        fields = ("code", "len", "old", "sdna", "nr")
+
+    return {
+        "version": version,
+        "pointer_size": pointer_size,
+        "endian": endian,
+        "bhead": bhead,
+        "len_index": fields.index("len"),
+    }
+
+def iter_blocks(f, header):
+    bhead = header["bhead"]
+    len_index = header["len_index"]
+    while True:
+        values = bhead.unpack(read_exact(f, bhead.size))
+        code = values[0]
+        if code == END_CODE:
+            return
+        yield code, values[len_index]
+
+def parse_sdna(data, endian, pointer_size):
+    #returns {struct name: [(field name, offset, size)]}
+    def align(pos):
+        return (pos + 3) & ~3
+
+    def read_strings(pos, tag):
+        if data[pos:pos + 4] != tag:
+            raise BlendReadError(f"Invalid SDNA, expected {tag}")
+        count = struct.unpack_from(f"{endian}i", data, pos + 4)[0]
+        pos += 8
+        strings = []
+        for _ in range(count):
+            end = data.index(b"\x00", pos)
+            strings.append(data[pos:end].decode("latin-1"))
+            pos = end + 1
+        return strings, align(pos)
+
+    if data[:4] != b"SDNA":
+        raise BlendReadError("Invalid SDNA")
+    names, pos = read_strings(4, b"NAME")
+    types, pos = read_strings(pos, b"TYPE")
+
+    if data[pos:pos + 4] != b"TLEN":
+        raise BlendReadError("Invalid SDNA, expected TLEN")
+    lengths = struct.unpack_from(f"{endian}{len(types)}h", data, pos + 4)
+    pos = align(pos + 4 + 2 * len(types))
+
+    if data[pos:pos + 4] != b"STRC":
+        raise BlendReadError("Invalid SDNA, expected STRC")
+    count = struct.unpack_from(f"{endian}i", data, pos + 4)[0]
+    pos += 8
+
+    structs = {}
+    for _ in range(count):
+        type_index, field_count = struct.unpack_from(f"{endian}hh", data, pos)
+        pos += 4
+        fields = []
+        offset = 0
+        for _ in range(field_count):
+            field_type, field_name = struct.unpack_from(f"{endian}hh", data, pos)
+            pos += 4
+            name = names[field_name]
+            array = 1
+            for dim in name.split("[")[1:]:
+                array *= int(dim.split("]")[0])
+            if name.startswith("*") or name.startswith("(*"):
+                size = pointer_size * array
+            else:
+                size = lengths[field_type] * array
+            fields.append((name, offset, size))
+            offset += size
+        structs[types[type_index]] = fields
+    return structs
+
+def get_id_name_field(structs):
+    for name, offset, size in structs.get("ID", ()):
+        if name.startswith("name["):
+            return offset, size
+    raise BlendReadError("ID.name not found in SDNA")
+
+def read_object_names(filepath):
+    with open_blend(filepath) as f:
+        header = read_header(f)
+        heads = []
+        structs = None
+        for code, length in iter_blocks(f, header):
+            if code == OBJECT_CODE:
+                size = min(length, ID_HEAD_SIZE)
+                heads.append(read_exact(f, size))
+                skip(f, length - size)
+            elif code == DNA_CODE:
+                structs = parse_sdna(read_exact(f, length), header["endian"], header["pointer_size"])
+            else:
+                skip(f, length)
+
+    if structs is None:
+        raise BlendReadError("No SDNA block found")
+    offset, size = get_id_name_field(structs)
+
+    names = []
+    for head in heads:
+        raw = head[offset:offset + size].split(b"\x00", 1)[0]
+        #ID names carry their two letter type code, OBCircle_0
+        name = raw[2:].decode("utf-8", errors="replace")
+        if name:
+            names.append(name)
+    return names
+
+def get_file_key(filepath):
+    stat = os.stat(filepath)
+    return (stat.st_mtime_ns, stat.st_size)
+
+def list_object_names(filepath):
+    #cached per file stamp, safe to call from any thread
+    filepath = os.path.abspath(filepath)
+    key = get_file_key(filepath)
+    cached = _names_cache.get(filepath)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    names = read_object_names(filepath)
+    _names_cache[filepath] = (key, names)
+    return names
+
+def get_cached_object_names(filepath):
+    filepath = os.path.abspath(filepath)
+    cached = _names_cache.get(filepath)
+    if cached is None:
+        return None
+    try:
+        key = get_file_key(filepath)
+    except OSError:
+        return None
+    return cached[1] if cached[0] == key else None
@@ -0,0 +1,76 @@
+#__BONE CLASSIFIER__
+# rules: ((prefix, key), ...) in priority order, the first rule whose prefix matches wins like an if/elif chain.
+_TERMINAL = None
+
+_trie_cache = {}
+
+def compile_prefix_trie(rules):
+    rules = tuple((str(prefix), key) for prefix, key in rules)
+    trie = _trie_cache.get(rules)
+    if trie is not None:
+        return trie
+
+    trie = {}
+    for priority, (prefix, key) in enumerate(rules):
+        #an empty prefix sits on the root and matches every name, like startswith("")
+        node = trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(_TERMINAL, (priority, key))
+
+    _trie_cache[rules] = trie
+    return trie
+
+def match_prefix(trie, name):
+    best = trie.get(_TERMINAL)
+    node = trie
+    for char in name:
+        node = node.get(char)
+        if node is None:
+            break
+        hit = node.get(_TERMINAL)
+        if hit is not None and (best is None or hit[0] < best[0]):
+            best = hit
+    return best[1] if best else None
+
+def classify_bones(names, rules):
+    trie = compile_prefix_trie(rules)
+    groups = {}
+    for name in names:
+        key = match_prefix(trie, name)
+        if key is not None:
+            groups.setdefault(key, []).append(name)
+    return groups
+
+class CollectionLookup:
+    def __init__(self, arm):
+        self.arm = arm
+        self.collections = {}
+
+        stack = list(arm.collections)
+        while stack:
+            coll = stack.pop()
+            self.collections.setdefault(coll.name, coll)
+            stack.extend(coll.children)
+
+    def get(self, collection_name):
+        name = str(collection_name)
+        coll = self.collections.get(name)
+        if coll is None:
+            coll = self.arm.collections.new(name)
+            self.collections[coll.name] = coll
+        return coll
+
+def assign_bones_by_prefix(arm, rules, lookup=None):
+    #rules map prefixes to collection names
+    if lookup is None:
+        lookup = CollectionLookup(arm)
+
+    bones = arm.bones
+    groups = classify_bones(bones.keys(), rules)
+    for collection_name, names in groups.items():
+        coll = lookup.get(collection_name)
+        for name in names:
+            coll.assign(bones[name])
+
+    return groups
@@ -0,0 +1,113 @@
+import json
+
+from . import AddonFunctions
+
+#__BONE MAPPING STORE__
+# With compact storage the scene keeps the whole mapping as one json string and the mappings collection only
+# holds the rows of the page shown in the UI. Edits to those rows are written back to the string.
+MAPPING_PAGE_SIZE = 200
+
+_decoded = {}
+_materializing = {"value": False}
+
+def encode_pairs(pairs):
+    return json.dumps([[source, target] for source, target in pairs], ensure_ascii=False, separators=(",", ":"))
+
+def decode_pairs(blob):
+    if not blob:
+        return []
+    try:
+        return [(str(source), str(target)) for source, target in json.loads(blob)]
+    except (TypeError, ValueError):
+        print("Bone mapping storage is corrupted, mappings are reset")
+        return []
+
+def get_mapping_pairs(settings):
+    if not settings.use_compact_storage:
+        return [(m.source, m.target) for m in settings.mappings]
+
+    blob = settings.mapping_blob
+    cached = _decoded.get(settings.as_pointer())
+    if cached is None or cached[0] != blob:
+        cached = (blob, decode_pairs(blob))
+        _decoded[settings.as_pointer()] = cached
+    return cached[1]
+
+def get_mapping_dict(settings):
+    return dict(get_mapping_pairs(settings))
+
+def get_mapping_count(settings):
+    if not settings.use_compact_storage:
+        return len(settings.mappings)
+    return len(get_mapping_pairs(settings))
+
+def write_pairs(settings, pairs):
+    blob = encode_pairs(pairs)
+    settings.mapping_blob = blob
+    _decoded[settings.as_pointer()] = (blob, list(pairs))
+
+def fill_collection(mappings, pairs):
+    _materializing["value"] = True
+    try:
+        mappings.clear()
+        for source, target in pairs:
+            item = mappings.add()
+            item.source = source
+            item.target = target
+    finally:
+        _materializing["value"] = False
+    AddonFunctions.bump_mapping_generation()
+
+def get_page_start(settings, count):
+    return min(settings.page_start, max(0, count - 1))
+
+def materialize_page(settings):
+    pairs = get_mapping_pairs(settings)
+    start = get_page_start(settings, len(pairs))
+    fill_collection(settings.mappings, pairs[start:start + MAPPING_PAGE_SIZE])
+    if settings.active_index >= len(settings.mappings):
+        settings.active_index = len(settings.mappings) - 1
+
+def set_mapping_pairs(settings, pairs):
+    if settings.use_compact_storage:
+        write_pairs(settings, pairs)
+        materialize_page(settings)
+    else:
+        fill_collection(settings.mappings, pairs)
+
+def pack_mappings(settings):
+    write_pairs(settings, [(m.source, m.target) for m in settings.mappings])
+    settings.page_start = 0
+    materialize_page(settings)
+
+def unpack_mappings(settings):
+    pairs = decode_pairs(settings.mapping_blob)
+    settings.mapping_blob = ""
+    _decoded.pop(settings.as_pointer(), None)
+    fill_collection(settings.mappings, pairs)
+
+def write_back_item(settings, item):
+    #mappings[i] of the page is row page_start + i of the compact store
+    if _materializing["value"] or not settings.use_compact_storage:
+        return
+    path = item.path_from_id()
+    index = int(path[path.rindex("[") + 1:path.rindex("]")])
+    pairs = list(get_mapping_pairs(settings))
+    row = get_page_start(settings, len(pairs)) + index
+    if row < len(pairs):
+        pairs[row] = (item.source, item.target)
+        write_pairs(settings, pairs)
+
+def update_mapping_item(self, context):
+    AddonFunctions.bump_mapping_generation()
+    write_back_item(self.id_data.bone_mapping_settings, self)
+
+def update_mapping_storage(self, context):
+    if self.use_compact_storage:
+        pack_mappings(self)
+    else:
+        unpack_mappings(self)
+
+def update_mapping_page(self, context):
+    if self.use_compact_storage:
+        materialize_page(self)
@@ -0,0 +1,110 @@
+#__ARMATURE TOPOLOGY__
+# Built from one pass over arm.bones, so generators can query the hierarchy without dereferencing RNA parents/children.
+_topology_cache = {}
+
+class ArmatureTopology:
+    def __init__(self, arm):
+        bones = arm.bones
+        self.names = [bone.name for bone in bones]
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.parent = [-1] * len(self.names)
+        self.children = [[] for _ in self.names]
+        self.depth = [0] * len(self.names)
+        self.deform = [False] * len(self.names)
+        self.roots = []
+
+        #arm.bones is ordered depth first, so parents are always indexed before their children
+        for i, bone in enumerate(bones):
+            self.deform[i] = bone.use_deform
+            parent = bone.parent
+            if parent is None:
+                self.roots.append(i)
+                continue
+            p = self.index[parent.name]
+            self.parent[i] = p
+            self.children[p].append(i)
+            self.depth[i] = self.depth[p] + 1
+
+        self.chains = []
+        for leaf, children in enumerate(self.children):
+            if not children:
+                self.chains.append(self.path_to_root(leaf)[::-1])
+
+        self.key = topology_key(arm)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def path_to_root(self, i):
+        path = []
+        while i != -1:
+            path.append(i)
+            i = self.parent[i]
+        return path
+
+    def parent_name(self, name):
+        p = self.parent[self.index[name]]
+        return self.names[p] if p != -1 else ""
+
+    def children_names(self, name):
+        return [self.names[c] for c in self.children[self.index[name]]]
+
+    def ancestors(self, name, stop="", max_count=0):
+        #name, parent, grandparent... until stop (included), the root or max_count entries
+        result = []
+        i = self.index[name]
+        while i != -1:
+            result.append(self.names[i])
+            if self.names[i] == stop or len(result) == max_count:
+                break
+            i = self.parent[i]
+        return result
+
+    def chain_between(self, start, end):
+        #start -> end ordered from the root side, empty when end is not a descendant of start
+        chain = self.ancestors(end, stop=start)
+        if chain[-1] != start:
+            return []
+        return chain[::-1]
+
+    def descendants(self, name):
+        return list(self.iter_chain(name))
+
+    def iter_chain(self, name, stop=None, max_depth=-1, prefix="", deform_only=False, within=None):
+        #pre-order like a recursive walk over children, a bone rejected by any filter is skipped with its subtree
+        root = self.index[name]
+        max_depth = self.depth[root] + max_depth if max_depth >= 0 else -1
+        stack = [root]
+        while stack:
+            i = stack.pop()
+            name = self.names[i]
+            if stop and stop(name):
+                continue
+            if max_depth >= 0 and self.depth[i] > max_depth:
+                continue
+            if prefix and not name.startswith(prefix):
+                continue
+            if deform_only and not self.deform[i]:
+                continue
+            if within is not None and name not in within:
+                continue
+            yield name
+            stack.extend(reversed(self.children[i]))
+
+def topology_key(arm):
+    return (len(arm.bones), hash(tuple(arm.bones.keys())))
+
+def get_topology(obj, refresh=False):
+    arm = obj.data
+    key = arm.name_full
+    topology = _topology_cache.get(key)
+    if refresh or topology is None or topology.key != topology_key(arm):
+        topology = ArmatureTopology(arm)
+        _topology_cache[key] = topology
+    return topology
+
+def invalidate_topology(arm=None):
+    if arm is None:
+        _topology_cache.clear()
+    else:
+        _topology_cache.pop(arm.name_full, None)
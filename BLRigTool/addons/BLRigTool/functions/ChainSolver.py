@@ -0,0 +1,39 @@
+import numpy as np
+import mathutils
+
+#__CHAIN SAMPLER__
+def get_rest_joints(obj, topology, chain_names):
+    #armature space heads of every chain bone plus the tail of the last one
+    bones = obj.data.bones
+    count = len(topology.names)
+    heads = np.empty(count * 3, dtype=np.float32)
+    tails = np.empty(count * 3, dtype=np.float32)
+    bones.foreach_get("head_local", heads)
+    bones.foreach_get("tail_local", tails)
+
+    index = np.array([topology.index[name] for name in chain_names])
+    heads = heads.reshape(count, 3).astype(np.float64)
+    tails = tails.reshape(count, 3).astype(np.float64)
+    return np.vstack((heads[index], tails[index[-1]][None, :]))
+
+def sample_by_arc_length(joints, count):
+    #count points evenly spaced along the polyline, with the index of the segment each one lies on
+    segment = np.linalg.norm(np.diff(joints, axis=0), axis=1)
+    arc = np.concatenate(([0.0], np.cumsum(segment)))
+    samples = np.linspace(0.0, arc[-1], count)
+
+    points = np.column_stack([np.interp(samples, arc, joints[:, axis]) for axis in range(3)])
+    source = np.clip(np.searchsorted(arc, samples, side='right') - 1, 0, len(segment) - 1)
+    return points, source, float(arc[-1])
+
+def compute_chain_controls(obj, topology, chain_names, count):
+    #returns [(source_bone, offset_from_source_head, point)], chain length
+    joints = get_rest_joints(obj, topology, chain_names)
+    points, source, length = sample_by_arc_length(joints, count)
+    offsets = points - joints[source]
+
+    controls = [
+        (chain_names[i], mathutils.Vector(offset), mathutils.Vector(point))
+        for i, offset, point in zip(source.tolist(), offsets, points)
+    ]
+    return controls, length
@@ -0,0 +1,238 @@
+import re
+
+import mathutils
+import numpy as np
+
+from . import AddonFunctions, BoneTopology, PoleSolver
+from ..utils import RigProfiler
+
+#__MIRROR GENERATION__
+# Generators build the left side only, the right side is derived by reflecting the new bones across X.
+SIDE_RULES = {
+    'LOWER_UNDERSCORE': ("_l", "_r"),
+    'UPPER_UNDERSCORE': ("_L", "_R"),
+    'UPPER_DOT': (".L", ".R"),
+    'LOWER_DOT': (".l", ".r"),
+}
+SIDE_RULE_ITEMS = [(key, f"{left} / {right}", f"Left bones end with {left}, right bones with {right}") for key, (left, right) in SIDE_RULES.items()]
+
+REFLECT_X = np.diag([-1.0, 1.0, 1.0, 1.0])
+
+_number_suffix = re.compile(r"\.\d+$")
+
+_skip_constraint_props = {"rna_type", "name", "type", "is_valid", "active", "is_override_data_editable"}
+
+#X offsets and rotations about Y and Z flip direction on the reflected bone, these limits swap and change sign
+_mirrored_limits = {
+    'LIMIT_ROTATION': (("min_y", "max_y"), ("min_z", "max_z")),
+    'LIMIT_LOCATION': (("min_x", "max_x"),),
+}
+#flags that belong to a swapped limit swap with it
+_mirrored_limit_flags = {
+    'LIMIT_LOCATION': (("use_min_x", "use_max_x"),),
+}
+#matrices stored on the constraint, reflected like the bones
+_mirrored_matrices = {
+    'CHILD_OF': ("inverse_matrix",),
+}
+#constraint types whose values are the same on both sides once targets are renamed
+_mirrored_as_is = {
+    'COPY_LOCATION', 'COPY_ROTATION', 'COPY_SCALE', 'COPY_TRANSFORMS', 'LIMIT_SCALE', 'LIMIT_DISTANCE',
+    'IK', 'SPLINE_IK', 'TRACK_TO', 'DAMPED_TRACK', 'LOCKED_TRACK', 'STRETCH_TO', 'FLOOR', 'MAINTAIN_VOLUME',
+}
+
+def can_mirror_constraint(con):
+    return con.type in _mirrored_as_is or con.type in _mirrored_limits or con.type in _mirrored_matrices
+
+_copy_bone_props = ("use_connect", "use_deform", "inherit_scale", "use_inherit_rotation", "use_local_location", "hide", "show_wire")
+
+_copy_pose_bone_props = (
+    "custom_shape", "custom_shape_translation", "custom_shape_rotation_euler", "custom_shape_scale_xyz",
+    "use_custom_shape_bone_size", "rotation_mode",
+    "lock_ik_x", "lock_ik_y", "lock_ik_z", "lock_location", "lock_rotation", "lock_rotation_w", "lock_scale",
+)
+
+def mirror_name(name, side_rule):
+    #hand_l -> hand_r, hand.L.001 -> hand.R.001, None when the name is not on the left side
+    left, right = side_rule
+    match = _number_suffix.search(name)
+    number = match.group() if match else ""
+    base = name[:len(name) - len(number)]
+    if not base.endswith(left):
+        return None
+    return f"{base[:-len(left)]}{right}{number}"
+
+def take_snapshot(obj):
+    return {pb.name: {con.name for con in pb.constraints} for pb in obj.pose.bones}
+
+def find_asymmetric_bones(obj, names, side_rule, tolerance=1.0e-4):
+    #left bones whose right counterpart is missing or is not the X reflection of it
+    bones = obj.data.bones
+    pairs = [(name, mirror_name(name, side_rule)) for name in names]
+    pairs = [(left, right) for left, right in pairs if right]
+
+    missing = [left for left, right in pairs if right not in bones]
+    pairs = [(left, right) for left, right in pairs if right in bones]
+    if not pairs:
+        return missing
+
+    left_matrix = np.array([bones[left].matrix_local for left, _ in pairs], dtype=np.float64)
+    right_matrix = np.array([bones[right].matrix_local for _, right in pairs], dtype=np.float64)
+    error = np.abs(REFLECT_X @ left_matrix @ REFLECT_X - right_matrix).max(axis=(1, 2))
+
+    return missing + [left for (left, _), e in zip(pairs, error) if e > tolerance]
+
+def clone_constraint(con, owner, side_rule):
+    new_con = next((c for c in owner.constraints if c.name == con.name and c.type == con.type), None)
+    if new_con is None:
+        new_con = owner.constraints.new(type=con.type)
+        new_con.name = con.name
+
+    for prop in con.bl_rna.properties:
+        identifier = prop.identifier
+        if prop.is_readonly or prop.type == 'COLLECTION' or identifier in _skip_constraint_props:
+            continue
+        value = getattr(con, identifier)
+        if identifier in {"subtarget", "pole_subtarget", "space_subtarget"} and value:
+            value = mirror_name(value, side_rule) or value
+        setattr(new_con, identifier, value)
+
+    for min_prop, max_prop in _mirrored_limits.get(con.type, ()):
+        setattr(new_con, min_prop, -getattr(con, max_prop))
+        setattr(new_con, max_prop, -getattr(con, min_prop))
+    for min_flag, max_flag in _mirrored_limit_flags.get(con.type, ()):
+        setattr(new_con, min_flag, getattr(con, max_flag))
+        setattr(new_con, max_flag, getattr(con, min_flag))
+    for identifier in _mirrored_matrices.get(con.type, ()):
+        matrix = np.array(getattr(con, identifier), dtype=np.float64)
+        setattr(new_con, identifier, mathutils.Matrix((REFLECT_X @ matrix @ REFLECT_X).tolist()))
+
+    return new_con
+
+def update_pole_angles(obj, constraints):
+    #the reflected IK chain needs its own pole angle, solved for every mirrored IK in one batch
+    bones = obj.data.bones
+    topology = BoneTopology.get_topology(obj)
+
+    rows = []
+    for owner_name, con in constraints:
+        chain = topology.ancestors(owner_name, max_count=con.chain_count) if con.chain_count else [owner_name]
+        owner = bones[owner_name]
+        upper = bones[chain[-1]]
+        rows.append((
+            con,
+            bones[con.pole_subtarget].head_local,
+            upper.head_local,
+            upper.tail_local,
+            owner.tail_local if con.use_tail else owner.head_local,
+            upper.matrix_local,
+        ))
+    if not rows:
+        return
+
+    angles = PoleSolver.solve_pole_angles(
+        [row[1] for row in rows],
+        [row[2] for row in rows],
+        [row[3] for row in rows],
+        [row[4] for row in rows],
+        [row[5] for row in rows],
+    )
+    for row, angle in zip(rows, angles):
+        row[0].pole_angle = float(angle)
+
+def mirror_generated(obj, snapshot, side_rule):
+    #reflect every bone created since the snapshot and every constraint added to a left bone since the snapshot
+    #returns the created bone count, the cloned constraint count and the constraints that could not be reflected
+    arm = obj.data
+    pose_bones = obj.pose.bones
+
+    created = []
+    for name in arm.bones.keys():
+        if name in snapshot:
+            continue
+        right = mirror_name(name, side_rule)
+        if right and right not in arm.bones:
+            created.append((name, right))
+
+    if created:
+        with RigProfiler.profile_phase("Mirror Bones", "edit_bone"):
+            AddonFunctions.set_mode('EDIT')
+            edit_bones = arm.edit_bones
+            count = len(edit_bones)
+            index = {name: i for i, name in enumerate(edit_bones.keys())}
+            rows = [index[left] for left, _ in created]
+
+            heads = np.empty(count * 3, dtype=np.float32)
+            tails = np.empty(count * 3, dtype=np.float32)
+            rolls = np.empty(count, dtype=np.float32)
+            edit_bones.foreach_get("head", heads)
+            edit_bones.foreach_get("tail", tails)
+            edit_bones.foreach_get("roll", rolls)
+
+            reflect = np.array([-1.0, 1.0, 1.0], dtype=np.float32)
+            heads = heads.reshape(count, 3)[rows] * reflect
+            tails = tails.reshape(count, 3)[rows] * reflect
+            rolls = -rolls[rows]
+
+            for (left, right), head, tail, roll in zip(created, heads.tolist(), tails.tolist(), rolls.tolist()):
+                new_bone = edit_bones.new(right)
+                new_bone.head = head
+                new_bone.tail = tail
+                new_bone.roll = roll
+
+            for left, right in created:
+                eb_left = edit_bones[left]
+                eb_right = edit_bones[right]
+                if eb_left.parent:
+                    parent_name = eb_left.parent.name
+                    eb_right.parent = edit_bones.get(mirror_name(parent_name, side_rule) or parent_name) or eb_left.parent
+                for prop in _copy_bone_props:
+                    setattr(eb_right, prop, getattr(eb_left, prop))
+
+            AddonFunctions.set_mode('POSE')
+
+        for left, right in created:
+            pb_left = pose_bones[left]
+            pb_right = pose_bones[right]
+            for prop in _copy_pose_bone_props:
+                setattr(pb_right, prop, getattr(pb_left, prop))
+            #the left shape may carry a left-only flip, the right bone of a two-sided build has none
+            flipped = AddonFunctions.LEFT_FLIPPED_SHAPE_AXES.get(left, ())
+            if flipped:
+                rotation = list(pb_left.custom_shape_rotation_euler)
+                for axis in flipped:
+                    rotation[axis] = -rotation[axis]
+                pb_right.custom_shape_rotation_euler = rotation
+            if pb_left.custom_shape_transform:
+                transform_name = pb_left.custom_shape_transform.name
+                pb_right.custom_shape_transform = pose_bones.get(mirror_name(transform_name, side_rule) or transform_name)
+            pb_right.color.palette = pb_left.color.palette
+            arm.bones[right].color.palette = arm.bones[left].color.palette
+            for coll in arm.bones[left].collections:
+                coll.assign(arm.bones[right])
+
+    ik_constraints = []
+    cloned = 0
+    skipped = []
+    with RigProfiler.profile_phase("Mirror Constraints", "constraint_write"):
+        for pb_left in pose_bones:
+            right = mirror_name(pb_left.name, side_rule)
+            pb_right = pose_bones.get(right) if right else None
+            if pb_right is None:
+                continue
+            before = snapshot.get(pb_left.name, set())
+            for con in pb_left.constraints:
+                if con.name in before:
+                    continue
+                #a copied value the reflection does not know about would be wrong on the right side
+                if not can_mirror_constraint(con):
+                    skipped.append(f"{pb_left.name}: {con.name}")
+                    continue
+                new_con = clone_constraint(con, pb_right, side_rule)
+                cloned += 1
+                if new_con.type == 'IK' and new_con.pole_target and new_con.pole_subtarget:
+                    ik_constraints.append((right, new_con))
+
+        update_pole_angles(obj, ik_constraints)
+
+    return len(created), cloned, skipped
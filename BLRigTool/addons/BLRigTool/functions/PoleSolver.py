@@ -0,0 +1,93 @@
+import numpy as np
+import mathutils
+
+#__BATCH POLE SOLVER__
+# Pole target positions and pole angles for N limbs at once, benchmarks/bench_helpers.py keeps the per-limb reference.
+STRAIGHT_LIMB_EPSILON = 1.0e-6
+
+_limb_pole_cache = {}
+
+def _normalize(vectors):
+    length = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, length, out=np.zeros_like(vectors), where=length > STRAIGHT_LIMB_EPSILON)
+
+def _transform_points(matrices, points):
+    return np.einsum('nij,nj->ni', matrices[:, :3, :3], points) + matrices[:, :3, 3]
+
+def solve_pole_positions(upper, lower, end, fallback, distance=0.3):
+    upper = np.asarray(upper, dtype=np.float64)
+    lower = np.asarray(lower, dtype=np.float64)
+    end = np.asarray(end, dtype=np.float64)
+
+    v_upper = lower - upper
+    v_line = end - upper
+
+    #projection of the middle joint on the upper-end line
+    line_sq = np.einsum('ij,ij->i', v_line, v_line)
+    proj = np.divide(np.einsum('ij,ij->i', v_line, v_upper), line_sq, out=np.zeros_like(line_sq), where=line_sq > 0.0)
+    pole_vec = lower - (upper + proj[:, None] * v_line)
+
+    #straight limbs have no bend direction, use the fallback axis instead
+    straight = np.linalg.norm(pole_vec, axis=1) <= STRAIGHT_LIMB_EPSILON
+    pole_dir = np.where(straight[:, None], _normalize(np.asarray(fallback, dtype=np.float64)), _normalize(pole_vec))
+
+    return lower + pole_dir * distance
+
+def solve_pole_angles(pole, upper_head, upper_tail, end_head, upper_matrix):
+    upper_matrix_inv = np.linalg.inv(np.asarray(upper_matrix, dtype=np.float64))
+
+    pole_local = _transform_points(upper_matrix_inv, np.asarray(pole, dtype=np.float64))
+    head_local = _transform_points(upper_matrix_inv, np.asarray(upper_head, dtype=np.float64))
+    tail_local = _transform_points(upper_matrix_inv, np.asarray(upper_tail, dtype=np.float64))
+    end_local = _transform_points(upper_matrix_inv, np.asarray(end_head, dtype=np.float64))
+
+    bone_vec = tail_local - head_local
+    pole_normal = np.cross(end_local - head_local, pole_local - head_local)
+    projected_pole_axis = np.cross(pole_normal, bone_vec)
+
+    x_axis = np.broadcast_to(np.array([1.0, 0.0, 0.0]), projected_pole_axis.shape)
+    x_cross = np.cross(x_axis, projected_pole_axis)
+    angle = np.arctan2(np.linalg.norm(x_cross, axis=1), projected_pole_axis[:, 0])
+
+    return np.where(np.einsum('ij,ij->i', x_cross, _normalize(bone_vec)) > 0.0, -angle, angle)
+
+def compute_limb_poles(obj, limbs, distance=0.3):
+    #limbs: [(upper_name, lower_name, end_name), ...]
+    if not limbs:
+        return []
+
+    pose_bones = obj.pose.bones
+    world = np.array(obj.matrix_world, dtype=np.float64)
+    world_inv = np.linalg.inv(world)
+
+    upper_pbs = [pose_bones[upper] for upper, _, _ in limbs]
+    lower_pbs = [pose_bones[lower] for _, lower, _ in limbs]
+    end_pbs = [pose_bones[end] for _, _, end in limbs]
+
+    upper_head = np.array([pb.head for pb in upper_pbs], dtype=np.float64)
+    upper_tail = np.array([pb.tail for pb in upper_pbs], dtype=np.float64)
+    lower_head = np.array([pb.head for pb in lower_pbs], dtype=np.float64)
+    end_head = np.array([pb.head for pb in end_pbs], dtype=np.float64)
+    fallback = np.array([pb.x_axis for pb in lower_pbs], dtype=np.float64) @ world[:3, :3].T
+    upper_matrix = np.array([pb.bone.matrix_local for pb in upper_pbs], dtype=np.float64)
+
+    to_world = lambda points: points @ world[:3, :3].T + world[:3, 3]
+    pole_world = solve_pole_positions(to_world(upper_head), to_world(lower_head), to_world(end_head), fallback, distance)
+    pole_pose = pole_world @ world_inv[:3, :3].T + world_inv[:3, 3]
+    angles = solve_pole_angles(pole_pose, upper_head, upper_tail, end_head, upper_matrix)
+
+    return [(mathutils.Vector(pos), float(angle)) for pos, angle in zip(pole_world, angles)]
+
+def cache_limb_poles(obj, limbs, distance=0.3):
+    for limb, result in zip(limbs, compute_limb_poles(obj, limbs, distance)):
+        _limb_pole_cache[(obj.name, *limb, distance)] = result
+
+def clear_limb_pole_cache():
+    _limb_pole_cache.clear()
+
+def get_limb_pole(obj, upper_name, lower_name, end_name, distance=0.3):
+    key = (obj.name, upper_name, lower_name, end_name, distance)
+    result = _limb_pole_cache.get(key)
+    if result is None:
+        result = compute_limb_poles(obj, [(upper_name, lower_name, end_name)], distance)[0]
+    return result
@@ -0,0 +1,170 @@
+import itertools
+import re
+
+#__RENAME ENGINE__
+# New names are computed for a whole collection first, then applied in an order where no rename hits a name
+# that is still taken, so Blender never appends .001 to resolve a clash.
+CASE_RULES = {
+    'LOWER': str.lower,
+    'UPPER': str.upper,
+    'TITLE': str.title,
+    'SWAP': str.swapcase,
+}
+
+class RenamePlan:
+    #compiled once per run and shared by every object, meshes bound to one armature mostly share names
+    def __init__(self, rule):
+        self.rule = rule
+        self.names = {}
+
+    def __call__(self, name):
+        new_name = self.names.get(name)
+        if new_name is None:
+            new_name = self.rule(name)
+            self.names[name] = new_name
+        return new_name
+
+def compile_rename(props, mappings=()):
+    rule = compile_rule(props, mappings)
+    return RenamePlan(rule) if rule else None
+
+def compile_rule(props, mappings=()):
+    mode = props.rename_mode
+    find_str = props.find_str
+    replace_str = props.replace_str
+    prefix_str = props.prefix_str
+    suffix_str = props.suffix_str
+
+    if mode == 'FIND_REPLACE':
+        if not find_str:
+            return lambda name: name
+        return lambda name: name.replace(find_str, replace_str)
+
+    if mode == 'SET_PREFIX_SUFFIX':
+        return lambda name: f"{prefix_str}{name}{suffix_str}"
+
+    if mode == 'REMOVE_PREFIX_SUFFIX':
+        def remove_prefix_suffix(name):
+            if prefix_str and name.startswith(prefix_str):
+                name = name[len(prefix_str):]
+            if suffix_str and name.endswith(suffix_str):
+                name = name[:-len(suffix_str)]
+            return name
+        return remove_prefix_suffix
+
+    if mode == 'REGEX':
+        if not find_str:
+            return lambda name: name
+        try:
+            pattern = re.compile(find_str)
+        except re.error as e:
+            raise ValueError(f"Invalid regular expression: {e}")
+        #the replacement is parsed on the first sub, a bad group reference must fail here and not halfway through the bones
+        try:
+            pattern.sub(replace_str, "")
+        except (re.error, IndexError) as e:
+            raise ValueError(f"Invalid replacement: {e}")
+        return lambda name: pattern.sub(replace_str, name)
+
+    if mode == 'BONE_MAPPING':
+        pairs = [(source, target) for source, target in mappings if source and target]
+        if props.mapping_direction == 'TARGET_TO_SOURCE':
+            pairs = [(target, source) for source, target in pairs]
+        lookup = dict(pairs)
+        return lambda name: lookup.get(name, name)
+
+    if mode == 'CASE':
+        return CASE_RULES.get(props.case_rule)
+
+    return None
+
+def get_rename_items(obj, target):
+    if target == 'VERTEX_GROUP':
+        return obj.vertex_groups
+    if target == 'SHAPE_KEY':
+        shape_keys = obj.data.shape_keys
+        return shape_keys.key_blocks if shape_keys else None
+    return None
+
+def plan_renames(names, rename):
+    #returns {old: new}, [(old, new)] skipped because the new name is taken or claimed twice
+    renames = {}
+    for name in names:
+        new_name = rename(name)
+        if new_name and new_name != name:
+            renames[name] = new_name
+
+    conflicts = []
+    while True:
+        kept = {name for name in names if name not in renames}
+        claimed = {}
+        for old, new in renames.items():
+            claimed.setdefault(new, []).append(old)
+
+        rejected = [
+            old for new, olds in claimed.items()
+            for old in olds if len(olds) > 1 or new in kept
+        ]
+        if not rejected:
+            break
+        #a rejected rename keeps its old name, which can block another rename on the next pass
+        for old in rejected:
+            conflicts.append((old, renames.pop(old)))
+
+    return renames, conflicts
+
+def apply_renames(items, renames):
+    #renames whose new name is freed by another rename wait for it, cycles (a <-> b) go through a temporary name
+    lookup = {item.name: item for item in items}
+    occupied = set(lookup)
+    waiting = {new: old for old, new in renames.items() if new in occupied}
+    ready = [old for old, new in renames.items() if new not in occupied]
+    pending = dict(renames)
+    temp_numbers = itertools.count(1)
+
+    def rename(item_name, new_name):
+        item = lookup.pop(item_name)
+        item.name = new_name
+        #long names come back shortened by the name length limit, later steps look the item up by what it got
+        new_name = item.name
+        lookup[new_name] = item
+        occupied.discard(item_name)
+        occupied.add(new_name)
+
+        freed = waiting.pop(item_name, None)
+        if freed is not None:
+            ready.append(freed)
+        return new_name
+
+    def get_temp_name():
+        #short and independent of the old name, so the length limit never makes two of them equal
+        while True:
+            temp_name = f"~rename{next(temp_numbers)}"
+            if temp_name not in occupied:
+                return temp_name
+
+    while pending:
+        while ready:
+            old = ready.pop()
+            rename(old, pending.pop(old))
+
+        if not pending:
+            break
+
+        old = next(iter(pending))
+        temp_name = rename(old, get_temp_name())
+        pending[temp_name] = pending.pop(old)
+        waiting[pending[temp_name]] = temp_name
+
+    return len(renames)
+
+def preview_renames(objects, target, plan):
+    #[(object name, names that would change, names skipped by a conflict)] without renaming anything
+    rows = []
+    for obj in objects:
+        items = get_rename_items(obj, target)
+        if items is None:
+            continue
+        renames, conflicts = plan_renames(items.keys(), plan)
+        rows.append((obj.name, len(renames), len(conflicts)))
+    return rows
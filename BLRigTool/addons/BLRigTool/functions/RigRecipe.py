@@ -0,0 +1,227 @@
+import hashlib
+import json
+import time
+
+import bpy
+
+from . import AddonFunctions, BatchBuilder, MirrorRig
+
+#__RIG RECIPE__
+# {
+#   "version": 1,
+#   "steps": [
+#     {"id": "spine", "operator": "wryc.ot_create_spine_controller", "params": {"head": "head", ...}, "select": null},
+#     ...
+#   ]
+# }
+# select: null keeps the current bone selection, "ALL", a bone collection name or a list of bone names.
+RECIPE_VERSION = 1
+RECIPE_CACHE_KEY = "wryc_recipe_cache"
+# hidden operator property holding the bone names selected when the operator ran, recorded as the step selection
+SELECTION_PROPERTY = "recorded_selection"
+
+# generator operators a recipe can record, with the bones they need selected
+RECIPE_OPERATORS = {
+    "wryc.ot_create_deform_bones": None,
+    "wryc.ot_create_manny_deform_bones": None,
+    "wryc.ot_create_spine_controller": None,
+    "wryc.ot_create_head_controller": None,
+    "wryc.ot_create_arm_controller": None,
+    "wryc.ot_create_leg_controller": None,
+    "wryc.ot_create_limb_controllers": None,
+    "wryc.ot_create_finger_controller": None,
+    "wryc.ot_create_chain_controller": None,
+    "wryc.ot_create_manny_controller": None,
+}
+RECIPE_OPERATORS.update({idname: selection for _, idname, selection in BatchBuilder.BATCH_STEPS.values()})
+
+# steps that read scene settings instead of operator properties
+RECIPE_SCENE_INPUTS = {
+    "wryc.ot_custom_display_bone": "bone_display_settings",
+}
+
+def normalize_idname(idname):
+    #WRYC_OT_ot_create_spine_controller -> wryc.ot_create_spine_controller
+    if "_OT_" in idname:
+        category, name = idname.split("_OT_", 1)
+        return f"{category.lower()}.{name}"
+    return idname
+
+def rna_values(data):
+    values = {}
+    for prop in data.bl_rna.properties:
+        identifier = prop.identifier
+        if identifier == "rna_type" or prop.type in {'POINTER', 'COLLECTION'}:
+            continue
+        value = getattr(data, identifier)
+        if isinstance(value, set):
+            value = sorted(value)
+        elif getattr(prop, "is_array", False):
+            value = [v for v in value]
+        values[identifier] = value
+    return values
+
+def store_selection(op, bones):
+    setattr(op, SELECTION_PROPERTY, json.dumps([pb.name for pb in bones]))
+
+def record_recipe(operators):
+    #builds a recipe from the operator history of the window manager
+    steps = []
+    ids = set()
+    for op in operators:
+        idname = normalize_idname(op.bl_idname)
+        if idname not in RECIPE_OPERATORS:
+            continue
+
+        base = idname.split(".", 1)[1].replace("ot_create_", "").replace("ot_", "")
+        step_id = base
+        count = 1
+        while step_id in ids:
+            count += 1
+            step_id = f"{base}_{count}"
+        ids.add(step_id)
+
+        params = rna_values(op.properties)
+        selection = params.pop(SELECTION_PROPERTY, "")
+        steps.append({
+            "id": step_id,
+            "operator": idname,
+            "params": params,
+            "select": json.loads(selection) if selection else RECIPE_OPERATORS[idname],
+        })
+    return {"version": RECIPE_VERSION, "steps": steps}
+
+def load_recipe(filepath):
+    with open(filepath, "r", encoding="utf-8") as f:
+        recipe = json.load(f)
+
+    if not isinstance(recipe, dict) or not isinstance(recipe.get("steps"), list):
+        raise ValueError("Recipe has no step list")
+    if recipe.get("version", RECIPE_VERSION) > RECIPE_VERSION:
+        raise ValueError(f"Recipe version {recipe['version']} is newer than supported version {RECIPE_VERSION}")
+
+    ids = set()
+    for index, step in enumerate(recipe["steps"]):
+        if not isinstance(step, dict) or not step.get("operator"):
+            raise ValueError(f"Step {index} has no operator")
+        step.setdefault("id", f"step_{index:02d}")
+        step.setdefault("params", {})
+        step.setdefault("select", None)
+        if step["id"] in ids:
+            raise ValueError(f"Duplicate step id {step['id']}")
+        ids.add(step["id"])
+    return recipe
+
+def save_recipe(filepath, recipe):
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(recipe, f, indent=4, ensure_ascii=False)
+
+def read_cache(arm):
+    try:
+        return json.loads(arm.get(RECIPE_CACHE_KEY, "{}"))
+    except ValueError:
+        return {}
+
+def write_cache(arm, cache):
+    arm[RECIPE_CACHE_KEY] = json.dumps(cache, sort_keys=True)
+
+def source_rest_hash(arm, generated):
+    #rest data of the bones no recipe step created, generated bones would change it on every run
+    hashes = [
+        AddonFunctions.get_bone_rest_hash(bone)
+        for bone in arm.bones if bone.name not in generated
+    ]
+    return hashlib.md5("".join(sorted(hashes)).encode("utf-8")).hexdigest()
+
+def step_hash(context, step, source_hash):
+    inputs = {
+        "source": source_hash,
+        "operator": normalize_idname(step["operator"]),
+        "params": step["params"],
+        "select": step["select"],
+    }
+    scene_settings = RECIPE_SCENE_INPUTS.get(inputs["operator"])
+    if scene_settings:
+        inputs["scene"] = rna_values(getattr(context.scene, scene_settings))
+    data = json.dumps(inputs, sort_keys=True, default=str)
+    return hashlib.md5(data.encode("utf-8")).hexdigest()
+
+def outputs_exist(obj, entry):
+    bones = obj.pose.bones
+    for name in entry.get("bones", []):
+        if name not in bones:
+            return False
+    for bone_name, con_name in entry.get("constraints", []):
+        pb = bones.get(bone_name)
+        if pb is None or con_name not in pb.constraints:
+            return False
+    return True
+
+def call_operator(idname, params):
+    op = BatchBuilder.get_operator(idname)
+    rna_props = op.get_rna_type().properties
+    kwargs = {}
+    for key, value in params.items():
+        prop = rna_props.get(key)
+        if prop is None:
+            continue
+        if prop.type == 'ENUM' and prop.is_enum_flag:
+            value = set(value)
+        kwargs[key] = value
+    return op('EXEC_DEFAULT', **kwargs)
+
+def run_recipe(context, obj, recipe, force=False):
+    #runs the steps in order, a step whose inputs hash and outputs are unchanged since the last run is skipped
+    arm = obj.data
+    cache = read_cache(arm)
+    generated = {name for entry in cache.values() for name in entry.get("bones", [])}
+    source_hash = source_rest_hash(arm, generated)
+
+    BatchBuilder.activate_armature(context, obj)
+
+    results = []
+    for step in recipe["steps"]:
+        step_id = step["id"]
+        idname = normalize_idname(step["operator"])
+        inputs_hash = step_hash(context, step, source_hash)
+        entry = cache.get(step_id, {})
+        start = time.perf_counter()
+
+        if not force and entry.get("hash") == inputs_hash and outputs_exist(obj, entry):
+            results.append({"id": step_id, "status": "SKIPPED", "time": 0.0})
+            continue
+
+        before_bones = set(arm.bones.keys())
+        before_constraints = MirrorRig.take_snapshot(obj)
+        try:
+            BatchBuilder.select_step_bones(obj, step["select"])
+            status = ", ".join(sorted(call_operator(idname, step["params"])))
+        except (AttributeError, RuntimeError, TypeError) as e:
+            status = str(e).strip()
+        results.append({"id": step_id, "status": status, "time": time.perf_counter() - start})
+
+        if status != "FINISHED":
+            cache.pop(step_id, None)
+            break
+
+        #outputs of an earlier run are kept, a re-run of an idempotent generator reuses them
+        bones = {name for name in entry.get("bones", []) if name in arm.bones}
+        bones.update(name for name in arm.bones.keys() if name not in before_bones)
+        constraints = {tuple(item) for item in entry.get("constraints", [])}
+        constraints.update(
+            (pb.name, con.name)
+            for pb in obj.pose.bones for con in pb.constraints
+            if con.name not in before_constraints.get(pb.name, ())
+        )
+        cache[step_id] = {
+            "hash": inputs_hash,
+            "bones": sorted(bones),
+            "constraints": sorted(constraints),
+        }
+
+    step_ids = {step["id"] for step in recipe["steps"]}
+    write_cache(arm, {step_id: entry for step_id, entry in cache.items() if step_id in step_ids})
+
+    if context.object and context.object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+    return results
@@ -0,0 +1,283 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+import bpy
+import numpy as np
+
+from . import BlendReader
+
+#__SHAPE LIBRARY INDEX__
+# A json sidecar per shape library records what the add-on needs to know about it, so the .blend is only
+# opened again when its mtime or size changes. Sidecars live in a local cache folder, the library folder may be
+# read-only or shared.
+# {
+#   "version": 1,
+#   "library": {"mtime_ns": ..., "size": ...},
+#   "names": ["Arrow_0 (Single)", ...],                     library order, enum item numbers follow it
+#   "objects": {"Circle_0": {"type": "CURVE", "bbox": [[x, y, z], [x, y, z]], "dimensions": [x, y, z]}, ...},
+#   "icons": {"Circle_0": {"mtime_ns": ..., "size": ...}, ...}
+# }
+INDEX_VERSION = 1
+
+_indexes = {}
+_merged = {"key": None, "index": None}
+_index_folder = {"value": os.path.join(tempfile.gettempdir(), "BLRigTool_assets", "index")}
+
+def set_index_folder(folder):
+    _index_folder["value"] = folder
+
+def get_index_path(blend_path):
+    #libraries with the same file name in different folders get their own sidecar
+    stem = os.path.splitext(os.path.basename(blend_path))[0]
+    digest = hashlib.md5(os.path.abspath(blend_path).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(_index_folder["value"], f"{stem}_{digest}.index.json")
+
+def get_file_stamp(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+def read_index(blend_path, stamp):
+    try:
+        with open(get_index_path(blend_path), "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION or index.get("library") != stamp:
+        return None
+    return index
+
+def write_index(blend_path, index):
+    #the in-memory index still works when the sidecar cannot be written
+    index_path = get_index_path(blend_path)
+    temp_path = f"{index_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=1, ensure_ascii=False)
+        os.replace(temp_path, index_path)
+    except OSError as e:
+        print(f"Failed to write shape library index {index_path}: {e}")
+
+def get_data_points(obj):
+    data = obj.data
+    if obj.type == 'MESH':
+        co = np.empty(len(data.vertices) * 3, dtype=np.float32)
+        data.vertices.foreach_get("co", co)
+        return co.reshape(-1, 3)
+    if obj.type == 'CURVE':
+        points = []
+        for spline in data.splines:
+            if spline.type == 'BEZIER':
+                co = np.empty(len(spline.bezier_points) * 3, dtype=np.float32)
+                spline.bezier_points.foreach_get("co", co)
+                points.append(co.reshape(-1, 3))
+            else:
+                co = np.empty(len(spline.points) * 4, dtype=np.float32)
+                spline.points.foreach_get("co", co)
+                points.append(co.reshape(-1, 4)[:, :3])
+        return np.concatenate(points) if points else np.empty((0, 3), dtype=np.float32)
+    return None
+
+def describe_object(obj):
+    #bounds come from the object data, linked objects that are not in a scene have no evaluated bound_box
+    info = {"type": obj.type, "bbox": None, "dimensions": list(obj.dimensions)}
+    points = get_data_points(obj)
+    if points is not None and len(points):
+        low = points.min(axis=0)
+        high = points.max(axis=0)
+        info["bbox"] = [low.tolist(), high.tolist()]
+        info["dimensions"] = ((high - low) * np.abs(np.array(obj.scale))).tolist()
+    return info
+
+def scan_icons(names, icon_folder):
+    icons = {}
+    for name in names:
+        stamp = get_file_stamp(os.path.join(icon_folder, f"{name}.png"))
+        if stamp:
+            icons[name] = stamp
+    return icons
+
+def get_library(blend_path):
+    for lib in bpy.data.libraries:
+        if os.path.abspath(bpy.path.abspath(lib.filepath)) == blend_path:
+            return lib
+    return None
+
+def build_index(blend_path, stamp, icon_folder):
+    if blend_path == os.path.abspath(bpy.data.filepath):
+        objects = list(bpy.data.objects)
+        names = [obj.name for obj in objects]
+        infos = {obj.name: describe_object(obj) for obj in objects}
+    else:
+        #linking is enough to read the data, everything linked here is removed again
+        library = get_library(blend_path)
+        linked = {obj.as_pointer() for obj in bpy.data.objects if obj.library == library} if library else set()
+        with bpy.data.libraries.load(blend_path, link=True) as (data_from, data_to):
+            names = [name for name in data_from.objects if name]
+            data_to.objects = list(names)
+        infos = {obj.name: describe_object(obj) for obj in data_to.objects if obj}
+
+        if library is None:
+            library = get_library(blend_path)
+            if library is not None:
+                bpy.data.libraries.remove(library)
+        else:
+            #the file already used the library, only the objects linked for the index go
+            added = [obj for obj in data_to.objects if obj and obj.as_pointer() not in linked]
+            datas = {obj.data for obj in added if obj.data is not None}
+            bpy.data.batch_remove(added)
+            bpy.data.batch_remove([data for data in datas if data.users == 0])
+
+    return {
+        "version": INDEX_VERSION,
+        "library": stamp,
+        "names": names,
+        "objects": infos,
+        "icons": scan_icons(names, icon_folder),
+    }
+
+def get_library_index(blend_path, icon_folder, build=True):
+    #memory, then the sidecar, then the .blend itself when build is allowed
+    blend_path = os.path.abspath(blend_path)
+    stamp = get_file_stamp(blend_path)
+    if stamp is None:
+        return None
+
+    index = _indexes.get(blend_path)
+    if index is not None and index["library"] == stamp:
+        return index
+
+    index = read_index(blend_path, stamp)
+    if index is None:
+        if not build:
+            return None
+        index = build_index(blend_path, stamp, icon_folder)
+        write_index(blend_path, index)
+
+    _indexes[blend_path] = index
+    return index
+
+def list_library_names(blend_path):
+    #nothing is assigned to data_to, the file is only listed
+    with bpy.data.libraries.load(blend_path) as (data_from, data_to):
+        names = [name for name in data_from.objects if name]
+    return names
+
+def get_library_names(blend_path, icon_folder, load=True):
+    #names from the index, else from the block reader, the full index is only built when bounds or icons are needed
+    index = get_library_index(blend_path, icon_folder, build=False)
+    if index is not None:
+        return index["names"]
+    names = BlendReader.get_cached_object_names(blend_path)
+    if names is not None or not load:
+        return names
+    try:
+        return BlendReader.list_object_names(blend_path)
+    except BlendReader.READ_ERRORS as e:
+        print(f"Block reader failed on {blend_path}, listing it with Blender: {e}")
+    try:
+        return list_library_names(blend_path)
+    except OSError as e:
+        print(f"Failed to read shape library {blend_path}: {e}")
+        return None
+
+#__LAYERED LIBRARIES__
+# blend_paths are ordered highest priority first. Every layer keeps its own sidecar and stamp, so a changed or added
+# library is the only one read again, the merge itself is a pass over the cached names.
+# {
+#   "names": [...],                                          base layer first, names new to a layer are appended
+#   "owners": {"Circle_0": "/show/Shapes.blend", ...}       highest priority library that has the shape
+# }
+def get_merged_index(blend_paths, icon_folder, load=True):
+    layers = []
+    for blend_path in blend_paths:
+        blend_path = os.path.abspath(blend_path)
+        stamp = get_file_stamp(blend_path)
+        if stamp is not None:
+            layers.append((blend_path, stamp))
+
+    key = tuple((blend_path, stamp["mtime_ns"], stamp["size"]) for blend_path, stamp in layers)
+    if _merged["key"] == key:
+        return _merged["index"]
+
+    layer_names = []
+    for blend_path, stamp in layers:
+        names = get_library_names(blend_path, icon_folder, load)
+        if names is None:
+            return None
+        layer_names.append((blend_path, names))
+
+    #enum item numbers follow the merged order, walking up from the base keeps them stable when a layer is added
+    names = []
+    owners = {}
+    for blend_path, layer in reversed(layer_names):
+        for name in layer:
+            if name not in owners:
+                names.append(name)
+            owners[name] = blend_path
+
+    index = {"names": names, "owners": owners}
+    _merged["key"] = key
+    _merged["index"] = index
+    return index
+
+def get_shape_owner(merged, name):
+    return merged["owners"].get(name) if merged else None
+
+def warm_library(blend_paths, extra_paths=()):
+    #loads the sidecars, or lists the libraries with the block reader, without blocking the UI
+    blend_paths = [os.path.abspath(blend_path) for blend_path in blend_paths]
+
+    def worker():
+        for blend_path in blend_paths:
+            stamp = get_file_stamp(blend_path)
+            index = read_index(blend_path, stamp) if stamp else None
+            if index is not None:
+                _indexes.setdefault(blend_path, index)
+            elif stamp is not None:
+                try:
+                    BlendReader.list_object_names(blend_path)
+                except BlendReader.READ_ERRORS as e:
+                    print(f"Failed to read shape library {blend_path}: {e}")
+        for filepath in extra_paths:
+            if os.path.exists(filepath):
+                try:
+                    BlendReader.list_object_names(filepath)
+                except BlendReader.READ_ERRORS as e:
+                    print(f"Failed to read {filepath}: {e}")
+
+    thread = threading.Thread(target=worker, name="wryc_shape_library_warm", daemon=True)
+    thread.start()
+    return thread
+
+def get_shape_info(index, name):
+    return index["objects"].get(name) if index else None
+
+def is_icon_stale(index, name):
+    icon = index["icons"].get(name)
+    return icon is None or icon["mtime_ns"] < index["library"]["mtime_ns"]
+
+def record_icon(blend_path, icon_folder, name):
+    index = _indexes.get(os.path.abspath(blend_path))
+    if index is None:
+        return
+    stamp = get_file_stamp(os.path.join(icon_folder, f"{name}.png"))
+    if stamp:
+        index["icons"][name] = stamp
+    else:
+        index["icons"].pop(name, None)
+    write_index(os.path.abspath(blend_path), index)
+
+def refresh_icons(blend_path, icon_folder):
+    #builds the index when only the names were read so far
+    index = get_library_index(blend_path, icon_folder)
+    if index is None:
+        return
+    index["icons"] = scan_icons(index["names"], icon_folder)
+    write_index(os.path.abspath(blend_path), index)
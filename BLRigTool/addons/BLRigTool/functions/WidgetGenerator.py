@@ -0,0 +1,142 @@
+import math
+
+import bpy
+import numpy as np
+
+#__PROCEDURAL WIDGETS__
+# Wire meshes for the common library shapes, built from vertex and edge arrays instead of appending from the
+# library. Sizes follow the library meshes, shapes lie in the XY plane like the library ones.
+# One object per (shape name, params) is kept and reused, params is a sorted tuple of (name, value).
+WIDGET_PROPERTY = "wryc_widget"
+DEFAULT_SEGMENTS = 32
+
+_widgets = {}
+
+def build_arc(radius, segments, start=0.0, sweep=math.tau, center=(0.0, 0.0)):
+    #returns verts (n, 3) and edges (m, 2), a full sweep is closed
+    closed = math.isclose(sweep, math.tau)
+    count = segments if closed else segments + 1
+    angles = start + np.arange(count) * (sweep / segments)
+    verts = np.zeros((count, 3), dtype=np.float32)
+    verts[:, 0] = center[0] + np.cos(angles) * radius
+    verts[:, 1] = center[1] + np.sin(angles) * radius
+    index = np.arange(count)
+    edges = np.stack((index, (index + 1) % count), axis=1)
+    if not closed:
+        edges = edges[:-1]
+    return verts, edges
+
+def build_outline(points):
+    verts = np.array([(x, y, 0.0) for x, y in points], dtype=np.float32)
+    index = np.arange(len(verts))
+    return verts, np.stack((index, (index + 1) % len(verts)), axis=1)
+
+def merge_parts(parts):
+    verts = []
+    edges = []
+    offset = 0
+    for part_verts, part_edges in parts:
+        verts.append(part_verts)
+        edges.append(part_edges + offset)
+        offset += len(part_verts)
+    return np.concatenate(verts), np.concatenate(edges)
+
+def get_arc_segments(segments, sweep):
+    return max(2, round(segments * sweep / math.tau))
+
+def build_circle_0(segments=DEFAULT_SEGMENTS):
+    return build_arc(0.6, segments)
+
+def build_circle_1(segments=DEFAULT_SEGMENTS):
+    #four arcs on the diagonals
+    sweep = math.radians(50)
+    arc_segments = get_arc_segments(segments, sweep)
+    return merge_parts([
+        build_arc(0.54, arc_segments, math.radians(45 + 90 * i) - sweep / 2, sweep) for i in range(4)
+    ])
+
+def build_circle_2(segments=DEFAULT_SEGMENTS):
+    #inner ring with four arcs on the axes
+    sweep = math.radians(60)
+    arc_segments = get_arc_segments(segments, sweep)
+    parts = [build_arc(0.42, segments)]
+    parts += [build_arc(0.5, arc_segments, math.radians(90 * i) - sweep / 2, sweep) for i in range(4)]
+    return merge_parts(parts)
+
+def build_ball_0(segments=DEFAULT_SEGMENTS):
+    #three orthogonal rings
+    verts, edges = build_arc(0.49, segments)
+    rings = [(verts, edges)]
+    rings.append((verts[:, [0, 2, 1]], edges))
+    rings.append((verts[:, [2, 0, 1]], edges))
+    return merge_parts(rings)
+
+def build_cube_0():
+    corners = np.array([(x, y, z) for x in (-0.5, 0.5) for y in (-0.5, 0.5) for z in (-0.5, 0.5)], dtype=np.float32)
+    edges = [(a, b) for a in range(8) for b in range(a + 1, 8) if bin(a ^ b).count("1") == 1]
+    return corners, np.array(edges)
+
+def build_cross_0():
+    #four bars around an open center
+    inner, outer, half = 0.15, 0.42, 0.04
+    parts = []
+    for i in range(4):
+        c, s = round(math.cos(math.radians(90 * i))), round(math.sin(math.radians(90 * i)))
+        corners = [(inner, -half), (outer, -half), (outer, half), (inner, half)]
+        parts.append(build_outline([(x * c - y * s, x * s + y * c) for x, y in corners]))
+    return merge_parts(parts)
+
+def build_roll_0(segments=DEFAULT_SEGMENTS):
+    #arc over the bone, 0.5 to each side
+    sweep = math.radians(80)
+    return build_arc(0.78, get_arc_segments(segments, sweep), math.radians(90) - sweep / 2, sweep, center=(0.0, -0.45))
+
+WIDGET_BUILDERS = {
+    "Circle_0": build_circle_0,
+    "Circle_1": build_circle_1,
+    "Circle_2": build_circle_2,
+    "Ball_0": build_ball_0,
+    "Cube_0": build_cube_0,
+    "Cross_0": build_cross_0,
+    "Roll_0": build_roll_0,
+}
+SEGMENTED_WIDGETS = {"Circle_0", "Circle_1", "Circle_2", "Ball_0", "Roll_0"}
+
+def is_procedural(shape_name):
+    return shape_name in WIDGET_BUILDERS
+
+def get_widget_params(shape_name, segments=DEFAULT_SEGMENTS):
+    #only the params a builder takes are part of the key
+    if shape_name in SEGMENTED_WIDGETS:
+        return (("segments", segments),)
+    return ()
+
+def get_widget_name(shape_name, params):
+    suffix = "".join(f"_{value}" for _, value in params if value != DEFAULT_SEGMENTS)
+    return f"WGT_{shape_name}{suffix}"
+
+def build_mesh(name, verts, edges):
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set("co", verts.astype(np.float32).ravel())
+    mesh.edges.add(len(edges))
+    mesh.edges.foreach_set("vertices", edges.astype(np.int32).ravel())
+    mesh.update()
+    return mesh
+
+def get_widget(shape_name, segments=DEFAULT_SEGMENTS):
+    #cached per parameter tuple, widgets saved in the file are found again by name and key
+    params = get_widget_params(shape_name, segments)
+    key = repr((shape_name, params))
+    name = _widgets.get(key) or get_widget_name(shape_name, params)
+    obj = bpy.data.objects.get(name)
+    if obj is not None and obj.get(WIDGET_PROPERTY) == key:
+        _widgets[key] = obj.name
+        return obj
+
+    verts, edges = WIDGET_BUILDERS[shape_name](**dict(params))
+    mesh = build_mesh(get_widget_name(shape_name, params), verts, edges)
+    obj = bpy.data.objects.new(mesh.name, mesh)
+    obj[WIDGET_PROPERTY] = key
+    _widgets[key] = obj.name
+    return obj
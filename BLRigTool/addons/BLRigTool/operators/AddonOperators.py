@@ -1,15 +1,17 @@
 import difflib
 import json
 import os
+import re
+import time
 
 import bpy
 import math
 import mathutils
 from requests.packages import target
 
-from ..functions import AddonFunctions
+from ..functions import AddonFunctions, BatchBuilder, BlendReader, BoneClassifier, BoneMappingStore, BoneTopology, ChainSolver, MirrorRig, PoleSolver, RenameEngine, RigRecipe, ShapeLibraryIndex
 from ..properties import AddonProperties
-from ..utils import AddonUtils
+from ..utils import AddonUtils, RigProfiler
 
 #__CUSTOM DISPLAY SHAPE__
 class WRYC_OT_GenerateShapeIcon(bpy.types.Operator):
@@ -70,10 +72,28 @@ class WRYC_OT_ReloadBoneShapeIcons(bpy.types.Operator):
     def execute(self,context):
         AddonFunctions.unload_icon_preview()
         AddonFunctions.load_icon_preview()
+        for blend_path in AddonFunctions.get_library_paths():
+            ShapeLibraryIndex.refresh_icons(blend_path, AddonFunctions.get_icon_folder())
         context.scene.bone_display_settings.bone_shape = context.scene.bone_display_settings.bone_shape
 
         return {'FINISHED'}
 
+class WRYC_OT_DedupeBoneShapes(bpy.types.Operator):
+    bl_idname = "wryc.ot_dedupe_bone_shapes"
+    bl_label = "Merge Duplicate Shapes"
+    bl_description = "Point bones using Circle_0.001 style copies to the original shape object and remove the copies"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        result = AddonFunctions.dedupe_shape_objects()
+        if not result["objects"] and not result["bones"]:
+            self.report({'INFO'}, "No duplicate bone shapes found")
+            return {'FINISHED'}
+
+        self.report({'INFO'}, f"Remapped {result['bones']} bones, removed {result['objects']} shape copies, "
+                              f"about {result['bytes'] / 1024:.1f} KB of geometry freed")
+        return {'FINISHED'}
+
 class WRYC_OT_CustomBoneShape(bpy.types.Operator):
     bl_idname = "wryc.ot_custom_bone_shape"
     bl_label = "Apply Bone Shape"
@@ -93,12 +113,7 @@ class WRYC_OT_CustomBoneShape(bpy.types.Operator):
             self.report({'INFO'}, "No bone shape selected")
             return {'CANCELLED'}
 
-        blend_path = AddonFunctions.get_library_path()
-        with bpy.data.libraries.load(blend_path, link=False) as (data_from, data_to):
-            if shape_name in data_from.objects:
-                data_to.objects = [shape_name]
-
-        shape_obj = bpy.data.objects.get(shape_name)
+        shape_obj = AddonFunctions.resolve_library_shape(shape_name)
         if not shape_obj:
             self.report({'ERROR'}, f"Object '{shape_name}' not found or cannot be loaded")
             return {'CANCELLED'}
@@ -266,6 +281,8 @@ class WRYC_OT_CustomDisplayBone(bpy.types.Operator):
     bl_label = "Apply All"
     bl_options = {'REGISTER', 'UNDO'}
 
+    recorded_selection: bpy.props.StringProperty(options={'HIDDEN', 'SKIP_SAVE'})
+
     def execute(self, context):
         if not AddonFunctions.check_pose_mode(context, self):
             return {'CANCELLED'}
@@ -273,21 +290,17 @@ class WRYC_OT_CustomDisplayBone(bpy.types.Operator):
         bones = AddonFunctions.get_selected_bones(context, self)
         if not bones:
             return {'CANCELLED'}
+        RigRecipe.store_selection(self, bones)
 
         shape_name = context.scene.bone_display_settings.bone_shape
         if not shape_name or shape_name == "None":
             self.report({'INFO'}, "No bone shape selected")
             return {'CANCELLED'}
 
-        blend_path = AddonFunctions.get_library_path()
-        with bpy.data.libraries.load(blend_path, link=False) as (data_from, data_to):
-            if shape_name in data_from.objects:
-                data_to.objects = [shape_name]
-
         settings = context.scene.bone_display_settings
         armature = context.active_object
 
-        shape_obj = bpy.data.objects.get(shape_name)
+        shape_obj = AddonFunctions.resolve_library_shape(shape_name)
         if not shape_obj:
             self.report({'ERROR'}, f"Object '{shape_name}' not found or cannot be loaded")
             return {'CANCELLED'}
@@ -331,20 +344,60 @@ class WRYC_OT_ConnectDeformArmature(bpy.types.Operator):
         layout.label(text="Connect Deform Armature")
         layout.prop_search(settings, "src_obj", context.scene, "objects", text="Source Armature")
         layout.prop_search(settings, "tgt_obj", context.scene, "objects", text="Target Armature")
+        layout.prop(settings, "incremental")
 
     def execute(self, context):
         settings = context.scene.deform_settings
         pref = AddonFunctions.get_preferences().prefix.deform_prefix
+        hash_key = AddonFunctions.CONNECT_HASH_KEY
 
         def_obj = settings.src_obj
         tgt_obj = settings.tgt_obj
-        def_arm = def_obj.data
-        tgt_arm = tgt_obj.data
 
         if not def_obj or not tgt_obj:
             self.report({'ERROR'}, "Please select both armatures.")
             return {'CANCELLED'}
 
+        def_arm = def_obj.data
+        tgt_arm = tgt_obj.data
+
+        #Diff source rest data against the hashes stored on the DEF_ bones
+        src_hashes = {}
+        src_parents = {}
+        for src_bone in def_arm.bones:
+            src_name = src_bone.name
+            if src_name not in tgt_arm.bones:
+                continue
+            src_hashes[src_name] = AddonFunctions.get_bone_rest_hash(src_bone)
+            src_parents[src_name] = src_bone.parent.name if src_bone.parent else ""
+
+        stored_hashes = {}
+        for bone in tgt_arm.bones:
+            if bone.name.startswith(pref) and hash_key in bone:
+                stored_hashes[bone.name[len(pref):]] = bone[hash_key]
+
+        added = []
+        changed = []
+        for src_name, bone_hash in src_hashes.items():
+            def_name = f"{pref}{src_name}"
+            if def_name not in tgt_arm.bones:
+                added.append(src_name)
+            elif not settings.incremental or stored_hashes.get(src_name) != bone_hash:
+                changed.append(src_name)
+
+        #Re-created parents need their existing children re-parented
+        added_names = set(added)
+        changed_names = set(changed)
+        for src_name, parent_name in src_parents.items():
+            if parent_name in added_names and src_name not in added_names and src_name not in changed_names:
+                changed.append(src_name)
+        removed = [src_name for src_name in stored_hashes if src_name not in src_hashes]
+
+        dirty = added + changed
+        if not dirty and not removed:
+            self.report({'INFO'}, "Deform Bones are up to date.")
+            return {'FINISHED'}
+
         bpy.ops.object.mode_set(mode='OBJECT')
         context.view_layer.objects.active = tgt_obj
         bpy.ops.object.mode_set(mode='EDIT')
@@ -353,21 +406,20 @@ class WRYC_OT_ConnectDeformArmature(bpy.types.Operator):
             tgt_arm.collections.new("Deform Bones")
         deform_col = tgt_arm.collections["Deform Bones"]
 
-        def_bones = []
+        edit_bones = tgt_arm.edit_bones
 
-        for src_bone in def_arm.bones:
-            src_name = src_bone.name
-            def_name = f"{pref}{src_name}"
+        for src_name in removed:
+            def_bone = edit_bones.get(f"{pref}{src_name}")
+            if def_bone:
+                edit_bones.remove(def_bone)
 
-            if src_name not in tgt_arm.bones:
-                continue
+        for src_name in dirty:
+            src_bone = def_arm.bones[src_name]
+            def_name = f"{pref}{src_name}"
 
-            tgt_bone = tgt_arm.bones[src_name]
-
-            if def_name in tgt_arm.edit_bones:
-                def_bone = tgt_arm.edit_bones[def_name]
-            else:
-                def_bone = tgt_arm.edit_bones.new(name=def_name)
+            def_bone = edit_bones.get(def_name)
+            if def_bone is None:
+                def_bone = edit_bones.new(name=def_name)
 
             def_bone.head = src_bone.head_local
             def_bone.tail = src_bone.tail_local
@@ -377,62 +429,52 @@ class WRYC_OT_ConnectDeformArmature(bpy.types.Operator):
             def_bone.use_connect = False
 
             deform_col.assign(def_bone)
-            def_bones.append(src_name)
 
-        for src_bone in def_arm.bones:
-            src_name = src_bone.name
-            def_name = f"{pref}{src_name}"
-
-            if def_name not in tgt_arm.edit_bones:
+        for src_name in dirty:
+            parent_name = src_parents[src_name]
+            if not parent_name:
                 continue
 
-            def_bone = tgt_arm.edit_bones[def_name]
-
-            if src_bone.parent:
-                parent_name = src_bone.parent.name
-                def_parent_name = f"{pref}{parent_name}"
-
-                if def_parent_name in tgt_arm.edit_bones:
-                    def_bone.parent = tgt_arm.edit_bones[def_parent_name]
+            def_parent = edit_bones.get(f"{pref}{parent_name}")
+            if def_parent:
+                edit_bones[f"{pref}{src_name}"].parent = def_parent
 
         bpy.ops.object.mode_set(mode='POSE')
 
-        for tgt_name in def_bones:
+        for tgt_name in dirty:
             def_name = f"{pref}{tgt_name}"
 
-            if tgt_name not in tgt_obj.pose.bones:
-                continue
-            if def_name not in tgt_obj.pose.bones:
+            def_pb = tgt_obj.pose.bones.get(def_name)
+            if def_pb is None:
                 continue
 
-            def_pb = tgt_obj.pose.bones[def_name]
+            con = AddonFunctions.get_or_create_constraint(def_pb, "DEFORM - ", 'LIMIT_LOCATION')
+            con.max_x = con.max_y = con.max_z = con.min_x = con.min_y = con.min_z = 0
+            con.use_max_x = con.use_max_y = con.use_max_z = con.use_min_x = con.use_min_y = con.use_min_z = True
+            con.owner_space = 'LOCAL_WITH_PARENT'
+            con.influence = 1.0
 
-            if def_pb:
-                con = AddonFunctions.get_or_create_constraint(def_pb, "DEFORM - ", 'LIMIT_LOCATION')
-                con.max_x = con.max_y = con.max_z = con.min_x = con.min_y = con.min_z = 0
-                con.use_max_x = con.use_max_y = con.use_max_z = con.use_min_x = con.use_min_y = con.use_min_z = True
-                con.owner_space = 'LOCAL_WITH_PARENT'
-                con.influence = 1.0
+            con = AddonFunctions.get_or_create_constraint(def_pb, "DEFORM - ", 'LIMIT_ROTATION')
+            con.max_x = con.max_y = con.max_z = con.min_x = con.min_y = con.min_z = 0
+            con.use_limit_x = con.use_limit_y = con.use_limit_z = True
+            con.owner_space = 'LOCAL_WITH_PARENT'
+            con.influence = 1.0
 
-                con = AddonFunctions.get_or_create_constraint(def_pb, "DEFORM - ", 'LIMIT_ROTATION')
-                con.max_x = con.max_y = con.max_z = con.min_x = con.min_y = con.min_z = 0
-                con.use_limit_x = con.use_limit_y = con.use_limit_z = True
-                con.owner_space = 'LOCAL_WITH_PARENT'
-                con.influence = 1.0
+            con = AddonFunctions.get_or_create_constraint(def_pb, "DEFORM - ", 'LIMIT_SCALE')
+            con.max_x = con.max_y = con.max_z = con.min_x = con.min_y = con.min_z = 1
+            con.use_max_x = con.use_max_y = con.use_max_z = con.use_min_x = con.use_min_y = con.use_min_z = True
+            con.owner_space = 'LOCAL_WITH_PARENT'
+            con.influence = 1.0
 
-                con = AddonFunctions.get_or_create_constraint(def_pb, "DEFORM - ", 'LIMIT_SCALE')
-                con.max_x = con.max_y = con.max_z = con.min_x = con.min_y = con.min_z = 1
-                con.use_max_x = con.use_max_y = con.use_max_z = con.use_min_x = con.use_min_y = con.use_min_z = True
-                con.owner_space = 'LOCAL_WITH_PARENT'
-                con.influence = 1.0
+            con = AddonFunctions.get_or_create_constraint(def_pb, "DEFORM - ", "CHILD_OF")
+            con.target = tgt_obj
+            con.subtarget = tgt_name
 
-                con = AddonFunctions.get_or_create_constraint(def_pb, "DEFORM - ", "CHILD_OF")
-                con.target = tgt_obj
-                con.subtarget = tgt_name
+            def_pb.bone[hash_key] = src_hashes[tgt_name]
 
         bpy.ops.object.mode_set(mode='OBJECT')
 
-        self.report({'INFO'}, "Deform Bones generated and connected.")
+        self.report({'INFO'}, f"Deform Bones connected: {len(added)} added, {len(changed)} updated, {len(removed)} removed.")
         return {'FINISHED'}
 
 class WRYC_OT_CreateDeformBones(bpy.types.Operator):
@@ -461,6 +503,7 @@ class WRYC_OT_CreateDeformBones(bpy.types.Operator):
     )
 
     def_coll_name: bpy.props.StringProperty(name="Collection Name", default="Deform Bones")
+    recorded_selection: bpy.props.StringProperty(options={'HIDDEN', 'SKIP_SAVE'})
 
     def invoke(self, context, event):
         if not AddonFunctions.check_pose_mode(context, self):
@@ -498,6 +541,7 @@ class WRYC_OT_CreateDeformBones(bpy.types.Operator):
         selected_bones = AddonFunctions.get_selected_bones(context, self)
         if not selected_bones:
             return {'CANCELLED'}
+        RigRecipe.store_selection(self, selected_bones)
 
         selected_names = {pb.name for pb in selected_bones}
 
@@ -586,8 +630,9 @@ class WRYC_OT_CreateMannyDeformBones(bpy.types.Operator):
         obj = context.active_object
         arm = obj.data
 
-        def_coll = AddonFunctions.get_or_create_collection(arm, self.def_coll_name)
-        def_body_coll = AddonFunctions.get_or_create_collection(arm, self.def_body_coll_name)
+        collections = BoneClassifier.CollectionLookup(arm)
+        def_coll = collections.get(self.def_coll_name)
+        def_body_coll = collections.get(self.def_body_coll_name)
 
         def_body_coll.parent = def_coll
 
@@ -759,6 +804,8 @@ class WRYC_OT_SetInverseAllChildOf(bpy.types.Operator):
     bl_description = "Set Inverse to all child of constraint in selected bones"
     bl_options = {'REGISTER', 'UNDO'}
 
+    recorded_selection: bpy.props.StringProperty(options={'HIDDEN', 'SKIP_SAVE'})
+
     def execute(self, context):
         if not AddonFunctions.check_pose_mode(context, self):
             return {'CANCELLED'}
@@ -766,6 +813,7 @@ class WRYC_OT_SetInverseAllChildOf(bpy.types.Operator):
         selected_bones = AddonFunctions.get_selected_bones(context, self)
         if not selected_bones:
             return {'CANCELLED'}
+        RigRecipe.store_selection(self, selected_bones)
 
         obj = bpy.context.object
 
@@ -831,6 +879,10 @@ class WRYC_OT_CreateSpineController(bpy.types.Operator):
             layout.label(text="Select an Armature", icon="ERROR")
 
     def execute(self, context):
+        with RigProfiler.profile_build(self, "Spine"):
+            return self.build(context)
+
+    def build(self, context):
         obj = context.object
         pref = AddonFunctions.get_preferences()
 
@@ -846,30 +898,18 @@ class WRYC_OT_CreateSpineController(bpy.types.Operator):
             self.report({'ERROR'}, f"Bone not found")
             return {'CANCELLED'}
 
-        neck_pb = chest_pb.children[0]
+        topology = BoneTopology.get_topology(obj, refresh=True)
 
-        #Collect chain: pelvis -> chain
-        pre_neck_chain = []
-        pb = neck_pb
-        while pb:
-            pre_neck_chain.append(pb)
-            if pb.name == pelvis_pb.name:
-                break
-            pb = pb.parent
-        pre_neck_chain.reverse()
-
-        spline_chain_count = len(pre_neck_chain)
+        #Collect chain: pelvis -> head
+        full_chain_names = topology.chain_between(self.pelvis, self.head)
+        if self.chest not in full_chain_names[:-1]:
+            self.report({'ERROR'}, f"Bones are not in one chain: {self.pelvis} -> {self.chest} -> {self.head}")
+            return {'CANCELLED'}
 
-        full_chain = []
-        pb = head_pb
-        while pb:
-            full_chain.append(pb)
-            if pb.name == self.pelvis:
-                break
-            pb = pb.parent
-        full_chain.reverse()
+        neck_pb = obj.pose.bones[full_chain_names[full_chain_names.index(self.chest) + 1]]
+        spline_chain_count = full_chain_names.index(neck_pb.name) + 1
 
-        full_chain_names = [b.name for b in full_chain]
+        full_chain = [obj.pose.bones[name] for name in full_chain_names]
 
         # Generate Pelvis Control Bone
         control_pelvis = AddonFunctions.ensure_target(
@@ -939,103 +979,68 @@ class WRYC_OT_CreateSpineController(bpy.types.Operator):
             prev_gizmo_name = gizmo_name
 
         #Generate Curve
-        curve_name = f"{obj.name} Spine Curve"
-        if curve_name in bpy.data.objects:
-            bpy.data.objects.remove(bpy.data.objects[curve_name], do_unlink=True)
-
-        curve_data = bpy.data.curves.new(curve_name, type='CURVE')
-        curve_data.dimensions = '3D'
-        spline = curve_data.splines.new('NURBS')
-        spline.points.add(2)
-        spline.use_endpoint_u = True
-
-        for i, (pt, pos) in enumerate(zip(spline.points, [target_pelvis.head, target_chest.head, target_head.head])):
-            pt.co = (*pos, 1.0)
-            pt.weight = 1.0
-
-        curve_obj = bpy.data.objects.new(curve_name, curve_data)
-        if obj.users_collection:
-            target_collection = obj.users_collection[0]
-        else:
-            target_collection = context.scene.collection
-        target_collection.objects.link(curve_obj)
-        curve_obj.parent = obj
-        context.view_layer.update()
-
-        hook_targets = [
-            (target_pelvis.name, 0),
-            (target_chest.name, 1),
-            (target_head.name, 2),
-        ]
-
-        bpy.context.view_layer.objects.active = curve_obj
-        curve_obj.select_set(True)
+        curve_obj = AddonFunctions.ensure_hook_curve(
+            context,
+            obj,
+            f"{obj.name} Spine Curve",
+            [target_pelvis.head, target_chest.head, target_head.head],
+            [target_pelvis.name, target_chest.name, target_head.name],
+        )
 
-        for bone_name, index in hook_targets:
-            mod = curve_obj.modifiers.new(name=f"{bone_name} - Hook", type='HOOK')
-            mod.object = obj
-            mod.subtarget = bone_name
-            mod.vertex_indices_set([index])
+        #Constraints
+        with RigProfiler.profile_phase("Constraints", "constraint_write"):
+            con = AddonFunctions.get_or_create_constraint(control_pelvis, "TARGET - ", 'COPY_LOCATION')
+            con.target = obj
+            con.subtarget = target_pelvis.name
+            con.use_x = con.use_y = con.use_z = True
+            con.use_offset = True
+            con.target_space = 'LOCAL'
+            con.owner_space = 'LOCAL'
+            con.influence = 1
 
-        curve_obj.parent = obj
+            con = AddonFunctions.get_or_create_constraint(control_pelvis, "GIZMO - ", 'COPY_ROTATION')
+            con.target = obj
+            con.subtarget = f"{pref.prefix.gizmo_prefix}{pelvis_pb.name}"
+            con.use_x = con.use_y = con.use_z = True
+            con.target_space = 'LOCAL'
+            con.owner_space = 'LOCAL'
+            con.mix_mode = 'BEFORE'
+            con.influence = 1
 
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-        bpy.ops.object.mode_set(mode='POSE')
+            con = AddonFunctions.get_or_create_constraint(pelvis_pb, "CONTROL - ", 'COPY_LOCATION')
+            con.target = obj
+            con.subtarget = control_pelvis.name
+            con.use_x = con.use_y = con.use_z = True
+            con.use_offset = False
+            con.target_space = 'LOCAL'
+            con.owner_space = 'LOCAL'
+            con.influence = 1
 
-        #Constraints
-        con = AddonFunctions.get_or_create_constraint(control_pelvis, "TARGET - ", 'COPY_LOCATION')
-        con.target = obj
-        con.subtarget = target_pelvis.name
-        con.use_x = con.use_y = con.use_z = True
-        con.use_offset = True
-        con.target_space = 'LOCAL'
-        con.owner_space = 'LOCAL'
-        con.influence = 1
-
-        con = AddonFunctions.get_or_create_constraint(control_pelvis, "GIZMO - ", 'COPY_ROTATION')
-        con.target = obj
-        con.subtarget = f"{pref.prefix.gizmo_prefix}{pelvis_pb.name}"
-        con.use_x = con.use_y = con.use_z = True
-        con.target_space = 'LOCAL'
-        con.owner_space = 'LOCAL'
-        con.mix_mode = 'BEFORE'
-        con.influence = 1
-
-        con = AddonFunctions.get_or_create_constraint(pelvis_pb, "CONTROL - ", 'COPY_LOCATION')
-        con.target = obj
-        con.subtarget = control_pelvis.name
-        con.use_x = con.use_y = con.use_z = True
-        con.use_offset = False
-        con.target_space = 'LOCAL'
-        con.owner_space = 'LOCAL'
-        con.influence = 1
-
-        con = AddonFunctions.get_or_create_constraint(pelvis_pb, "CONTROL - ", 'COPY_ROTATION')
-        con.target = obj
-        con.subtarget = control_pelvis.name
-        con.use_x = con.use_y = con.use_z = True
-        con.target_space = 'LOCAL'
-        con.owner_space = 'LOCAL'
-        con.mix_mode = 'REPLACE'
-        con.influence = 1
-
-        for pb in full_chain[1:]:
-            con = AddonFunctions.get_or_create_constraint(pb, "GIZMO - ", 'COPY_ROTATION')
+            con = AddonFunctions.get_or_create_constraint(pelvis_pb, "CONTROL - ", 'COPY_ROTATION')
             con.target = obj
-            con.subtarget = f"{pref.prefix.gizmo_prefix}{pb.name}"
+            con.subtarget = control_pelvis.name
             con.use_x = con.use_y = con.use_z = True
             con.target_space = 'LOCAL'
             con.owner_space = 'LOCAL'
-            con.mix_mode = 'BEFORE'
-            con.influence = 0.5
+            con.mix_mode = 'REPLACE'
+            con.influence = 1
 
-        gizmo_neck = obj.pose.bones.get(f"{pref.prefix.gizmo_prefix}{neck_pb.name}")
-        con = AddonFunctions.get_or_create_constraint(gizmo_neck, "", 'SPLINE_IK')
-        con.target = curve_obj
-        con.chain_count = spline_chain_count
-        con.use_curve_radius = True
-        con.y_scale_mode = 'FIT_CURVE'
+            for pb in full_chain[1:]:
+                con = AddonFunctions.get_or_create_constraint(pb, "GIZMO - ", 'COPY_ROTATION')
+                con.target = obj
+                con.subtarget = f"{pref.prefix.gizmo_prefix}{pb.name}"
+                con.use_x = con.use_y = con.use_z = True
+                con.target_space = 'LOCAL'
+                con.owner_space = 'LOCAL'
+                con.mix_mode = 'BEFORE'
+                con.influence = 0.5
+
+            gizmo_neck = obj.pose.bones.get(f"{pref.prefix.gizmo_prefix}{neck_pb.name}")
+            con = AddonFunctions.get_or_create_constraint(gizmo_neck, "", 'SPLINE_IK')
+            con.target = curve_obj
+            con.chain_count = spline_chain_count
+            con.use_curve_radius = True
+            con.y_scale_mode = 'FIT_CURVE'
 
         self.report({'INFO'}, f"Generated Controller for SPINE")
         return {'FINISHED'}
@@ -1066,6 +1071,10 @@ class WRYC_OT_CreateHeadController(bpy.types.Operator):
             layout.label(text="Select an Armature", icon="ERROR")
             
     def execute(self, context):
+        with RigProfiler.profile_build(self, "Head"):
+            return self.build(context)
+
+    def build(self, context):
         obj = context.object
         pref = AddonFunctions.get_preferences()
 
@@ -1080,29 +1089,28 @@ class WRYC_OT_CreateHeadController(bpy.types.Operator):
             self.report({'ERROR'}, f"Bone not found")
             return {'CANCELLED'}
 
-        chain = []
-        pb = head_pb
-        while pb:
-            chain.append(pb)
-            if pb.name == chest_pb.name:
-                break
-            pb = pb.parent
-        chain.reverse()
+        topology = BoneTopology.get_topology(obj, refresh=True)
+
+        chain_names = topology.chain_between(self.chest, self.head)
+        if len(chain_names) < 2:
+            self.report({'ERROR'}, f"Head {self.head} is not a child of {self.chest}")
+            return {'CANCELLED'}
 
+        chain = [obj.pose.bones[name] for name in chain_names]
         chain_length = len(chain)
-        chain_names = [b.name for b in chain]
+        chest_parent_name = topology.parent_name(self.chest)
 
         gt_prefix = f"{pref.prefix.gizmo_prefix}{pref.prefix.track_prefix}"
         mt_prefix = f"{pref.prefix.mechanic_prefix}{pref.prefix.track_prefix}"
 
-        unit = chest_pb.child.length/0.05
+        unit = chain[1].length/0.05
 
         offset_head = AddonFunctions.ensure_target(
             obj,
             head_pb,
             f"{pref.prefix.offset_prefix}{pref.prefix.track_prefix}{head_pb.name}",
             'offset_head_shape',
-            chest_pb.child.name,
+            chain_names[1],
             False,
             length=unit * 0.3,
             mode='HEAD_TRACK',
@@ -1115,7 +1123,7 @@ class WRYC_OT_CreateHeadController(bpy.types.Operator):
                 bone_name,
                 gt_name,
                 'gizmo_shape',
-                chain_names[i - 1] if i > 0 else f"{chest_pb.parent.name}",
+                chain_names[i - 1] if i > 0 else chest_parent_name,
                 False,
                 mode='DEFAULT'
             )
@@ -1130,7 +1138,7 @@ class WRYC_OT_CreateHeadController(bpy.types.Operator):
                 bone_name,
                 mt_name,
                 'mechanic_shape',
-                parent_bone=offset_head.name if bone_name == head_pb.name else chest_pb.parent.name if bone_name == chest_pb.name else prev_mt_name,
+                parent_bone=offset_head.name if bone_name == head_pb.name else chest_parent_name if bone_name == chest_pb.name else prev_mt_name,
                 use_connect=False,
                 mode='DEFAULT'
             )
@@ -1141,7 +1149,7 @@ class WRYC_OT_CreateHeadController(bpy.types.Operator):
             head_pb,
             f"{pref.prefix.control_prefix}{pref.prefix.track_prefix}{head_pb.name}",
             'head_control_shape',
-            f"{pref.prefix.mechanic_prefix}{pref.prefix.track_prefix}{head_pb.parent.name}",
+            f"{pref.prefix.mechanic_prefix}{pref.prefix.track_prefix}{chain_names[-2]}",
             False,
             length=unit * 0.3,
             mode='HEAD_TRACK',
@@ -1157,105 +1165,106 @@ class WRYC_OT_CreateHeadController(bpy.types.Operator):
             ref_name=control_head.name
         )
 
-        bpy.ops.object.mode_set(mode='POSE')
+        AddonFunctions.set_mode('POSE')
 
         #Constraints
-        con = AddonFunctions.get_or_create_constraint(offset_head, 'TRACK - ', 'IK')
-        con.target = obj
-        con.subtarget = target_head.name
-        con.chain_count = 1
-        con.use_tail = True
-        con.use_stretch = False
-        con.use_location = True
-        con.use_rotation = False
-        con.weight = 1.0
-        con.influence = 1.0
-
-        con = AddonFunctions.get_or_create_constraint(offset_head, 'TRACK - ', 'COPY_ROTATION')
-        con.target = obj
-        con.subtarget = control_head.name
-        con.use_x = con.use_y = con.use_z = True
-        con.target_space = 'LOCAL'
-        con.owner_space = 'LOCAL'
-        con.mix_mode = 'AFTER'
-        con.influence = 1.0
-
-        con = AddonFunctions.get_or_create_constraint(control_head, 'TRACK - ', 'IK')
-        con.target = obj
-        con.subtarget = target_head.name
-        con.chain_count = chain_length + 1
-        con.use_tail = True
-        con.use_stretch = True
-        con.use_location = True
-        con.use_rotation = False
-        con.weight = 1.0
-        con.influence = 1.0
-
-        con = AddonFunctions.get_or_create_constraint(control_head, 'LOCK X - ', 'LOCKED_TRACK')
-        con.target = obj
-        con.subtarget = target_head.name
-        con.track_axis = 'TRACK_Y'
-        con.lock_axis = 'LOCK_X'
-        con.influence = 0.5
-
-        con = AddonFunctions.get_or_create_constraint(control_head, 'LOCK Z - ', 'LOCKED_TRACK')
-        con.target = obj
-        con.subtarget = target_head.name
-        con.track_axis = 'TRACK_Y'
-        con.lock_axis = 'LOCK_Z'
-        con.influence = 0.5
-
-
-        gt_bones = [obj.pose.bones.get(f"{gt_prefix}{bone_name}") for bone_name in chain_names]
-        mt_bones = [obj.pose.bones.get(f"{mt_prefix}{bone_name}") for bone_name in chain_names]
-
-        for i in range(chain_length):
-            bone = chain[i]
-            gt_bone = gt_bones[i]
-            mt_bone = mt_bones[i]
-
-            is_head = (i == chain_length - 1)
-
-            con = AddonFunctions.get_or_create_constraint(gt_bone, 'TRACK - ', 'IK')
+        with RigProfiler.profile_phase("Constraints", "constraint_write"):
+            con = AddonFunctions.get_or_create_constraint(offset_head, 'TRACK - ', 'IK')
             con.target = obj
-            if is_head:
-                con.subtarget = mt_bone.name
-                con.use_location = False
-                con.use_rotation = True
-            else:
-                next_mt_bone = mt_bones[i + 1]
-                con.subtarget = control_head.name if i == (chain_length - 2) else next_mt_bone.name
-                con.use_location = True
-                con.use_rotation = False
-
+            con.subtarget = target_head.name
             con.chain_count = 1
             con.use_tail = True
             con.use_stretch = False
+            con.use_location = True
+            con.use_rotation = False
             con.weight = 1.0
-            con.orient_weight = 1.0
             con.influence = 1.0
 
-            con = AddonFunctions.get_or_create_constraint(gt_bone, 'TRACK - ', 'COPY_ROTATION')
+            con = AddonFunctions.get_or_create_constraint(offset_head, 'TRACK - ', 'COPY_ROTATION')
             con.target = obj
-            con.subtarget = mt_bone.name
-            con.use_x = con.use_z = False
-            con.use_y = True
+            con.subtarget = control_head.name
+            con.use_x = con.use_y = con.use_z = True
             con.target_space = 'LOCAL'
             con.owner_space = 'LOCAL'
             con.mix_mode = 'AFTER'
             con.influence = 1.0
 
-            con = AddonFunctions.get_or_create_constraint(bone, 'TRACK - ', 'COPY_ROTATION')
+            con = AddonFunctions.get_or_create_constraint(control_head, 'TRACK - ', 'IK')
             con.target = obj
-            con.subtarget = gt_bone.name
-            con.use_x = con.use_y = con.use_z = True
-            con.target_space = 'LOCAL'
-            con.owner_space = 'LOCAL'
-            con.mix_mode = 'AFTER'
-            if is_head:
+            con.subtarget = target_head.name
+            con.chain_count = chain_length + 1
+            con.use_tail = True
+            con.use_stretch = True
+            con.use_location = True
+            con.use_rotation = False
+            con.weight = 1.0
+            con.influence = 1.0
+
+            con = AddonFunctions.get_or_create_constraint(control_head, 'LOCK X - ', 'LOCKED_TRACK')
+            con.target = obj
+            con.subtarget = target_head.name
+            con.track_axis = 'TRACK_Y'
+            con.lock_axis = 'LOCK_X'
+            con.influence = 0.5
+
+            con = AddonFunctions.get_or_create_constraint(control_head, 'LOCK Z - ', 'LOCKED_TRACK')
+            con.target = obj
+            con.subtarget = target_head.name
+            con.track_axis = 'TRACK_Y'
+            con.lock_axis = 'LOCK_Z'
+            con.influence = 0.5
+
+
+            gt_bones = [obj.pose.bones.get(f"{gt_prefix}{bone_name}") for bone_name in chain_names]
+            mt_bones = [obj.pose.bones.get(f"{mt_prefix}{bone_name}") for bone_name in chain_names]
+
+            for i in range(chain_length):
+                bone = chain[i]
+                gt_bone = gt_bones[i]
+                mt_bone = mt_bones[i]
+
+                is_head = (i == chain_length - 1)
+
+                con = AddonFunctions.get_or_create_constraint(gt_bone, 'TRACK - ', 'IK')
+                con.target = obj
+                if is_head:
+                    con.subtarget = mt_bone.name
+                    con.use_location = False
+                    con.use_rotation = True
+                else:
+                    next_mt_bone = mt_bones[i + 1]
+                    con.subtarget = control_head.name if i == (chain_length - 2) else next_mt_bone.name
+                    con.use_location = True
+                    con.use_rotation = False
+
+                con.chain_count = 1
+                con.use_tail = True
+                con.use_stretch = False
+                con.weight = 1.0
+                con.orient_weight = 1.0
                 con.influence = 1.0
-            else:
-                con.influence = 0.5
+
+                con = AddonFunctions.get_or_create_constraint(gt_bone, 'TRACK - ', 'COPY_ROTATION')
+                con.target = obj
+                con.subtarget = mt_bone.name
+                con.use_x = con.use_z = False
+                con.use_y = True
+                con.target_space = 'LOCAL'
+                con.owner_space = 'LOCAL'
+                con.mix_mode = 'AFTER'
+                con.influence = 1.0
+
+                con = AddonFunctions.get_or_create_constraint(bone, 'TRACK - ', 'COPY_ROTATION')
+                con.target = obj
+                con.subtarget = gt_bone.name
+                con.use_x = con.use_y = con.use_z = True
+                con.target_space = 'LOCAL'
+                con.owner_space = 'LOCAL'
+                con.mix_mode = 'AFTER'
+                if is_head:
+                    con.influence = 1.0
+                else:
+                    con.influence = 0.5
 
         self.report({'INFO'}, f"Generated Controller for Head")
         return {'FINISHED'}
@@ -1286,6 +1295,10 @@ class WRYC_OT_CreateArmController(bpy.types.Operator):
             layout.label(text="Select an Armature", icon="ERROR")
 
     def execute(self, context):
+        with RigProfiler.profile_build(self, "Arm"):
+            return self.build(context)
+
+    def build(self, context):
         obj = context.object
         pref = AddonFunctions.get_preferences()
 
@@ -1293,16 +1306,12 @@ class WRYC_OT_CreateArmController(bpy.types.Operator):
             self.report({'ERROR'}, f"Please select the hand bone")
             return {'CANCELLED'}
 
-        chain = []
-        pb = obj.pose.bones.get(self.hand)
-        if not pb:
+        topology = BoneTopology.get_topology(obj, refresh=True)
+        if self.hand not in topology:
             self.report({'ERROR'}, f"Hand Bone {self.hand} not found")
             return {'CANCELLED'}
 
-        chain.append(pb)
-        while pb.parent and len(chain) <self.arm_length + 1:
-            pb = pb.parent
-            chain.append(pb)
+        chain = [obj.pose.bones[name] for name in topology.ancestors(self.hand, max_count=self.arm_length + 1)]
 
         if len(chain) < self.arm_length + 1:
             self.report({'ERROR'}, f"Arm Length {self.arm_length} is too short")
@@ -1318,7 +1327,7 @@ class WRYC_OT_CreateArmController(bpy.types.Operator):
 
         unit = upper_pb.length/0.28
 
-        bpy.ops.object.mode_set(mode='EDIT')
+        AddonFunctions.set_mode('EDIT')
 
         target_wrist = AddonFunctions.ensure_target(
             obj,
@@ -1328,7 +1337,7 @@ class WRYC_OT_CreateArmController(bpy.types.Operator):
             "",
             False,
         )
-        pole_pos = AddonFunctions.compute_pole_position(
+        pole_pos, pole_angle = PoleSolver.get_limb_pole(
             obj,
             upper_name,
             lower_name,
@@ -1345,35 +1354,29 @@ class WRYC_OT_CreateArmController(bpy.types.Operator):
             mode="POLE_TARGET",
         )
 
-        bpy.ops.object.mode_set(mode='POSE')
+        AddonFunctions.set_mode('POSE')
 
-        pole_angle = AddonFunctions.compute_pole_angle(
-            obj,
-            upper_name,
-            hand_name,
-            pole_pos,
-        )
+        with RigProfiler.profile_phase("Constraints", "constraint_write"):
+            con = AddonFunctions.get_or_create_constraint(lower_pb, "ARM - ", 'IK')
+            con.target = obj
+            con.subtarget = target_wrist.name
+            con.pole_target = obj
+            con.pole_subtarget = target_elbow.name
+            con.pole_angle = pole_angle
+            con.chain_count = self.arm_length
+            con.use_tail = True
+            con.use_stretch = False
+            con.weight = 1.0
+            con.influence = 1.0
 
-        con = AddonFunctions.get_or_create_constraint(lower_pb, "ARM - ", 'IK')
-        con.target = obj
-        con.subtarget = target_wrist.name
-        con.pole_target = obj
-        con.pole_subtarget = target_elbow.name
-        con.pole_angle = pole_angle
-        con.chain_count = self.arm_length
-        con.use_tail = True
-        con.use_stretch = False
-        con.weight = 1.0
-        con.influence = 1.0
-
-        con = AddonFunctions.get_or_create_constraint(hand_pb, "TARGET - ", 'COPY_ROTATION')
-        con.target = obj
-        con.subtarget = target_wrist.name
-        con.use_x = con.use_y = con.use_z = True
-        con.target_space = 'WORLD'
-        con.owner_space = 'WORLD'
-        con.mix_mode = 'REPLACE'
-        con.influence = 1.0
+            con = AddonFunctions.get_or_create_constraint(hand_pb, "TARGET - ", 'COPY_ROTATION')
+            con.target = obj
+            con.subtarget = target_wrist.name
+            con.use_x = con.use_y = con.use_z = True
+            con.target_space = 'WORLD'
+            con.owner_space = 'WORLD'
+            con.mix_mode = 'REPLACE'
+            con.influence = 1.0
 
         self.report({'INFO'}, f"Generated Controller for Arm")
         return {'FINISHED'}
@@ -1402,6 +1405,10 @@ class WRYC_OT_CreateFingerController(bpy.types.Operator):
             layout.label(text="Select an Armature", icon="ERROR")
 
     def execute(self, context):
+        with RigProfiler.profile_build(self, "Finger"):
+            return self.build(context)
+
+    def build(self, context):
         pref = AddonFunctions.get_preferences()
         obj = context.object
 
@@ -1410,7 +1417,12 @@ class WRYC_OT_CreateFingerController(bpy.types.Operator):
             return {'CANCELLED'}
 
         root_name = self.root_bone
-        parent_name = obj.pose.bones.get(root_name).parent.name
+        topology = BoneTopology.get_topology(obj, refresh=True)
+        if root_name not in topology:
+            self.report({'ERROR'}, f"Bone {root_name} not found")
+            return {'CANCELLED'}
+
+        parent_name = topology.parent_name(root_name)
 
         target = AddonFunctions.ensure_target(
             obj,
@@ -1421,23 +1433,162 @@ class WRYC_OT_CreateFingerController(bpy.types.Operator):
             False,
         )
 
-        bpy.ops.object.mode_set(mode='POSE')
+        AddonFunctions.set_mode('POSE')
+
+        #index_01_l -> index_, skips twist/helper children that do not share the finger name
+        finger_prefix = re.match(r"\D*", root_name).group()
+        if finger_prefix == root_name:
+            finger_prefix = ""
+        chain = AddonFunctions.collect_bone_chain(obj.pose.bones[root_name], prefix=finger_prefix)
+
+        with RigProfiler.profile_phase("Constraints", "constraint_write"):
+            for pb in chain:
+                con = AddonFunctions.get_or_create_constraint(
+                    pb,
+                    "FINGER - ",
+                    "COPY_ROTATION"
+                )
+                con.target = obj
+                con.subtarget = target.name
+                con.target_space = 'LOCAL'
+                con.owner_space = 'LOCAL'
+                con.mix_mode = 'BEFORE'
+
+        self.report({'INFO'}, f"Generate Constraint For Finger")
+        return {'FINISHED'}
+
+class WRYC_OT_CreateChainController(bpy.types.Operator):
+    bl_idname = "wryc.ot_create_chain_controller"
+    bl_label = "Chain"
+    bl_description = "Generate Spline IK Controller for tails, tentacles and ropes"
+    bl_options = {'REGISTER', 'UNDO'}
 
-        chain = AddonFunctions.collect_bone_chain(obj.pose.bones[root_name])
+    root_bone: bpy.props.StringProperty(name="Root Bone")
+    end_bone: bpy.props.StringProperty(name="End Bone", description="Last bone of the chain, follows the first child when empty")
+    control_count: bpy.props.IntProperty(name="Control Points", default=4, min=2, max=64)
+    influence: bpy.props.FloatProperty(name="Influence", default=1.0, min=0.0, max=1.0)
+
+    def invoke(self, context, event):
+        if not AddonFunctions.check_pose_mode(context, self):
+            return {'CANCELLED'}
+        return context.window_manager.invoke_props_dialog(self, width=300)
+
+    def draw(self, context):
+        layout = self.layout
+        obj = context.object
+
+        if obj and obj.type == 'ARMATURE':
+            layout.label(text="Basic Bone")
+            layout.prop_search(self, "root_bone", obj.data, "bones", text="Root")
+            layout.prop_search(self, "end_bone", obj.data, "bones", text="End")
+            layout.prop(self, "control_count")
+            layout.prop(self, "influence")
+        else:
+            layout.label(text="Select an Armature", icon="ERROR")
+
+    def execute(self, context):
+        with RigProfiler.profile_build(self, "Chain"):
+            return self.build(context)
+
+    def build(self, context):
+        obj = context.object
+        pref = AddonFunctions.get_preferences()
+
+        if not self.root_bone:
+            self.report({'ERROR'}, "Please select the root bone of the chain")
+            return {'CANCELLED'}
+
+        topology = BoneTopology.get_topology(obj, refresh=True)
+        if self.root_bone not in topology:
+            self.report({'ERROR'}, f"Bone {self.root_bone} not found")
+            return {'CANCELLED'}
+
+        if self.end_bone:
+            chain_names = topology.chain_between(self.root_bone, self.end_bone)
+        else:
+            chain_names = [self.root_bone]
+            while topology.children[topology.index[chain_names[-1]]]:
+                chain_names.append(topology.children_names(chain_names[-1])[0])
+
+        if len(chain_names) < 2:
+            self.report({'ERROR'}, f"No chain found from {self.root_bone} to {self.end_bone}")
+            return {'CANCELLED'}
 
-        for pb in chain:
-            con = AddonFunctions.get_or_create_constraint(
-                pb,
-                "FINGER - ",
-                "COPY_ROTATION"
+        controls, chain_length = ChainSolver.compute_chain_controls(obj, topology, chain_names, self.control_count)
+        root_parent = topology.parent_name(self.root_bone)
+        unit = chain_length / len(chain_names)
+
+        #Target and Gizmo Bones in one edit session
+        target_names = [f"{pref.prefix.target_prefix}{self.root_bone}_{i:02d}" for i in range(len(controls))]
+        #targets of an earlier run with more control points
+        target_pattern = re.compile(rf"{re.escape(pref.prefix.target_prefix + self.root_bone)}_(\d{{2,}})")
+        stale_names = []
+        for name in obj.data.bones.keys():
+            match = target_pattern.fullmatch(name)
+            if match and int(match.group(1)) >= len(controls):
+                stale_names.append(name)
+        gizmo_names = [f"{pref.prefix.gizmo_prefix}{name}" for name in chain_names]
+
+        targets = [
+            dict(
+                source_bone=source_name,
+                target_bone=target_name,
+                config="target_shape",
+                parent_bone=root_parent,
+                use_connect=False,
+                position=offset,
+                length=unit * 0.5,
+                mode="CHAIN_TARGET",
+                update=True,
             )
-            con.target = obj
-            con.subtarget = target.name
-            con.target_space = 'LOCAL'
-            con.owner_space = 'LOCAL'
-            con.mix_mode = 'BEFORE'
+            for target_name, (source_name, offset, _) in zip(target_names, controls)
+        ]
+        targets += [
+            dict(
+                source_bone=bone_name,
+                target_bone=gizmo_name,
+                config="gizmo_shape",
+                parent_bone=gizmo_names[i - 1] if i > 0 else root_parent,
+                use_connect=i > 0,
+                position=mathutils.Vector((0, 0, 0)),
+                mode="CHAIN_GIZMO",
+            )
+            for i, (bone_name, gizmo_name) in enumerate(zip(chain_names, gizmo_names))
+        ]
+        AddonFunctions.ensure_targets(obj, targets, remove=stale_names)
 
-        self.report({'INFO'}, f"Generate Constraint For Finger")
+        for gizmo_name in gizmo_names:
+            obj.data.bones[gizmo_name].inherit_scale = 'ALIGNED'
+
+        #Curve
+        curve_obj = AddonFunctions.ensure_hook_curve(
+            context,
+            obj,
+            f"{obj.name} {self.root_bone} Chain Curve",
+            [point for _, _, point in controls],
+            target_names,
+        )
+
+        #Constraints
+        with RigProfiler.profile_phase("Constraints", "constraint_write"):
+            pose_bones = obj.pose.bones
+            for bone_name, gizmo_name in zip(chain_names, gizmo_names):
+                con = AddonFunctions.get_or_create_constraint(pose_bones[bone_name], "GIZMO - ", 'COPY_ROTATION')
+                con.target = obj
+                con.subtarget = gizmo_name
+                con.use_x = con.use_y = con.use_z = True
+                con.target_space = 'LOCAL'
+                con.owner_space = 'LOCAL'
+                con.mix_mode = 'REPLACE'
+                con.influence = self.influence
+
+            con = AddonFunctions.get_or_create_constraint(pose_bones[gizmo_names[-1]], "", 'SPLINE_IK')
+            con.target = curve_obj
+            con.chain_count = len(chain_names)
+            con.use_curve_radius = True
+            con.y_scale_mode = 'FIT_CURVE'
+
+        self.report({'INFO'}, f"Generated Chain Controller: {len(chain_names)} bones, {len(controls)} control points")
         return {'FINISHED'}
 
 class WRYC_OT_CreateLegController(bpy.types.Operator):
@@ -1472,6 +1623,10 @@ class WRYC_OT_CreateLegController(bpy.types.Operator):
             layout.label(text="Select an Armature", icon="ERROR")
 
     def execute(self, context):
+        with RigProfiler.profile_build(self, "Leg"):
+            return self.build(context)
+
+    def build(self, context):
         obj = context.object
         pref = AddonFunctions.get_preferences()
 
@@ -1484,16 +1639,12 @@ class WRYC_OT_CreateLegController(bpy.types.Operator):
                 self.report({'ERROR'}, f"Please select the toe bone")
                 return {'CANCELLED'}
 
-        chain = []
-        pb = obj.pose.bones.get(self.foot)
-        if not pb:
+        topology = BoneTopology.get_topology(obj, refresh=True)
+        if self.foot not in topology:
             self.report({'ERROR'}, f"Foot Bone {self.foot} not found")
             return {'CANCELLED'}
 
-        chain.append(pb)
-        while pb.parent and len(chain) < self.leg_length + 1:
-            pb = pb.parent
-            chain.append(pb)
+        chain = [obj.pose.bones[name] for name in topology.ancestors(self.foot, max_count=self.leg_length + 1)]
 
         if len(chain) < self.leg_length + 1:
             self.report({'ERROR'}, f"Leg Length {self.leg_length} is too short")
@@ -1513,13 +1664,9 @@ class WRYC_OT_CreateLegController(bpy.types.Operator):
             toe_name = self.toe
             toe = obj.pose.bones.get(toe_name)
 
-        root_name = ""
-        for b in obj.pose.bones:
-            if "root" in b.name:
-                root_name = b.name
-                break
+        root_name = next((name for name in topology.names if "root" in name), "")
 
-        pole_pos = AddonFunctions.compute_pole_position(
+        pole_pos, pole_angle = PoleSolver.get_limb_pole(
             obj,
             thigh_name,
             calf_name,
@@ -1555,8 +1702,7 @@ class WRYC_OT_CreateLegController(bpy.types.Operator):
             mode="FOOT_UNDER_FLOOR",
         )
 
-        if target_foot.name == "TB_foot_l":
-            target_foot.custom_shape_rotation_euler[1] *= -1
+        AddonFunctions.flip_left_shape(target_foot)
 
         if self.is_create_toe:
             roll_toe = AddonFunctions.ensure_target(
@@ -1614,127 +1760,224 @@ class WRYC_OT_CreateLegController(bpy.types.Operator):
             mode="FOOT_TO_FLOOR"
         )
 
-        pole_angle = AddonFunctions.compute_pole_angle(
-            obj,
-            thigh_name,
-            foot_name,
-            pole_pos,
-        )
-
-        con = AddonFunctions.get_or_create_constraint(calf_pb, "LEG - ", 'IK')
-        con.target = obj
-        con.subtarget = gizmo_ankle.name
-        con.pole_target = obj
-        con.pole_subtarget = target_knee.name
-        con.pole_angle = pole_angle
-        con.chain_count = self.leg_length
-        con.use_tail = True
-        con.use_stretch = False
-        con.weight = 1.0
-        con.influence = 1.0
-
-        con = AddonFunctions.get_or_create_constraint(foot_pb, "OFFSET - ", 'COPY_TRANSFORMS')
-        con.target = obj
-        con.subtarget = offset_ankle.name
-        con.target_space = 'LOCAL_OWNER_ORIENT'
-        con.owner_space = 'LOCAL_WITH_PARENT'
-        con.mix_mode = 'AFTER_FULL'
-        con.influence = 1.0
-
-        con = AddonFunctions.get_or_create_constraint(offset_ankle, "TARGET - ", 'COPY_ROTATION')
-        con.target = obj
-        con.subtarget = gizmo_ankle.name
-        con.use_x = con.use_y = con.use_z = True
-        con.target_space = 'WORLD'
-        con.owner_space = 'WORLD'
-        con.mix_mode = 'REPLACE'
-        con.influence = 1.0
-
-        con = AddonFunctions.get_or_create_constraint(target_foot, "", 'FLOOR')
-        con.target = obj
-        con.subtarget = root_name
-        con.floor_location = 'FLOOR_Z'
-        con.target_space = 'WORLD'
-        con.owner_space = 'WORLD'
-
-        if self.is_create_toe:
-            roll_axis, axis_is_positive = AddonFunctions.detect_roll_axis(obj, toe_name)
-
-            if axis_is_positive:
-                toe_min, toe_max = math.radians(0), math.radians(45)
-                foot_min, foot_max = math.radians(-45), math.radians(0)
-            else:
-                toe_min, toe_max = math.radians(-45), math.radians(0)
-                foot_min, foot_max = math.radians(0), math.radians(45)
-
-            con = AddonFunctions.get_or_create_constraint(roll_toe, "ROLL - ", 'COPY_ROTATION')
+        with RigProfiler.profile_phase("Constraints", "constraint_write"):
+            con = AddonFunctions.get_or_create_constraint(calf_pb, "LEG - ", 'IK')
             con.target = obj
-            con.subtarget = roll_control.name
-            con.use_x = con.use_y = con.use_z = True
-            con.target_space = 'LOCAL'
-            con.owner_space = 'LOCAL'
-            con.mix_mode = 'REPLACE'
+            con.subtarget = gizmo_ankle.name
+            con.pole_target = obj
+            con.pole_subtarget = target_knee.name
+            con.pole_angle = pole_angle
+            con.chain_count = self.leg_length
+            con.use_tail = True
+            con.use_stretch = False
+            con.weight = 1.0
             con.influence = 1.0
 
-            con = AddonFunctions.get_or_create_constraint(roll_toe, "ROLL - ", 'LIMIT_ROTATION')
-            con.use_limit_x = con.use_limit_y = con.use_limit_z = True
-            setattr(con, f"min_{roll_axis}", toe_min)
-            setattr(con, f"max_{roll_axis}", toe_max)
-            con.use_transform_limit = True
-            con.use_legacy_behavior = True
-            con.owner_space = 'LOCAL'
+            con = AddonFunctions.get_or_create_constraint(foot_pb, "OFFSET - ", 'COPY_TRANSFORMS')
+            con.target = obj
+            con.subtarget = offset_ankle.name
+            con.target_space = 'LOCAL_OWNER_ORIENT'
+            con.owner_space = 'LOCAL_WITH_PARENT'
+            con.mix_mode = 'AFTER_FULL'
             con.influence = 1.0
 
-            con = AddonFunctions.get_or_create_constraint(roll_foot, "ROLL - ", 'COPY_ROTATION')
+            con = AddonFunctions.get_or_create_constraint(offset_ankle, "TARGET - ", 'COPY_ROTATION')
             con.target = obj
-            con.subtarget = roll_control.name
-            con.use_x = con.use_y = con.use_z = False
-            setattr(con, f"use_{roll_axis}", True)
-            con.target_space = 'LOCAL'
-            con.owner_space = 'LOCAL'
+            con.subtarget = gizmo_ankle.name
+            con.use_x = con.use_y = con.use_z = True
+            con.target_space = 'WORLD'
+            con.owner_space = 'WORLD'
             con.mix_mode = 'REPLACE'
             con.influence = 1.0
 
-            con = AddonFunctions.get_or_create_constraint(roll_foot, "ROLL - ", 'LIMIT_ROTATION')
-            con.use_limit_x = con.use_limit_y = con.use_limit_z = True
-            setattr(con, f"min_{roll_axis}", foot_min)
-            setattr(con, f"max_{roll_axis}", foot_max)
-            con.use_transform_limit = True
-            con.use_legacy_behavior = True
-            con.owner_space = 'LOCAL'
-            con.influence = 1.0
+            con = AddonFunctions.get_or_create_constraint(target_foot, "", 'FLOOR')
+            con.target = obj
+            con.subtarget = root_name
+            con.floor_location = 'FLOOR_Z'
+            con.target_space = 'WORLD'
+            con.owner_space = 'WORLD'
 
-            con = AddonFunctions.get_or_create_constraint(roll_control, "ROLL - ", 'LIMIT_ROTATION')
-            con.use_limit_x = con.use_limit_y = con.use_limit_z = True
-            con.min_x = con.min_y = con.min_z = math.radians(-45)
-            con.max_x = con.max_y = con.max_z = math.radians(45)
-            con.use_transform_limit = True
-            con.use_legacy_behavior = True
-            con.owner_space = 'LOCAL'
-            con.influence = 1.0
+            if self.is_create_toe:
+                roll_axis, axis_is_positive = AddonFunctions.detect_roll_axis(obj, toe_name)
 
-            con = AddonFunctions.get_or_create_constraint(toe_control, "ROLL - ", 'COPY_ROTATION')
-            con.target = obj
-            con.subtarget = roll_toe.name
-            setattr(con, f"use_{roll_axis}", True)
-            setattr(con, f"invert_{roll_axis}", True)
-            con.mix_mode = 'AFTER'
-            con.target_space = 'LOCAL'
-            con.owner_space = 'LOCAL'
-            con.influence = 1.0
+                if axis_is_positive:
+                    toe_min, toe_max = math.radians(0), math.radians(45)
+                    foot_min, foot_max = math.radians(-45), math.radians(0)
+                else:
+                    toe_min, toe_max = math.radians(-45), math.radians(0)
+                    foot_min, foot_max = math.radians(0), math.radians(45)
 
-            con = AddonFunctions.get_or_create_constraint(toe, "", 'COPY_ROTATION')
-            con.target = obj
-            con.subtarget = toe_control.name
-            con.use_x = con.use_x = con.use_y = con.use_z = True
-            con.target_space = 'LOCAL'
-            con.owner_space = 'LOCAL'
-            con.mix_mode = 'REPLACE'
-            con.influence = 1.0
+                con = AddonFunctions.get_or_create_constraint(roll_toe, "ROLL - ", 'COPY_ROTATION')
+                con.target = obj
+                con.subtarget = roll_control.name
+                con.use_x = con.use_y = con.use_z = True
+                con.target_space = 'LOCAL'
+                con.owner_space = 'LOCAL'
+                con.mix_mode = 'REPLACE'
+                con.influence = 1.0
+
+                con = AddonFunctions.get_or_create_constraint(roll_toe, "ROLL - ", 'LIMIT_ROTATION')
+                con.use_limit_x = con.use_limit_y = con.use_limit_z = True
+                setattr(con, f"min_{roll_axis}", toe_min)
+                setattr(con, f"max_{roll_axis}", toe_max)
+                con.use_transform_limit = True
+                con.use_legacy_behavior = True
+                con.owner_space = 'LOCAL'
+                con.influence = 1.0
+
+                con = AddonFunctions.get_or_create_constraint(roll_foot, "ROLL - ", 'COPY_ROTATION')
+                con.target = obj
+                con.subtarget = roll_control.name
+                con.use_x = con.use_y = con.use_z = False
+                setattr(con, f"use_{roll_axis}", True)
+                con.target_space = 'LOCAL'
+                con.owner_space = 'LOCAL'
+                con.mix_mode = 'REPLACE'
+                con.influence = 1.0
+
+                con = AddonFunctions.get_or_create_constraint(roll_foot, "ROLL - ", 'LIMIT_ROTATION')
+                con.use_limit_x = con.use_limit_y = con.use_limit_z = True
+                setattr(con, f"min_{roll_axis}", foot_min)
+                setattr(con, f"max_{roll_axis}", foot_max)
+                con.use_transform_limit = True
+                con.use_legacy_behavior = True
+                con.owner_space = 'LOCAL'
+                con.influence = 1.0
+
+                con = AddonFunctions.get_or_create_constraint(roll_control, "ROLL - ", 'LIMIT_ROTATION')
+                con.use_limit_x = con.use_limit_y = con.use_limit_z = True
+                con.min_x = con.min_y = con.min_z = math.radians(-45)
+                con.max_x = con.max_y = con.max_z = math.radians(45)
+                con.use_transform_limit = True
+                con.use_legacy_behavior = True
+                con.owner_space = 'LOCAL'
+                con.influence = 1.0
+
+                con = AddonFunctions.get_or_create_constraint(toe_control, "ROLL - ", 'COPY_ROTATION')
+                con.target = obj
+                con.subtarget = roll_toe.name
+                setattr(con, f"use_{roll_axis}", True)
+                setattr(con, f"invert_{roll_axis}", True)
+                con.mix_mode = 'AFTER'
+                con.target_space = 'LOCAL'
+                con.owner_space = 'LOCAL'
+                con.influence = 1.0
+
+                con = AddonFunctions.get_or_create_constraint(toe, "", 'COPY_ROTATION')
+                con.target = obj
+                con.subtarget = toe_control.name
+                con.use_x = con.use_x = con.use_y = con.use_z = True
+                con.target_space = 'LOCAL'
+                con.owner_space = 'LOCAL'
+                con.mix_mode = 'REPLACE'
+                con.influence = 1.0
 
         self.report({'INFO'}, f"Generated Controller for LEG")
         return {'FINISHED'}
 
+class WRYC_OT_CreateLimbControllers(bpy.types.Operator):
+    bl_idname = "wryc.ot_create_limb_controllers"
+    bl_label = "Limbs"
+    bl_description = "Generate Arm or Leg Controllers for every selected end bone"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    limb_type: bpy.props.EnumProperty(
+        name="Limb Type",
+        items=[
+            ('ARM', "Arm", "Selected bones are hands"),
+            ('LEG', "Leg", "Selected bones are feet, their first child is used as toe"),
+        ],
+        default='LEG',
+    )
+    limb_length: bpy.props.IntProperty(name="Limb Length", default=2, min=2)
+    use_mirror: bpy.props.BoolProperty(
+        name="Mirror Left To Right",
+        description="Generate the selected left limbs only and reflect the result to the right side",
+        default=False,
+    )
+    side_rule: bpy.props.EnumProperty(name="Side Suffix", items=MirrorRig.SIDE_RULE_ITEMS, default='LOWER_UNDERSCORE')
+    recorded_selection: bpy.props.StringProperty(options={'HIDDEN', 'SKIP_SAVE'})
+
+    def invoke(self, context, event):
+        if not AddonFunctions.check_pose_mode(context, self):
+            return {'CANCELLED'}
+        return context.window_manager.invoke_props_dialog(self, width=300)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "limb_type")
+        layout.prop(self, "limb_length")
+        layout.prop(self, "use_mirror")
+        if self.use_mirror:
+            layout.prop(self, "side_rule")
+
+    def execute(self, context):
+        with RigProfiler.profile_build(self, "Limbs"):
+            return self.build(context)
+
+    def build(self, context):
+        obj = context.object
+
+        selected_bones = AddonFunctions.get_selected_bones(context, self)
+        if not selected_bones:
+            return {'CANCELLED'}
+        RigRecipe.store_selection(self, selected_bones)
+
+        topology = BoneTopology.get_topology(obj, refresh=True)
+
+        limbs = []
+        toes = {}
+        for pb in selected_bones:
+            chain = topology.ancestors(pb.name, max_count=self.limb_length + 1)
+            if len(chain) < self.limb_length + 1:
+                self.report({'WARNING'}, f"Skip {pb.name}: Limb Length {self.limb_length} is too short")
+                continue
+
+            limbs.append((chain[-1], chain[1], pb.name))
+            children = topology.children_names(pb.name)
+            toes[pb.name] = children[0] if children else ""
+
+        if not limbs:
+            self.report({'ERROR'}, "No valid limb found")
+            return {'CANCELLED'}
+
+        side_rule = MirrorRig.SIDE_RULES[self.side_rule]
+        use_mirror = False
+        if self.use_mirror:
+            left_limbs = [limb for limb in limbs if MirrorRig.mirror_name(limb[2], side_rule)]
+            chain_names = [name for upper, _, end in left_limbs for name in topology.chain_between(upper, end)]
+            asymmetric = MirrorRig.find_asymmetric_bones(obj, chain_names + [toes[end] for _, _, end in left_limbs if toes[end]], side_rule)
+            if not left_limbs or asymmetric:
+                self.report({'WARNING'}, "Selected limbs are not symmetric, generating every selected limb")
+            else:
+                use_mirror = True
+                limbs = left_limbs
+                snapshot = MirrorRig.take_snapshot(obj)
+
+        PoleSolver.cache_limb_poles(obj, limbs)
+        try:
+            for _, _, end_name in limbs:
+                if self.limb_type == 'ARM':
+                    bpy.ops.wryc.ot_create_arm_controller('EXEC_DEFAULT',
+                        hand=end_name, arm_length=self.limb_length)
+                else:
+                    bpy.ops.wryc.ot_create_leg_controller('EXEC_DEFAULT',
+                        foot=end_name, toe=toes[end_name], leg_length=self.limb_length,
+                        is_create_toe=bool(toes[end_name]))
+        finally:
+            PoleSolver.clear_limb_pole_cache()
+
+        if use_mirror:
+            with RigProfiler.profile_phase("Mirror", "mirror"):
+                _, _, skipped = MirrorRig.mirror_generated(obj, snapshot, side_rule)
+                if skipped:
+                    self.report({'WARNING'}, f"Constraints not mirrored, add them to the right side: {', '.join(skipped[:3])}")
+            self.report({'INFO'}, f"Generate Constraint For {len(limbs)} Limbs, mirrored to the right side")
+            return {'FINISHED'}
+
+        self.report({'INFO'}, f"Generate Constraint For {len(limbs)} Limbs")
+        return {'FINISHED'}
+
 class WRYC_OT_CreateMannyController(bpy.types.Operator):
     bl_idname = "wryc.ot_create_manny_controller"
     bl_label = "UE5 Manny"
@@ -1746,9 +1989,17 @@ class WRYC_OT_CreateMannyController(bpy.types.Operator):
     gizmo_coll_name: bpy.props.StringProperty(default="Gizmo Bones", name="Gizmo Collection name")
     mechanic_coll_name: bpy.props.StringProperty(default="Mechanic Bones", name="Mechanic Collection name")
     offset_coll_name: bpy.props.StringProperty(default="Offset Bones", name="Offset Collection name")
-
+    use_mirror: bpy.props.BoolProperty(
+        name="Mirror Left To Right",
+        description="Generate the left side only and reflect the result to the right side",
+        default=False,
+    )
 
     def execute(self, context):
+        with RigProfiler.profile_build(self, "UE5 Manny"):
+            return self.build(context)
+
+    def build(self, context):
         if not AddonFunctions.check_pose_mode(context, self):
             return {'CANCELLED'}
         obj = context.active_object
@@ -1758,12 +2009,13 @@ class WRYC_OT_CreateMannyController(bpy.types.Operator):
         mirror_mode = arm.use_mirror_x
         arm.use_mirror_x = False
 
-        driver_coll = AddonFunctions.get_or_create_collection(arm, self.driver_coll_name)
-        target_coll = AddonFunctions.get_or_create_collection(arm, self.target_coll_name)
-        control_coll = AddonFunctions.get_or_create_collection(arm, self.control_coll_name)
-        gizmo_coll = AddonFunctions.get_or_create_collection(arm, self.gizmo_coll_name)
-        mechanic_coll = AddonFunctions.get_or_create_collection(arm, self.mechanic_coll_name)
-        offset_coll = AddonFunctions.get_or_create_collection(arm, self.offset_coll_name)
+        collections = BoneClassifier.CollectionLookup(arm)
+        driver_coll = collections.get(self.driver_coll_name)
+        target_coll = collections.get(self.target_coll_name)
+        control_coll = collections.get(self.control_coll_name)
+        gizmo_coll = collections.get(self.gizmo_coll_name)
+        mechanic_coll = collections.get(self.mechanic_coll_name)
+        offset_coll = collections.get(self.offset_coll_name)
 
         for coll in (target_coll, control_coll, gizmo_coll, mechanic_coll, offset_coll):
             coll.parent = driver_coll
@@ -1830,16 +2082,35 @@ class WRYC_OT_CreateMannyController(bpy.types.Operator):
             head="head", chest="spine_05", pelvis="pelvis")
         bpy.ops.wryc.ot_create_head_controller('EXEC_DEFAULT',
             head="head", chest="spine_05")
-        bpy.ops.wryc.ot_create_arm_controller('EXEC_DEFAULT',
-            hand="hand_l", arm_length=2)
-        bpy.ops.wryc.ot_create_arm_controller('EXEC_DEFAULT',
-            hand="hand_r", arm_length=2)
-        bpy.ops.wryc.ot_create_leg_controller('EXEC_DEFAULT',
-            foot="foot_l", toe="ball_l", leg_length=2, is_create_toe=True)
-        bpy.ops.wryc.ot_create_leg_controller('EXEC_DEFAULT',
-            foot="foot_r", toe="ball_r", leg_length=2, is_create_toe=True)
 
         sides = ["_l", "_r"]
+        side_rule = MirrorRig.SIDE_RULES['LOWER_UNDERSCORE']
+        use_mirror = False
+        if self.use_mirror:
+            asymmetric = MirrorRig.find_asymmetric_bones(obj, [name for name in basic_bone_names if name.endswith("_l")], side_rule)
+            if asymmetric:
+                self.report({'WARNING'}, f"Armature is not symmetric ({', '.join(asymmetric[:3])}), generating both sides")
+            else:
+                use_mirror = True
+                sides = ["_l"]
+                snapshot = MirrorRig.take_snapshot(obj)
+
+        limbs = [
+            (f"{upper}{side}", f"{lower}{side}", f"{end}{side}")
+            for upper, lower, end in (("upperarm", "lowerarm", "hand"), ("thigh", "calf", "foot"))
+            for side in sides
+        ]
+        PoleSolver.cache_limb_poles(obj, [limb for limb in limbs if all(name in obj.pose.bones for name in limb)])
+        try:
+            for side in sides:
+                bpy.ops.wryc.ot_create_arm_controller('EXEC_DEFAULT',
+                    hand=f"hand{side}", arm_length=2)
+            for side in sides:
+                bpy.ops.wryc.ot_create_leg_controller('EXEC_DEFAULT',
+                    foot=f"foot{side}", toe=f"ball{side}", leg_length=2, is_create_toe=True)
+        finally:
+            PoleSolver.clear_limb_pole_cache()
+
         finger_prefixes = ["thumb", "index", "middle", "ring", "pinky"]
         twist_prefixes = ["lowerarm_twist_02", "lowerarm_twist_01", "calf_twist_02", "calf_twist_01"]
 
@@ -1867,51 +2138,58 @@ class WRYC_OT_CreateMannyController(bpy.types.Operator):
                 False
             )
 
-            for name in finger_prefixes[2:]:
-                pb = obj.pose.bones.get(f"{name}_metacarpal{side}")
-                con = AddonFunctions.get_or_create_constraint(pb,"METACARPAL", 'COPY_ROTATION')
+            with RigProfiler.profile_phase(f"Constraints{side}", "constraint_write"):
+                for name in finger_prefixes[2:]:
+                    pb = obj.pose.bones.get(f"{name}_metacarpal{side}")
+                    con = AddonFunctions.get_or_create_constraint(pb,"METACARPAL", 'COPY_ROTATION')
+                    con.target = obj
+                    con.subtarget = control_meta.name
+                    con.use_x = con.use_y = con.use_z = True
+                    con.mix_mode = 'BEFORE'
+                    con.target_space = 'LOCAL'
+                    con.owner_space = 'LOCAL'
+                    if name == finger_prefixes[2]:
+                        con.influence = 0.1
+                    elif name == finger_prefixes[3]:
+                        con.influence = 0.5
+                    elif name == finger_prefixes[4]:
+                        con.influence = 1.0
+
+                for name in twist_prefixes:
+                    pb = obj.pose.bones.get(f"{name}{side}")
+                    con = AddonFunctions.get_or_create_constraint(pb,"TWIST - ", 'IK')
+                    con.target = obj
+                    if name.startswith("lowerarm"):
+                        con.subtarget = f"hand{side}"
+                    elif name.startswith("calf"):
+                        con.subtarget = f"foot{side}"
+                    con.chain_count = 1
+                    con.use_tail = True
+                    con.use_stretch = False
+                    con.use_location = False
+                    con.use_rotation = True
+                    if name.endswith("01"):
+                        con.influence = 0.7
+                    elif name.endswith("02"):
+                        con.influence = 0.2
+
+                pb = obj.pose.bones.get(f"clavicle{side}")
+                con = AddonFunctions.get_or_create_constraint(pb,"CONTROL - ", 'COPY_ROTATION')
                 con.target = obj
-                con.subtarget = control_meta.name
+                con.subtarget = control_clavicle.name
                 con.use_x = con.use_y = con.use_z = True
-                con.mix_mode = 'BEFORE'
+                con.mix_mode = 'REPLACE'
                 con.target_space = 'LOCAL'
                 con.owner_space = 'LOCAL'
-                if name == finger_prefixes[2]:
-                    con.influence = 0.1
-                elif name == finger_prefixes[3]:
-                    con.influence = 0.5
-                elif name == finger_prefixes[4]:
-                    con.influence = 1.0
+                con.influence = 1.0
 
-            for name in twist_prefixes:
-                pb = obj.pose.bones.get(f"{name}{side}")
-                con = AddonFunctions.get_or_create_constraint(pb,"TWIST - ", 'IK')
-                con.target = obj
-                if name.startswith("lowerarm"):
-                    con.subtarget = f"hand{side}"
-                elif name.startswith("calf"):
-                    con.subtarget = f"foot{side}"
-                con.chain_count = 1
-                con.use_tail = True
-                con.use_stretch = False
-                con.use_location = False
-                con.use_rotation = True
-                if name.endswith("01"):
-                    con.influence = 0.7
-                elif name.endswith("02"):
-                    con.influence = 0.2
-
-            pb = obj.pose.bones.get(f"clavicle{side}")
-            con = AddonFunctions.get_or_create_constraint(pb,"CONTROL - ", 'COPY_ROTATION')
-            con.target = obj
-            con.subtarget = control_clavicle.name
-            con.use_x = con.use_y = con.use_z = True
-            con.mix_mode = 'REPLACE'
-            con.target_space = 'LOCAL'
-            con.owner_space = 'LOCAL'
-            con.influence = 1.0
+        if use_mirror:
+            with RigProfiler.profile_phase("Mirror", "mirror"):
+                _, _, skipped = MirrorRig.mirror_generated(obj, snapshot, side_rule)
+                if skipped:
+                    self.report({'WARNING'}, f"Constraints not mirrored, add them to the right side: {', '.join(skipped[:3])}")
 
-        bpy.ops.object.mode_set(mode='EDIT')
+        AddonFunctions.set_mode('EDIT')
 
         head_track = arm.edit_bones.get(f"{pref.prefix.target_prefix}{pref.prefix.track_prefix}head")
         head_traget = arm.edit_bones.get(f"{pref.prefix.target_prefix}head")
@@ -1921,25 +2199,226 @@ class WRYC_OT_CreateMannyController(bpy.types.Operator):
 
         for bone in cbp_child:
             bone.parent = arm.edit_bones["root"]
-
-        bpy.ops.object.mode_set(mode='POSE')
-        for pb in obj.pose.bones:
-            if pb.name.startswith(pref.prefix.target_prefix):
-                target_coll.assign(pb.bone)
-            elif pb.name.startswith(pref.prefix.control_prefix):
-                control_coll.assign(pb.bone)
-            elif pb.name.startswith(pref.prefix.gizmo_prefix):
-                gizmo_coll.assign(pb.bone)
-            elif pb.name.startswith(pref.prefix.mechanic_prefix):
-                mechanic_coll.assign(pb.bone)
-            elif pb.name.startswith(pref.prefix.offset_prefix):
-                offset_coll.assign(pb.bone)
+        BoneTopology.invalidate_topology(arm)
+
+        AddonFunctions.set_mode('POSE')
+        with RigProfiler.profile_phase("Assign Collections", "collection_assign"):
+            BoneClassifier.assign_bones_by_prefix(arm, (
+                (pref.prefix.target_prefix, target_coll.name),
+                (pref.prefix.control_prefix, control_coll.name),
+                (pref.prefix.gizmo_prefix, gizmo_coll.name),
+                (pref.prefix.mechanic_prefix, mechanic_coll.name),
+                (pref.prefix.offset_prefix, offset_coll.name),
+            ), collections)
 
         arm.use_mirror_x = mirror_mode
 
         self.report({'INFO'}, "Generated UE5 Manny controllers")
         return {'FINISHED'}
 
+class WRYC_OT_BatchBuildRigs(bpy.types.Operator):
+    bl_idname = "wryc.ot_batch_build_rigs"
+    bl_label = "Batch Build Rigs"
+    bl_description = "Run a generator pipeline on several armatures or .blend files"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    source: bpy.props.EnumProperty(
+        name="Source",
+        items=[
+            ('SELECTED', "Selected Armatures", "Armature objects selected in this file"),
+            ('FILES', "Blend Files", "Every .blend file in a folder, built in background Blender processes"),
+        ],
+        default='SELECTED',
+    )
+    steps: bpy.props.EnumProperty(
+        name="Pipeline",
+        items=BatchBuilder.BATCH_STEP_ITEMS,
+        options={'ENUM_FLAG'},
+        default={'MANNY_DEFORM', 'MANNY_CONTROLLER'},
+    )
+    directory: bpy.props.StringProperty(name="Folder", subtype='DIR_PATH')
+    name_filter: bpy.props.StringProperty(name="Armature Name Filter", description="Only armatures whose name contains this text")
+    processes: bpy.props.IntProperty(name="Processes", default=2, min=1, max=32)
+    save_files: bpy.props.BoolProperty(name="Save Files", default=True)
+    report_path: bpy.props.StringProperty(name="Report", subtype='FILE_PATH', description="Optional json report")
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self, width=400)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "source", expand=True)
+        layout.prop(self, "steps")
+        if self.source == 'FILES':
+            layout.prop(self, "directory")
+            layout.prop(self, "name_filter")
+            layout.prop(self, "processes")
+            layout.prop(self, "save_files")
+        layout.prop(self, "report_path")
+
+    def execute(self, context):
+        steps = [step for step in BatchBuilder.BATCH_STEPS if step in self.steps]
+        if not steps:
+            self.report({'ERROR'}, "Please select pipeline steps")
+            return {'CANCELLED'}
+
+        self._steps = steps
+        self._start = time.perf_counter()
+        if self.source == 'SELECTED':
+            targets = [obj for obj in context.selected_objects if obj.type == 'ARMATURE']
+            if not targets:
+                self.report({'ERROR'}, "Please select armature objects")
+                return {'CANCELLED'}
+
+            active = context.view_layer.objects.active
+            results = [BatchBuilder.run_pipeline(context, obj, steps) for obj in targets]
+            for obj in targets:
+                obj.select_set(True)
+            context.view_layer.objects.active = active
+            return self.finish(results)
+
+        directory = bpy.path.abspath(self.directory)
+        filepaths = sorted(
+            os.path.join(directory, name) for name in os.listdir(directory) if name.lower().endswith(".blend")
+        ) if os.path.isdir(directory) else []
+        if not filepaths:
+            self.report({'ERROR'}, f"No .blend files found in {self.directory}")
+            return {'CANCELLED'}
+
+        self._workers = BatchBuilder.start_workers(filepaths, steps, self.processes, self.save_files, self.name_filter)
+        self._results = []
+        self._files_done = set()
+        self._file_count = len(filepaths)
+
+        #without a window there is no event loop to come back to, poll right here
+        if context.window is None:
+            while not BatchBuilder.workers_finished(self._workers):
+                time.sleep(0.2)
+                self.collect_results(context)
+            return self.finish(self._results)
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.5, window=context.window)
+        wm.progress_begin(0, self._file_count)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def collect_results(self, context):
+        #a worker writes all results of a file at once, so a file is never split over two polls
+        results = BatchBuilder.poll_workers(self._workers)
+        self._results.extend(results)
+        for filepath in dict.fromkeys(result["file"] for result in results):
+            self._files_done.add(filepath)
+            file_ok = all(result["ok"] for result in results if result["file"] == filepath)
+            self.report({'INFO'}, f"Batch build {len(self._files_done)}/{self._file_count}: {os.path.basename(filepath)} {'done' if file_ok else 'failed'}")
+        if results and context.window is not None:
+            context.window_manager.progress_update(len(self._files_done))
+
+    def stop_timer(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            BatchBuilder.stop_workers(self._workers)
+            self.stop_timer(context)
+            self.report({'WARNING'}, f"Batch build cancelled after {len(self._files_done)}/{self._file_count} files")
+            return {'CANCELLED'}
+
+        if event.type == 'TIMER':
+            self.collect_results(context)
+            if BatchBuilder.workers_finished(self._workers):
+                self.stop_timer(context)
+                return self.finish(self._results)
+
+        return {'PASS_THROUGH'}
+
+    def finish(self, results):
+        elapsed = time.perf_counter() - self._start
+        succeeded = sum(1 for result in results if result["ok"])
+        print(BatchBuilder.format_report(results))
+
+        if self.report_path:
+            try:
+                with open(bpy.path.abspath(self.report_path), "w", encoding="utf-8") as f:
+                    json.dump({"steps": self._steps, "time": elapsed, "results": results}, f, indent=2)
+            except OSError as e:
+                self.report({'WARNING'}, f"Failed to write report: {e}")
+
+        level = 'INFO' if succeeded == len(results) else 'WARNING'
+        self.report({level}, f"Batch build: {succeeded}/{len(results)} succeeded in {elapsed:.1f}s (details in console)")
+        return {'FINISHED'}
+
+#__RIG RECIPE__
+class WRYC_OT_SaveRigRecipe(bpy.types.Operator):
+    bl_idname = "wryc.ot_save_rig_recipe"
+    bl_label = "Save Recipe"
+    bl_description = "Save the generators run in this session with their parameters as a rig recipe"
+
+    filepath: bpy.props.StringProperty(
+        subtype='FILE_PATH',
+        default="rig_recipe.json",
+    )
+    filename_ext = ".json"
+
+    def execute(self, context):
+        recipe = RigRecipe.record_recipe(context.window_manager.operators)
+        if not recipe["steps"]:
+            self.report({'ERROR'}, "No generator has been run in this session")
+            return {'CANCELLED'}
+
+        if not self.filepath.lower().endswith(".json"):
+            self.filepath += ".json"
+
+        RigRecipe.save_recipe(self.filepath, recipe)
+        self.report({'INFO'}, f"Rig Recipe saved with {len(recipe['steps'])} steps")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+class WRYC_OT_RunRigRecipe(bpy.types.Operator):
+    bl_idname = "wryc.ot_run_rig_recipe"
+    bl_label = "Run Recipe"
+    bl_description = "Run a rig recipe on the active armature, steps whose inputs did not change are skipped"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    force: bpy.props.BoolProperty(name="Rebuild All", description="Run every step even if its cached result is up to date", default=False)
+
+    def execute(self, context):
+        obj = context.object
+        if not obj or obj.type != 'ARMATURE':
+            self.report({'ERROR'}, "Please select an armature")
+            return {'CANCELLED'}
+
+        try:
+            recipe = RigRecipe.load_recipe(bpy.path.abspath(self.filepath))
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Failed to load recipe: {e}")
+            return {'CANCELLED'}
+
+        with RigProfiler.profile_build(self, "Recipe"):
+            results = RigRecipe.run_recipe(context, obj, recipe, self.force)
+
+        for result in results:
+            print(f"{result['id']}: {result['status']} {result['time']:.2f}s")
+
+        skipped = sum(1 for result in results if result["status"] == "SKIPPED")
+        failed = next((result for result in results if result["status"] not in {"FINISHED", "SKIPPED"}), None)
+        if failed:
+            self.report({'ERROR'}, f"Recipe step {failed['id']} failed: {failed['status']}")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Recipe: {len(results) - skipped} steps run, {skipped} up to date")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
 #__RETARGET ACTIONS__
 class WRYC_OT_SelectMappingActions(bpy.types.Operator):
     bl_idname = "wryc.ot_select_mapping_actions"
@@ -2018,8 +2497,7 @@ class WRYC_OT_ApplyMappingToActions(bpy.types.Operator):
     def execute(self, context):
         settings = context.scene.bone_mapping_settings
         selected_actions = [a.name for a in settings.mapping_actions if a.enabled]
-        bone_mappings = settings.mappings
-        bone_mappings_dict = {m.source: m.target for m in bone_mappings}
+        bone_mappings_dict = BoneMappingStore.get_mapping_dict(settings)
 
         for action_name in selected_actions:
             action = bpy.data.actions.get(action_name)
@@ -2069,7 +2547,6 @@ class WRYC_OT_BoneMappingGenerate(bpy.types.Operator):
 
     def execute(self, context):
         props = context.scene.bone_mapping_settings
-        props.mappings.clear()
 
         src_names = []
         if props.source_type == 'ARMATURE' and props.source_armature:
@@ -2084,12 +2561,12 @@ class WRYC_OT_BoneMappingGenerate(bpy.types.Operator):
 
         tgt_names = [b.name for b in props.target_armature.bones]
 
+        pairs = []
         for src_name in src_names:
             matches = difflib.get_close_matches(src_name, tgt_names, n=1, cutoff=0.3)
             if matches:
-                item = props.mappings.add()
-                item.source = src_name
-                item.target = matches[0]
+                pairs.append((src_name, matches[0]))
+        BoneMappingStore.set_mapping_pairs(props, pairs)
 
         if props.mappings:
             props.active_index = 0
@@ -2142,7 +2619,7 @@ class WRYC_OT_BoneMappingExport(bpy.types.Operator):
 
     def execute(self, context):
         props = context.scene.bone_mapping_settings
-        data = [{"source": m.source, "target":m.target} for m in props.mappings]
+        data = [{"source": source, "target": target} for source, target in BoneMappingStore.get_mapping_pairs(props)]
 
         if not self.filepath.lower().endswith(".json"):
             self.filepath += ".json"
@@ -2177,11 +2654,7 @@ class WRYC_OT_BoneMappingImport(bpy.types.Operator):
         with open(self.filepath, "r", encoding='utf-8') as f:
             data = json.load(f)
 
-        props.mappings.clear()
-        for item in data:
-            map_item = props.mappings.add()
-            map_item.source = item.get("source", "")
-            map_item.target = item.get("target", "")
+        BoneMappingStore.set_mapping_pairs(props, [(item.get("source", ""), item.get("target", "")) for item in data])
 
         props.active_index = 0
         self.report({'INFO'}, "Bone Mapping Imported")
@@ -2202,52 +2675,79 @@ class WRYC_OT_RenameTool(bpy.types.Operator):
     def execute(self, context):
         props = context.scene.rename_tool
         target = props.rename_target
-        mode = props.rename_mode
-        renamed_count = 0
 
-        for obj in context.selected_objects:
-            if obj.type != 'MESH':
-                self.report({'ERROR'}, "Please selected Mesh Object")
-                return {'CANCELLED'}
+        try:
+            rename = RenameEngine.compile_rename(props, BoneMappingStore.get_mapping_pairs(context.scene.bone_mapping_settings))
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        if rename is None:
+            return {'CANCELLED'}
 
-            if target == 'VERTEX_GROUP':
-                data_list = obj.vertex_groups
+        objects = context.selected_objects
+        if any(obj.type != 'MESH' for obj in objects):
+            self.report({'ERROR'}, "Please selected Mesh Object")
+            return {'CANCELLED'}
 
-            elif target == 'SHAPE_KEY':
-                if not obj.data.shape_keys:
-                    continue
-                data_list = obj.data.shape_keys.key_blocks
-            else:
-                return {'CANCELLED'}
+        renamed_count = 0
+        renamed_objects = 0
+        conflicts = []
+        for obj in objects:
+            items = RenameEngine.get_rename_items(obj, target)
+            if items is None:
+                continue
+
+            renames, obj_conflicts = RenameEngine.plan_renames(items.keys(), rename)
+            conflicts += [(obj.name, old, new) for old, new in obj_conflicts]
+            if renames:
+                renamed_count += RenameEngine.apply_renames(items, renames)
+                renamed_objects += 1
 
+        for obj_name, old, new in conflicts:
+            print(f"{obj_name}: '{old}' -> '{new}' skipped, name already exists")
 
-            for item in data_list:
-                old_name = item.name
-                new_name = old_name
+        target_label = "vertex group" if target == 'VERTEX_GROUP' else "shape key"
+        message = f"{renamed_count} {target_label} names have been renamed on {renamed_objects} objects"
+        if conflicts:
+            self.report({'WARNING'}, f"{message}, {len(conflicts)} skipped because the name already exists (details in console)")
+        else:
+            self.report({'INFO'}, message)
+        return {'FINISHED'}
 
-                if mode == 'FIND_REPLACE':
-                    if props.find_str in old_name:
-                        new_name = old_name.replace(props.find_str, props.replace_str)
+class WRYC_OT_RenamePreview(bpy.types.Operator):
+    bl_idname = "wryc.ot_rename_preview"
+    bl_label = "Preview"
+    bl_description = "Show how many names would change on each selected mesh without renaming"
 
-                elif mode == 'SET_PREFIX_SUFFIX':
-                    new_name = props.prefix_str + old_name + props.suffix_str
+    def invoke(self, context, event):
+        props = context.scene.rename_tool
+        try:
+            rename = RenameEngine.compile_rename(props, BoneMappingStore.get_mapping_pairs(context.scene.bone_mapping_settings))
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        if rename is None:
+            return {'CANCELLED'}
 
-                elif mode == 'REMOVE_PREFIX_SUFFIX':
-                    if props.prefix_str and new_name.startswith(props.prefix_str):
-                        new_name = new_name[len(props.prefix_str):]
-                    if props.suffix_str and new_name.endswith(props.suffix_str):
-                        new_name = new_name[:-len(props.suffix_str)]
+        objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not objects:
+            self.report({'ERROR'}, "Please selected Mesh Object")
+            return {'CANCELLED'}
 
-                if new_name != old_name:
-                    if new_name in obj.vertex_groups:
-                        self.report({'WARNING'}, f"{obj.name} already exists{new_name}")
-                        continue
+        self.rows = RenameEngine.preview_renames(objects, props.rename_target, rename)
+        return context.window_manager.invoke_popup(self, width=350)
 
-                    item.name = new_name
-                    renamed_count += 1
-                    self.report({'INFO'}, f"{obj.name} has been renamed to '{new_name}'")
+    def draw(self, context):
+        layout = self.layout
+        rows = getattr(self, "rows", [])
+        layout.label(text=f"{sum(row[1] for row in rows)} names would change")
+        for obj_name, changed, conflicts in rows:
+            row = layout.row()
+            row.label(text=obj_name, icon='MESH_DATA')
+            row.label(text=f"{changed} renamed")
+            row.label(text=f"{conflicts} skipped" if conflicts else "", icon='ERROR' if conflicts else 'NONE')
 
-        self.report({'INFO'}, f"{renamed_count} vertex group names have been renamed")
+    def execute(self, context):
         return {'FINISHED'}
 
 #__Add Manny__
@@ -2262,12 +2762,20 @@ class WRYC_OT_AddUE5Manny(bpy.types.Operator):
     )
 
     def execute(self, context):
-        path = AddonFunctions.get_preferences().assets_folder
-        manny_file= os.path.join(path, "SKM_Manny.blend")
+        manny_file = AddonFunctions.get_manny_path()
         target_names = ["SKM_Manny_Simple", "root"]
         if self.import_mesh:
             target_names.append("SKM_Manny_Simple_LOD0")
 
+        if not os.path.exists(manny_file):
+            self.report({'ERROR'}, f"UE5 Manny asset not found: {manny_file}")
+            return {'CANCELLED'}
+        #listed by the startup warm-up thread, checked before opening the file
+        object_names = BlendReader.get_cached_object_names(manny_file)
+        if object_names is not None and not set(target_names).issubset(object_names):
+            self.report({'ERROR'}, f"UE5 Manny objects missing in {manny_file}")
+            return {'CANCELLED'}
+
         with bpy.data.libraries.load(manny_file) as (data_from, data_to):
             data_to.objects = [name for name in data_from.objects if name in target_names]
 
@@ -1,5 +1,6 @@
 import bpy
 from ....common.types.framework import reg_order
+from ..functions import AddonFunctions, BoneMappingStore, ShapeLibraryIndex
 
 class BasePanel(object):
     bl_space_type = "VIEW_3D"
@@ -24,8 +25,12 @@ class WRYC_PT_CustomDisplayBone(BasePanel, bpy.types.Panel):
         row = box.row(align=True)
         row.menu("WRYC_MT_generate_icon_menu", icon='DOWNARROW_HLT')
         row.prop(settings, "bone_shape", expand=False, text="")
+        index = AddonFunctions.get_shape_library_index(settings.bone_shape, build=False)
+        if index and settings.bone_shape in index["objects"] and ShapeLibraryIndex.is_icon_stale(index, settings.bone_shape):
+            box.label(text="Icon is missing or older than the library", icon='INFO')
         box.prop(settings, "scale_bone_length_enable")
         box.operator("wryc.ot_custom_bone_shape")
+        box.operator("wryc.ot_dedupe_bone_shapes")
 
         box = layout.box()
         box.label(text="Color")
@@ -92,9 +97,17 @@ class WRYC_PT_GenerateConstraint(BasePanel, bpy.types.Panel):
         layout.operator("wryc.ot_create_spine_controller")
         layout.operator("wryc.ot_create_arm_controller")
         layout.operator("wryc.ot_create_leg_controller")
+        layout.operator("wryc.ot_create_limb_controllers")
         layout.operator("wryc.ot_create_finger_controller")
+        layout.operator("wryc.ot_create_chain_controller")
         layout.operator("wryc.ot_create_manny_controller")
 
+        layout.label(text="Batch")
+        layout.operator("wryc.ot_batch_build_rigs")
+        row = layout.row(align=True)
+        row.operator("wryc.ot_save_rig_recipe")
+        row.operator("wryc.ot_run_rig_recipe")
+
     @classmethod
     def poll(cls, context: bpy.types.Context):
         return True
@@ -132,7 +145,14 @@ class WRYC_PT_RetargetActions(BasePanel, bpy.types.Panel):
             layout.separator()
 
             layout.label(text="Bone Mapping List")
-            layout.template_list("UI_UL_list", "bone_mapping_list", settings, "mappings", settings, "active_index")
+            layout.template_list("WRYC_UL_BoneMappings", "bone_mapping_list", settings, "mappings", settings, "active_index")
+            row = layout.row()
+            row.prop(settings, "use_compact_storage")
+            if settings.use_compact_storage:
+                count = BoneMappingStore.get_mapping_count(settings)
+                start = BoneMappingStore.get_page_start(settings, count)
+                row.prop(settings, "page_start")
+                row.label(text=f"{start + len(settings.mappings)} / {count}")
             layout.operator("wryc.ot_bone_mapping_lock", icon='LOCKED' if settings.lock_mappings else 'UNLOCKED')
 
             row = layout.row()
@@ -140,7 +160,7 @@ class WRYC_PT_RetargetActions(BasePanel, bpy.types.Panel):
             row.prop(settings, "target_import")
 
             row = layout.row()
-            row.enabled = len(settings.mappings) > 0
+            row.enabled = BoneMappingStore.get_mapping_count(settings) > 0
             row.operator("wryc.ot_bone_mapping_import", icon='IMPORT')
             row.operator("wryc.ot_bone_mapping_export", icon='EXPORT')
 
@@ -171,15 +191,74 @@ class WRYC_PT_RenameTool(BasePanel, bpy.types.Panel):
         elif settings.rename_mode == 'REMOVE_PREFIX_SUFFIX':
             layout.prop(settings, "prefix_str")
             layout.prop(settings, "suffix_str")
+        elif settings.rename_mode == 'REGEX':
+            layout.prop(settings, "find_str", text="Pattern")
+            layout.prop(settings, "replace_str")
+        elif settings.rename_mode == 'BONE_MAPPING':
+            layout.prop(settings, "mapping_direction")
+            layout.label(text=f"{BoneMappingStore.get_mapping_count(context.scene.bone_mapping_settings)} mappings")
+        elif settings.rename_mode == 'CASE':
+            layout.prop(settings, "case_rule")
 
-        layout.operator("wryc.ot_rename_tool")
+        row = layout.row(align=True)
+        row.operator("wryc.ot_rename_preview")
+        row.operator("wryc.ot_rename_tool")
 
 #__RETARGET LIST__
-class UI_UL_list(bpy.types.UIList):
+class WRYC_UL_BoneMappings(bpy.types.UIList):
+    show_unmatched: bpy.props.BoolProperty(name="Unmatched", description="Only show rows without a valid target bone", default=False)
+    show_duplicates: bpy.props.BoolProperty(name="Duplicates", description="Only show rows whose target is used more than once", default=False)
+    sort_by_score: bpy.props.BoolProperty(name="Sort by Score", description="Weakest name matches first", default=False)
+
     def draw_item(self, context, layout, data, item, icon, active_data, active_props, index):
         if self.layout_type in {'DEFAULT', 'COMPACT'}:
+            rows = AddonFunctions.get_drawn_mapping_rows(data)
             row = layout.row()
             row.label(text=item.source)
-            row.label(text=item.target)
+            if rows["unmatched"][index]:
+                row.label(text=item.target, icon='ERROR')
+            elif rows["duplicate"][index]:
+                row.label(text=item.target, icon='DUPLICATE')
+            else:
+                row.label(text=item.target)
+            if self.sort_by_score:
+                row.label(text=f"{rows['scores'][index]:.0%}")
         elif self.layout_type =='GRID':
-            layout.label(text="")
\ No newline at end of file
+            layout.label(text="")
+
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "use_filter_invert", text="", icon='ARROW_LEFTRIGHT')
+        row = layout.row(align=True)
+        row.prop(self, "show_unmatched", toggle=True)
+        row.prop(self, "show_duplicates", toggle=True)
+        row.prop(self, "sort_by_score", toggle=True)
+
+    def filter_items(self, context, data, propname):
+        rows = AddonFunctions.get_mapping_rows(data)
+        key = (self.filter_name.lower(), self.show_unmatched, self.show_duplicates, self.sort_by_score)
+        result = rows["filters"].get(key)
+        if result is not None:
+            return result
+
+        filter_name, show_unmatched, show_duplicates, sort_by_score = key
+        flags = []
+        for search, unmatched, duplicate in zip(rows["search"], rows["unmatched"], rows["duplicate"]):
+            visible = (
+                (not filter_name or filter_name in search)
+                and (not show_unmatched or unmatched)
+                and (not show_duplicates or duplicate)
+            )
+            flags.append(self.bitflag_filter_item if visible else 0)
+
+        order = []
+        if sort_by_score:
+            scores = rows["scores"]
+            order = [0] * len(scores)
+            for position, index in enumerate(sorted(range(len(scores)), key=scores.__getitem__)):
+                order[index] = position
+
+        result = (flags, order)
+        rows["filters"][key] = result
+        return result
@@ -1,15 +1,53 @@
+import json
 import os
 import math
 
 import bpy
-from bpy.props import StringProperty, IntProperty, BoolProperty, EnumProperty, FloatVectorProperty, PointerProperty
+from bpy.props import StringProperty, IntProperty, BoolProperty, EnumProperty, FloatVectorProperty, PointerProperty, CollectionProperty
 from bpy.types import PropertyGroup ,AddonPreferences
 from ..functions import AddonFunctions
 
 from ..config import __addon_name__
 
+SHAPE_PRESETS_VERSION = 1
+
+# rot in degrees, a single scale value is uniform
+DEFAULT_SHAPE_PRESETS = {
+    #Basic
+    "root_shape": {"shape": "Root_0", "color": "THEME04", "loc": (0, 0, 0), "rot": (90, 0, 0), "scale": 100},
+    "limbs_shape": {"shape": "Circle_0", "color": "THEME03", "loc": (0, 0.15, 0), "rot": (90, 0, 0), "scale": 0.5},
+    "finger_shape": {"shape": "Circle_0", "color": "THEME03", "loc": (0, 0.1, 0), "rot": (90, 0, 0), "scale": 1},
+    "twist_shape": {"shape": "Circle_0", "color": "THEME15", "loc": (0, 0.05, 0), "rot": (90, 0, 0), "scale": 1},
+    "spine_shape": {"shape": "Roll_0", "color": "THEME03", "loc": (0, 0.05, -0.1), "rot": (-90, 0, 0), "scale": 2},
+    "joint_hand_shape": {"shape": "Ball_0", "color": "THEME03", "loc": (0, 0, 0), "rot": (90, 0, 0), "scale": 1},
+    "joint_foot_shape": {"shape": "Ball_0", "color": "THEME03", "loc": (0, 0, 0), "rot": (90, 0, 0), "scale": 0.5},
+    "clavicle_shape": {"shape": "Cube_0", "color": "THEME03", "loc": (0, 0.7, 0), "rot": (0, 0, 0), "scale": (0.2, 0.6, 0.2)},
+    "metacarpal_shape": {"shape": "Cube_0", "color": "THEME03", "loc": (0, 0.3, 0), "rot": (0, 0, 0), "scale": (0.2, 0.6, 0.2)},
+    #Offset
+    "offset_head_shape": {"shape": "Circle_1", "color": "THEME07", "loc": (0, 0.25, 0), "rot": (90, 0, 0), "scale": 0.3},
+    "offset_foot_shape": {"shape": "Circle_1", "color": "THEME07", "loc": (0, 0, 0), "rot": (90, 45, 0), "scale": 1},
+    #Gizmo
+    "gizmo_shape": {"shape": "Circle_1", "color": "THEME05", "loc": (0, 0, 0), "rot": (90, 0, 0), "scale": 1},
+    "gizmo_roll_shape": {"shape": "Ball_0", "color": "THEME05", "loc": (0, 0, 0), "rot": (0, 0, 0), "scale": 0.1},
+    #Mechanic
+    "mechanic_shape": {"shape": "Circle_1", "color": "THEME06", "loc": (0, 0, 0), "rot": (90, 45, 0), "scale": 1},
+    #Control
+    "pelvis_control_shape": {"shape": "Pelvis_0", "color": "THEME09", "loc": (0, 0, 0), "rot": (-90, 0, 0), "scale": 15},
+    "clavicle_control_shape": {"shape": "Clavicle_0", "color": "THEME09", "loc": (0, 0.1, 0.05), "rot": (90, 0, 0), "scale": 1},
+    "head_control_shape": {"shape": "Cross_0", "color": "THEME09", "loc": (0, 0.25, 0), "rot": (-90, 0, 0), "scale": 0.5},
+    "foot_control_shape": {"shape": "Cross_0", "color": "THEME09", "loc": (0, 0.15, 0), "rot": (-90, 0, 0), "scale": 0.7},
+    "ball_control_shape": {"shape": "Circle_1", "color": "THEME09", "loc": (0, 0, 0), "rot": (0, 90, 0), "scale": 1},
+    "hand_control_shape": {"shape": "Paddle_0", "color": "THEME09", "loc": (0, 0.03, 0.01), "rot": (90, 0, 90), "scale": 1.5},
+    #Target
+    "target_shape": {"shape": "Ball_0", "color": "THEME01", "loc": (0, 0, 0), "rot": (0, 0, 0), "scale": 1},
+    "finger_target_shape": {"shape": "Circle_2", "color": "THEME01", "rot": (-90, 0, 0), "scale": 0.7},
+    "hand_target_shape": {"shape": "Circle_1", "color": "THEME01", "rot": (-90, 0, 0), "scale": 1.5},
+    "foot_target_shape": {"shape": "Heel_0", "color": "THEME01", "rot": (90, 90, 0), "scale": 1},
+}
+
 class BoneShapeConfig(PropertyGroup):
     show_advanced : BoolProperty(default=False)
+    pending_shape: StringProperty(options={'HIDDEN'})
     shape: EnumProperty(
         name="Shape",
         items=AddonFunctions.get_bone_shapes_library,
@@ -36,6 +74,21 @@ class BoneShapeConfig(PropertyGroup):
         subtype='XYZ',
         default=(1.0, 1.0, 1.0)
     )
+    source: EnumProperty(
+        name="Source",
+        items=[
+            ('LIBRARY', "Library", "Append the shape from the shape library"),
+            ('PROCEDURAL', "Procedural", "Build the shape from code, shapes without a generator still use the library"),
+        ],
+        default='LIBRARY',
+    )
+    segments: IntProperty(
+        name="Segments",
+        description="Resolution of procedural circles, arcs and balls",
+        default=32,
+        min=4,
+        max=128,
+    )
     def set(self, shape=None, color=None, loc=None, rot=None, scale=None):
         if shape is not None:
             try:
@@ -53,6 +106,45 @@ class BoneShapeConfig(PropertyGroup):
                 self.scale = (scale, scale, scale)
             else:
                 self.scale = scale
+
+    def apply(self, preset, shape_index=None):
+        #writes the enum as its raw value, a shape name that cannot be checked yet waits in pending_shape
+        shape = preset.get("shape")
+        if shape is not None:
+            if shape_index is None:
+                self.pending_shape = shape
+            else:
+                self.resolve_shape(shape, shape_index)
+        self.set(None, preset.get("color"), preset.get("loc"), preset.get("rot"), preset.get("scale"))
+        if "source" in preset:
+            try:
+                self.source = preset["source"]
+            except TypeError:
+                print(f"Warning: Source: {preset['source']} is not a shape source")
+        if "segments" in preset:
+            try:
+                self.segments = preset["segments"]
+            except TypeError:
+                print(f"Warning: Segments: {preset['segments']} is not a number")
+
+    def resolve_shape(self, shape, shape_index):
+        self.pending_shape = ""
+        if shape in shape_index:
+            self["shape"] = shape_index[shape]
+        else:
+            print(f"Warning: Shape: {shape} not found in shape library")
+
+    def to_preset(self):
+        return {
+            "shape": self.pending_shape or self.shape,
+            "color": self.color,
+            "loc": list(self.loc),
+            "rot": [round(math.degrees(r), 6) for r in self.rot],
+            "scale": list(self.scale),
+            "source": self.source,
+            "segments": self.segments,
+        }
+
 class BonePrefix(PropertyGroup):
     # Bone Prefix
     deform_prefix: StringProperty(
@@ -133,39 +225,36 @@ class GeneralBoneDisplaySettings(PropertyGroup):
         if self.is_initialized and not force:
             return
 
-        #Basic
-        self.root_shape.set("Root_0", "THEME04", loc=(0,0,0),rot=(90,0,0), scale=100)
-        self.limbs_shape.set("Circle_0", "THEME03", loc=(0,0.15,0), rot=(90,0,0), scale=0.5)
-        self.finger_shape.set("Circle_0", "THEME03", loc=(0,0.1,0), rot=(90,0,0), scale=1)
-        self.twist_shape.set("Circle_0", "THEME15", loc=(0,0.05,0), rot=(90,0,0), scale=1)
-        self.spine_shape.set("Roll_0", "THEME03", loc=(0,0.05,-0.1), rot=(-90,0,0), scale=2)
-        self.joint_hand_shape.set("Ball_0", "THEME03", loc=(0,0,0), rot=(90,0,0), scale=1)
-        self.joint_foot_shape.set("Ball_0", "THEME03", loc=(0,0,0), rot=(90,0,0), scale=0.5)
-        self.clavicle_shape.set("Cube_0", "THEME03", loc=(0,0.7,0), rot=(0,0,0), scale=(0.2,0.6,0.2))
-        self.metacarpal_shape.set("Cube_0", "THEME03", loc=(0,0.3,0), rot=(0,0,0), scale=(0.2,0.6,0.2))
-        #Offset
-        self.offset_head_shape.set("Circle_1", "THEME07", loc=(0,0.25,0), rot=(90,0,0), scale=0.3)
-        self.offset_foot_shape.set("Circle_1", "THEME07", loc=(0, 0, 0), rot=(90, 45, 0), scale=1)
-        #Gizmo
-        self.gizmo_shape.set("Circle_1", "THEME05", loc=(0,0,0), rot=(90,0,0), scale=1)
-        self.gizmo_roll_shape.set("Ball_0", "THEME05", loc=(0,0,0), rot=(0,0,0), scale=0.1)
-        #Mechanic
-        self.mechanic_shape.set("Circle_1", "THEME06", loc=(0,0,0), rot=(90,45,0), scale=1)
-        #Control
-        self.pelvis_control_shape.set("Pelvis_0", "THEME09", loc=(0,0,0), rot=(-90,0,0), scale=15)
-        self.clavicle_control_shape.set("Clavicle_0", "THEME09", loc=(0,0.1,0.05), rot=(90,0,0), scale=1)
-        self.head_control_shape.set("Cross_0", "THEME09", loc=(0,0.25,0), rot=(-90,0,0), scale=0.5)
-        self.foot_control_shape.set("Cross_0", "THEME09", loc=(0,0.15,0), rot=(-90,0,0), scale=0.7)
-        self.ball_control_shape.set("Circle_1", "THEME09", loc=(0,0,0), rot=(0,90,0), scale=1)
-        self.hand_control_shape.set("Paddle_0", "THEME09", loc=(0,0.03,0.01), rot=(90,0,90), scale=1.5)
-        #Target
-        self.target_shape.set("Ball_0", "THEME01", loc=(0,0,0), rot=(0,0,0), scale=1)
-        self.finger_target_shape.set("Circle_2","THEME01", rot=(-90,0,0), scale=0.7)
-        self.hand_target_shape.set("Circle_1", "THEME01", rot=(-90,0,0), scale=1.5)
-        self.foot_target_shape.set("Heel_0", "THEME01", rot=(90,90,0), scale=1)
-
+        self.apply_presets(DEFAULT_SHAPE_PRESETS)
         self.is_initialized = True
 
+    def get_shape_index(self, load=False):
+        names = AddonFunctions.get_library_shape_names(load)
+        if names is None:
+            return None
+        return {name: index for index, name in enumerate(names)}
+
+    def apply_presets(self, presets):
+        #one pass over the configs, shapes are only validated when the library names are already cached
+        shape_index = self.get_shape_index()
+        for config_name, preset in presets.items():
+            config = getattr(self, config_name, None)
+            if isinstance(config, BoneShapeConfig):
+                config.apply(preset, shape_index)
+
+    def resolve_pending_shapes(self):
+        configs = [getattr(self, name) for name in DEFAULT_SHAPE_PRESETS if getattr(self, name).pending_shape]
+        if not configs:
+            return
+        shape_index = self.get_shape_index(load=True)
+        if shape_index is None:
+            return
+        for config in configs:
+            config.resolve_shape(config.pending_shape, shape_index)
+
+    def export_presets(self):
+        return {name: getattr(self, name).to_preset() for name in DEFAULT_SHAPE_PRESETS}
+
 class WRYC_OT_ResetGeneralDefaults(bpy.types.Operator):
     bl_idname = "wryc.reset_general_defaults"
     bl_label = "Reset General Defaults"
@@ -173,7 +262,126 @@ class WRYC_OT_ResetGeneralDefaults(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        AddonFunctions.get_preferences().general.set_defaults(force=True)
+        general = AddonFunctions.get_preferences().general
+        general.set_defaults(force=True)
+        general.resolve_pending_shapes()
+        return {'FINISHED'}
+
+class WRYC_OT_ExportShapePresets(bpy.types.Operator):
+    bl_idname = "wryc.export_shape_presets"
+    bl_label = "Export Presets"
+    bl_description = "Export all bone shape configs as one json file"
+
+    filepath: bpy.props.StringProperty(
+        subtype='FILE_PATH',
+        default="bone_shape_presets.json",
+    )
+    filename_ext = ".json"
+
+    def execute(self, context):
+        general = AddonFunctions.get_preferences().general
+        data = {"version": SHAPE_PRESETS_VERSION, "shapes": general.export_presets()}
+
+        if not self.filepath.lower().endswith(".json"):
+            self.filepath += ".json"
+
+        with open(self.filepath, "w", encoding='utf-8') as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+
+        self.report({'INFO'}, "Bone Shape Presets Exported")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+class WRYC_OT_ImportShapePresets(bpy.types.Operator):
+    bl_idname = "wryc.import_shape_presets"
+    bl_label = "Import Presets"
+    bl_description = "Import bone shape configs from a json file"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+
+    def execute(self, context):
+        if not self.filepath.lower().endswith(".json"):
+            self.report({'ERROR'}, "Only .json file can be supported")
+            return {'CANCELLED'}
+
+        try:
+            with open(self.filepath, "r", encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Failed to read presets: {e}")
+            return {'CANCELLED'}
+
+        shapes = data.get("shapes") if isinstance(data, dict) else None
+        if not isinstance(shapes, dict):
+            self.report({'ERROR'}, "No bone shape presets in file")
+            return {'CANCELLED'}
+
+        general = AddonFunctions.get_preferences().general
+        try:
+            general.apply_presets({name: preset for name, preset in shapes.items() if name in DEFAULT_SHAPE_PRESETS})
+        except (AttributeError, TypeError, ValueError) as e:
+            self.report({'ERROR'}, f"Invalid bone shape preset: {e}")
+            return {'CANCELLED'}
+        general.resolve_pending_shapes()
+
+        self.report({'INFO'}, "Bone Shape Presets Imported")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+class ShapeLibraryEntry(PropertyGroup):
+    filepath: StringProperty(
+        name="Library",
+        description="Shape library .blend, shapes found here override the libraries below it",
+        subtype='FILE_PATH',
+    )
+    enabled: BoolProperty(name="Enabled", default=True)
+
+class WRYC_UL_ShapeLibraries(bpy.types.UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.prop(item, "enabled", text="")
+        row.prop(item, "filepath", text="", emboss=False)
+
+class WRYC_OT_EditShapeLibraries(bpy.types.Operator):
+    bl_idname = "wryc.edit_shape_libraries"
+    bl_label = "Edit Shape Libraries"
+    bl_description = "Add, remove or reorder shape libraries, the top library has the highest priority"
+
+    action: EnumProperty(
+        items=[
+            ('ADD', "Add", ""),
+            ('REMOVE', "Remove", ""),
+            ('UP', "Up", ""),
+            ('DOWN', "Down", ""),
+        ]
+    )
+
+    def execute(self, context):
+        pref = AddonFunctions.get_preferences()
+        libraries = pref.shape_libraries
+        index = pref.active_shape_library
+
+        if self.action == 'ADD':
+            libraries.add()
+            pref.active_shape_library = len(libraries) - 1
+        elif not 0 <= index < len(libraries):
+            return {'CANCELLED'}
+        elif self.action == 'REMOVE':
+            libraries.remove(index)
+            pref.active_shape_library = min(index, len(libraries) - 1)
+        elif self.action == 'UP' and index > 0:
+            libraries.move(index, index - 1)
+            pref.active_shape_library = index - 1
+        elif self.action == 'DOWN' and index < len(libraries) - 1:
+            libraries.move(index, index + 1)
+            pref.active_shape_library = index + 1
         return {'FINISHED'}
 
 class WRYCAddonPreferences(AddonPreferences):
@@ -187,6 +395,40 @@ class WRYCAddonPreferences(AddonPreferences):
         subtype='DIR_PATH',
         default=os.path.join(os.path.dirname(__file__), "..", "assets"),
     )
+    use_asset_cache: BoolProperty(
+        name="Local Asset Cache",
+        description="Mirror the assets folder to local disk and read from the mirror, useful when the assets live on a network share",
+        default=False,
+    )
+    asset_cache_folder: StringProperty(
+        name="Cache Folder",
+        description="Local folder for the mirror, the system temp folder is used when empty",
+        subtype='DIR_PATH',
+        default="",
+    )
+    shape_link_mode: EnumProperty(
+        name="Shape Objects",
+        description="How shapes are brought in from the libraries, every shape is loaded once and then reused",
+        items=[
+            ('APPEND', "Append", "Local copies that can be edited in this file"),
+            ('LINK', "Link", "Library data that stays in sync with the shape library"),
+        ],
+        default='APPEND',
+    )
+    shape_libraries: CollectionProperty(type=ShapeLibraryEntry)
+    active_shape_library: IntProperty()
+
+    profile_rig_build: BoolProperty(
+        name="Profile Rig Build",
+        description="Time each phase of the controller generators and report the result",
+        default=False,
+    )
+    profile_trace_path: StringProperty(
+        name="Trace File",
+        description="Optional JSON trace file written after each build, can be opened in Chrome's trace viewer",
+        subtype='FILE_PATH',
+        default="",
+    )
 
     def draw_shape_config(self, box, config, label_text):
         col = box.column(align=True)
@@ -196,7 +438,10 @@ class WRYCAddonPreferences(AddonPreferences):
 
         if config.show_advanced:
             row = col.column(align=True)
+            row.prop(config, "source", expand=True)
             row.prop(config, "shape")
+            if config.source == 'PROCEDURAL':
+                row.prop(config, "segments")
             row.prop(config, "color")
             row.prop(config, "loc")
             row.prop(config, "rot")
@@ -209,6 +454,29 @@ class WRYCAddonPreferences(AddonPreferences):
 
         layout = self.layout
         layout.prop(self, "assets_folder",text="Assets Folder")
+        row = layout.row()
+        row.prop(self, "use_asset_cache")
+        sub = row.row()
+        sub.enabled = self.use_asset_cache
+        sub.prop(self, "asset_cache_folder", text="")
+
+        layout.label(text="Shape Libraries (BoneShapesLibrary.blend in the assets folder is the base)")
+        row = layout.row()
+        row.template_list("WRYC_UL_ShapeLibraries", "", self, "shape_libraries", self, "active_shape_library", rows=3)
+        col = row.column(align=True)
+        col.operator("wryc.edit_shape_libraries", text="", icon='ADD').action = 'ADD'
+        col.operator("wryc.edit_shape_libraries", text="", icon='REMOVE').action = 'REMOVE'
+        col.separator()
+        col.operator("wryc.edit_shape_libraries", text="", icon='TRIA_UP').action = 'UP'
+        col.operator("wryc.edit_shape_libraries", text="", icon='TRIA_DOWN').action = 'DOWN'
+        layout.prop(self, "shape_link_mode", expand=True)
+
+        layout.label(text="Profiling")
+        box = layout.box()
+        box.prop(self, "profile_rig_build")
+        row = box.row()
+        row.enabled = self.profile_rig_build
+        row.prop(self, "profile_trace_path")
 
         layout = self.layout
         layout.label(text="Generated Bones' Prefix")
@@ -226,6 +494,8 @@ class WRYCAddonPreferences(AddonPreferences):
         layout.label(text="General Bone Display Settings")
         row = layout.row()
         row.operator("wryc.reset_general_defaults")
+        row.operator("wryc.import_shape_presets")
+        row.operator("wryc.export_shape_presets")
 
         #Basic
         box = layout.box()
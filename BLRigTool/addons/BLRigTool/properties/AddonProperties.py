@@ -2,7 +2,7 @@ import bpy
 import os
 from bpy.props import EnumProperty, BoolProperty, FloatProperty, StringProperty, PointerProperty, CollectionProperty, IntProperty,FloatVectorProperty
 from bpy.types import PropertyGroup
-from ..functions import AddonFunctions
+from ..functions import AddonFunctions, BoneMappingStore
 
 #__CUSTOM DISPLAY SHAPE__
 class BoneDisplaySettings(PropertyGroup):
@@ -56,13 +56,19 @@ class DeformSettings(bpy.types.PropertyGroup):
         poll=lambda self, obj: obj.type == 'ARMATURE'
     )
 
+    incremental: bpy.props.BoolProperty(
+        name="Incremental",
+        description="Only update deform bones whose source bone was added, removed or changed since the last connect",
+        default=True
+    )
+
 #__RETARGET ACTIONS__
 class ActionEntry(PropertyGroup):
     name: StringProperty()
     enabled: BoolProperty(default=False)
 class BoneMapItems(PropertyGroup):
-    source: StringProperty(name="Source Bone")
-    target: StringProperty(name="Target Bone")
+    source: StringProperty(name="Source Bone", update=BoneMappingStore.update_mapping_item)
+    target: StringProperty(name="Target Bone", update=BoneMappingStore.update_mapping_item)
 class BoneMappingSettings(PropertyGroup):
     show_mappings_settings: BoolProperty(default=True)
 
@@ -99,6 +105,19 @@ class BoneMappingSettings(PropertyGroup):
     )
     lock_mappings: BoolProperty(default=False)
 
+    use_compact_storage: BoolProperty(
+        name="Compact Storage",
+        description="Store the mapping as one string in the scene and only keep the shown page as list rows, for large mappings",
+        default=False,
+        update=BoneMappingStore.update_mapping_storage,
+    )
+    mapping_blob: StringProperty(options={'HIDDEN'})
+    page_start: IntProperty(
+        name="First Row",
+        min=0,
+        update=BoneMappingStore.update_mapping_page,
+    )
+
     last_path: StringProperty(
         name="Last Path",
         default="//bone_mappings.json",
@@ -127,9 +146,30 @@ class RenameTool(PropertyGroup):
             ('FIND_REPLACE', "Find/Replace", "Search and replace"),
             ('SET_PREFIX_SUFFIX', "Set Prefix/Suffix", "Set Prefix/Suffix"),
             ('REMOVE_PREFIX_SUFFIX', "Remove Prefix/Suffix", "Remove Prefix/Suffix"),
+            ('REGEX', "Regex", "Replace regular expression matches, groups can be used as \\1"),
+            ('BONE_MAPPING', "Apply Bone Mapping", "Rename with the bone mapping of Retarget Actions"),
+            ('CASE', "Case", "Convert the case of the names"),
         ],
         default='FIND_REPLACE',
     )
+    mapping_direction: EnumProperty(
+        name="Direction",
+        items=[
+            ('SOURCE_TO_TARGET', "Source -> Target", "Rename source bone names to target bone names"),
+            ('TARGET_TO_SOURCE', "Target -> Source", "Rename target bone names to source bone names"),
+        ],
+        default='SOURCE_TO_TARGET',
+    )
+    case_rule: EnumProperty(
+        name="Case",
+        items=[
+            ('LOWER', "lower", "lower case"),
+            ('UPPER', "UPPER", "UPPER case"),
+            ('TITLE', "Title", "Title Case"),
+            ('SWAP', "sWAP", "Swap upper and lower case"),
+        ],
+        default='LOWER',
+    )
     find_str: StringProperty(name="Find", default="")
     replace_str: StringProperty(name="Replace", default="")
     prefix_str: StringProperty(name="Prefix", default="")
@@ -0,0 +1,105 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+
+import bpy
+
+from ..config import __addon_name__
+
+#__RIG BUILD PROFILER__
+# Nested generators (e.g. UE5 Manny calling Spine/Leg through bpy.ops) share the outermost profile.
+_active_profile = None
+
+class RigBuildProfile:
+    def __init__(self, name):
+        self.name = name
+        self.start = time.perf_counter()
+        self.events = []
+        self.totals = {}
+
+    def add(self, name, category, start, end):
+        duration = end - start
+        self.events.append((name, category, start, duration))
+        total, count = self.totals.get(category, (0.0, 0))
+        self.totals[category] = (total + duration, count + 1)
+
+    def summary(self):
+        elapsed = (time.perf_counter() - self.start) * 1000.0
+        parts = [f"{self.name} build {elapsed:.1f} ms"]
+        ordered = sorted(self.totals.items(), key=lambda x: x[1][0], reverse=True)
+        for category, (total, count) in ordered:
+            if category == "generator":
+                continue
+            parts.append(f"{category} {total * 1000.0:.1f} ms ({count})")
+        return " | ".join(parts)
+
+    def write_trace(self, filepath):
+        version = ".".join(str(v) for v in getattr(bpy.app, "version", ()))
+        trace_events = []
+        for name, category, start, duration in self.events:
+            trace_events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round((start - self.start) * 1e6, 3),
+                "dur": round(duration * 1e6, 3),
+                "pid": 1,
+                "tid": 1,
+            })
+        data = {
+            "traceEvents": trace_events,
+            "displayTimeUnit": "ms",
+            "otherData": {"generator": self.name, "blender": version, "addon": __addon_name__},
+        }
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1)
+
+def get_profile_settings():
+    addon = bpy.context.preferences.addons.get(__addon_name__)
+    if addon is None:
+        return False, ""
+    pref = addon.preferences
+    return pref.profile_rig_build, bpy.path.abspath(pref.profile_trace_path)
+
+@contextmanager
+def profile_phase(name, category):
+    profile = _active_profile
+    if profile is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add(name, category, start, time.perf_counter())
+
+@contextmanager
+def profile_build(operator, name):
+    global _active_profile
+
+    if _active_profile is not None:
+        with profile_phase(name, "generator"):
+            yield
+        return
+
+    enabled, trace_path = get_profile_settings()
+    if not enabled:
+        yield
+        return
+
+    profile = RigBuildProfile(name)
+    _active_profile = profile
+    try:
+        yield
+    finally:
+        _active_profile = None
+        profile.add(name, "generator", profile.start, time.perf_counter())
+        operator.report({'INFO'}, profile.summary())
+        if trace_path:
+            try:
+                profile.write_trace(trace_path)
+            except OSError as e:
+                operator.report({'WARNING'}, f"Failed to write trace file: {e}")
@@ -1,12 +1,17 @@
 import bpy
 
-# Get the language code when addon start up
-__language_code__ = bpy.context.preferences.view.language
+# The language code is read on first use and refreshed by a msgbus subscription on the language preference
+__language_code__ = None
 
 from .dictionary import common_dictionary
 
 __dictionary__ = common_dictionary
 
+# Per language msgid -> translation index, compiled lazily from __dictionary__
+__index__ = {}
+
+_msgbus_owner = object()
+
 
 # Dictionary for translation: https://docs.blender.org/api/current/bpy.app.translations.html
 # {
@@ -24,6 +29,7 @@ __dictionary__ = common_dictionary
 def set_dictionary(new_dictionary: dict[str, dict[tuple, str]]):
     global __dictionary__
     __dictionary__ = new_dictionary
+    __index__.clear()
 
 
 # Load additional dictionary for translation
@@ -35,19 +41,68 @@ def load_dictionary(additional_dictionary: dict[str, dict[tuple, str]]):
         else:
             __dictionary__[key] = {}
             __dictionary__[key].update(additional_dictionary[key])
+    __index__.clear()
+
+
+# "*" wins over "Operator", which wins over any other context, like the lookup order of i18n()
+def compile_index(translations: dict[tuple, str]) -> dict[str, str]:
+    index = {}
+    priority = {}
+    for (context, msgid), translation in translations.items():
+        rank = 0 if context == "*" else 1 if context == "Operator" else 2
+        if rank < priority.get(msgid, 3):
+            index[msgid] = translation
+            priority[msgid] = rank
+    return index
+
+
+def get_index(language_code: str):
+    index = __index__.get(language_code)
+    if index is None:
+        if language_code not in __dictionary__:
+            return None
+        index = compile_index(__dictionary__[language_code])
+        __index__[language_code] = index
+    return index
+
+
+def refresh_language_code(*args):
+    global __language_code__
+    __language_code__ = bpy.context.preferences.view.language
+    return __language_code__
+
+
+@bpy.app.handlers.persistent
+def _resubscribe_language(*args):
+    # msgbus subscriptions are cleared when a file is loaded
+    subscribe_language()
+
+
+def subscribe_language():
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.PreferencesView, "language"),
+        owner=_msgbus_owner,
+        args=(),
+        notify=refresh_language_code,
+    )
+    refresh_language_code()
+    if _resubscribe_language not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_resubscribe_language)
+
+
+def unsubscribe_language():
+    global __language_code__
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    if _resubscribe_language in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_resubscribe_language)
+    __language_code__ = None
 
 
 # 在需要拼接字符串的地方使用i18n函数
 def i18n(content: str) -> str:
-    global __language_code__, __dictionary__
-    __language_code__ = bpy.context.preferences.view.language
-    if __language_code__ not in __dictionary__:
+    language_code = __language_code__ or refresh_language_code()
+    index = get_index(language_code)
+    if index is None:
         return content
-    tuple_contents = [("*", content), ("Operator", content)]
-    for tuple_content in tuple_contents:
-        if tuple_content in __dictionary__[__language_code__]:
-            return __dictionary__[__language_code__][tuple_content]
-    for key in __dictionary__[__language_code__]:
-        if key[1] == content:
-            return __dictionary__[__language_code__][key]
-    return content
+    return index.get(content, content)
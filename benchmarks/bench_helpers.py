@@ -0,0 +1,207 @@
+# Micro-benchmarks and sanity checks for the add-on math/bone helpers.
+#
+#   python benchmarks/bench_helpers.py [--number 200] [--output helpers.json]
+#   blender -b --factory-startup --python benchmarks/bench_helpers.py -- [--number 200]
+#
+# Outside Blender the pure-Python stand-ins in benchmarks/stubs replace bpy and mathutils.
+import argparse
+import json
+import math
+import os
+import sys
+import timeit
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, REPO_ROOT)
+
+try:
+    import bpy
+except ImportError:
+    sys.path.insert(0, os.path.join(BENCH_DIR, "stubs"))
+    import bpy
+
+import mathutils
+
+import synthetic_rigs
+from BLRigTool.addons.BLRigTool.functions import AddonFunctions, PoleSolver
+
+class ActionList:
+    # Plain stand-in for the ActionEntry CollectionProperty, identical in and outside Blender.
+    class Entry:
+        def __init__(self):
+            self.name = ""
+            self.enabled = False
+
+    def __init__(self, names=()):
+        self._items = []
+        for i, name in enumerate(names):
+            item = self.add()
+            item.name = name
+            item.enabled = i % 2 == 0
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def add(self):
+        item = ActionList.Entry()
+        self._items.append(item)
+        return item
+
+    def clear(self):
+        self._items.clear()
+
+def build_rig():
+    context = bpy.context
+    obj = synthetic_rigs.create_armature(context, "HelperBenchRig", 0, with_manny=True)
+    bpy.ops.object.mode_set(mode='POSE')
+    return obj
+
+#__SCALAR REFERENCE__
+# The per-limb pole math the add-on used before PoleSolver, kept to check and time the batch solver against.
+def compute_pole_position(obj, upper_name, lower_name, end_name, distance=0.3):
+    pb_upper = obj.matrix_world @ obj.pose.bones[upper_name].head
+    pb_lower = obj.matrix_world @ obj.pose.bones[lower_name].head
+    pb_end = obj.matrix_world @ obj.pose.bones[end_name].head
+
+    v_upper = pb_lower - pb_upper
+    v_line = pb_end - pb_upper
+
+    #projection
+    proj = v_line.dot(v_upper) / v_line.dot(v_line)
+    pb_proj = pb_upper + proj * v_line
+    pole_dir = (pb_lower - pb_proj).normalized()
+
+    if pole_dir.length < 0.0001:
+        pole_dir = (obj.matrix_world.to_3x3() @ obj.pose.bones[lower_name].x_axis).normalized()
+
+    pole_pos = pb_lower + pole_dir * distance
+
+    return pole_pos
+
+def compute_pole_angle(obj, upper_name, end_name, pole_pos_world):
+    upper = obj.pose.bones[upper_name]
+    end = obj.pose.bones[end_name]
+
+    pole_pos_pose = obj.matrix_world.inverted() @ pole_pos_world
+    upper_matrix_inv = upper.bone.matrix_local.inverted()
+    pole_local = upper_matrix_inv @ pole_pos_pose
+    head_local = upper_matrix_inv @ upper.head
+    tail_local = upper_matrix_inv @ upper.tail
+    end_tail_local = upper_matrix_inv @ end.head
+
+    pole_normal = (end_tail_local - head_local).cross(pole_local - head_local)
+    bone_dir = (tail_local - head_local).normalized()
+
+    projected_pole_axis = pole_normal.cross(tail_local - head_local)
+
+    x_axis = mathutils.Vector((1, 0, 0))
+
+    angle = x_axis.angle(projected_pole_axis)
+    if x_axis.cross(projected_pole_axis).dot(bone_dir) > 0:
+        angle = -angle
+
+    return angle
+
+#__CHECKS__
+def check_pole_position(obj):
+    pole = compute_pole_position(obj, "upperarm_l", "lowerarm_l", "hand_l", distance=0.3)
+    elbow = obj.matrix_world @ obj.pose.bones["lowerarm_l"].head
+    assert abs((pole - elbow).length - 0.3) < 1e-4, "pole target must sit 'distance' away from the elbow"
+    assert pole.y > elbow.y, "pole target must be on the bend side of the arm"
+
+    straight = compute_pole_position(obj, "thigh_twist_01_l", "thigh_twist_02_l", "calf_l")
+    assert all(math.isfinite(v) for v in straight), "straight limbs must fall back to the bone x axis"
+
+def check_pole_angle(obj):
+    pole = compute_pole_position(obj, "thigh_l", "calf_l", "foot_l")
+    angle = compute_pole_angle(obj, "thigh_l", "foot_l", pole)
+    assert -math.pi <= angle <= math.pi
+
+def check_limb_poles(obj):
+    limbs = [("upperarm_l", "lowerarm_l", "hand_l"), ("thigh_l", "calf_l", "foot_l")]
+    for (upper, lower, end), (pole, angle) in zip(limbs, PoleSolver.compute_limb_poles(obj, limbs)):
+        reference = compute_pole_position(obj, upper, lower, end)
+        assert (pole - reference).length < 1e-4, f"batch pole of {upper} differs from the per-limb result"
+        assert abs(angle - compute_pole_angle(obj, upper, end, reference)) < 1e-4
+
+def check_roll_axis(obj):
+    axis, positive = AddonFunctions.detect_roll_axis(obj, "ball_l")
+    assert axis in {"x", "y", "z"} and isinstance(positive, bool)
+
+def check_deform_bone(obj):
+    bpy.ops.object.mode_set(mode='EDIT')
+    target_pb = obj.pose.bones["upperarm_l"]
+    name = AddonFunctions.create_deform_bone(obj, target_pb, target_pb, "DEF_check", {'X': '-Y', 'Y': 'X', 'Z': 'Z'})
+    bone = obj.data.edit_bones[name]
+    assert (bone.head - target_pb.head).length < 1e-4
+    assert abs(bone.length - target_pb.length) < 1e-4
+    obj.data.edit_bones.remove(bone)
+    bpy.ops.object.mode_set(mode='POSE')
+
+def check_sort_actions():
+    actions = ActionList(["walk", "Idle", "run", "Attack"])
+    AddonFunctions.sort_actions(actions)
+    names = [item.name for item in actions]
+    assert names == ["Attack", "Idle", "run", "walk"], names
+    assert {item.name: item.enabled for item in actions}["walk"] is True
+
+#__BENCHMARKS__
+def bench_cases(obj):
+    mapping = {'X': '-Y', 'Y': 'X', 'Z': 'Z'}
+    target_pb = obj.pose.bones["upperarm_l"]
+    pole = compute_pole_position(obj, "thigh_l", "calf_l", "foot_l")
+    action_names = [f"Action_{i:04d}" for i in range(500, 0, -1)]
+
+    def deform_bone():
+        AddonFunctions.create_deform_bone(obj, target_pb, target_pb, "DEF_bench", mapping)
+
+    return {
+        "compute_pole_position": (None, lambda: compute_pole_position(obj, "thigh_l", "calf_l", "foot_l")),
+        "compute_pole_angle": (None, lambda: compute_pole_angle(obj, "thigh_l", "foot_l", pole)),
+        "compute_limb_poles[2]": (None, lambda: PoleSolver.compute_limb_poles(obj, [("upperarm_l", "lowerarm_l", "hand_l"), ("thigh_l", "calf_l", "foot_l")])),
+        "detect_roll_axis": (None, lambda: AddonFunctions.detect_roll_axis(obj, "ball_l")),
+        "create_deform_bone": ('EDIT', deform_bone),
+        "sort_actions[500]": (None, lambda: AddonFunctions.sort_actions(ActionList(action_names))),
+    }
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    parser = argparse.ArgumentParser(description="Benchmark BL Rig Tool helper functions.")
+    parser.add_argument("--number", type=int, default=200, help="Calls per timing run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="")
+    parser.add_argument("--check-only", action="store_true")
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args()
+    obj = build_rig()
+
+    check_pole_position(obj)
+    check_pole_angle(obj)
+    check_limb_poles(obj)
+    check_roll_axis(obj)
+    check_deform_bone(obj)
+    check_sort_actions()
+    print(f"Helper checks passed ({bpy.app.version_string})")
+    if args.check_only:
+        return
+
+    results = {}
+    for name, (mode, func) in bench_cases(obj).items():
+        if mode:
+            bpy.ops.object.mode_set(mode=mode)
+        best = min(timeit.repeat(func, number=args.number, repeat=args.repeat)) / args.number
+        if mode:
+            bpy.ops.object.mode_set(mode='POSE')
+        results[name] = best
+        print(f"{name:<28} {best * 1e6:>10.2f} us/call")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"meta": {"blender": bpy.app.version_string}, "results": results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
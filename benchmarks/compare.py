@@ -0,0 +1,55 @@
+import argparse
+import json
+import sys
+
+def load_results(filepath):
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def compare_results(current, baseline, threshold=1.10):
+    rows = []
+    regressions = []
+    base_results = baseline.get("results", {})
+
+    for case, result in sorted(current.get("results", {}).items()):
+        base = base_results.get(case)
+        if result.get("skipped") or base is None or base.get("skipped"):
+            rows.append((case, base.get("median") if base else None, result.get("median"), None))
+            continue
+
+        ratio = result["median"] / base["median"] if base["median"] > 0 else float("inf")
+        rows.append((case, base["median"], result["median"], ratio))
+        if ratio > threshold:
+            regressions.append(case)
+
+    return rows, regressions
+
+def format_rows(rows, threshold=1.10):
+    lines = [f"{'case':<52} {'baseline ms':>12} {'current ms':>12} {'ratio':>8}"]
+    for case, base, current, ratio in rows:
+        base_text = f"{base * 1000.0:.2f}" if base is not None else "-"
+        current_text = f"{current * 1000.0:.2f}" if current is not None else "-"
+        if ratio is None:
+            ratio_text = "-"
+        else:
+            ratio_text = f"{ratio:.2f}" + (" !" if ratio > threshold else "")
+        lines.append(f"{case:<52} {base_text:>12} {current_text:>12} {ratio_text:>8}")
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare BL Rig Tool benchmark results against a baseline.")
+    parser.add_argument("current")
+    parser.add_argument("baseline")
+    parser.add_argument("--threshold", type=float, default=1.10, help="Median ratio that counts as a regression")
+    args = parser.parse_args(argv)
+
+    rows, regressions = compare_results(load_results(args.current), load_results(args.baseline), args.threshold)
+    print(format_rows(rows, args.threshold))
+
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
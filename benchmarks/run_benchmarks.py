@@ -0,0 +1,209 @@
+# Headless rig generation benchmarks.
+#
+#   blender -b --factory-startup --python-exit-code 1 --python benchmarks/run_benchmarks.py -- \
+#       --output bench_results.json [--baseline bench_baseline.json] [--sizes 50 250 1000 5000]
+#
+# Runs offline on a CPU-only machine; nothing is rendered and no network access is needed.
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import addon_utils
+import bpy
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, REPO_ROOT)
+
+import compare
+import synthetic_rigs
+
+ADDON_MODULE = "BLRigTool"
+DEFAULT_SIZES = [50, 250, 1000, 5000]
+
+def enter_pose_mode(context, obj):
+    context.view_layer.objects.active = obj
+    obj.select_set(True)
+    bpy.ops.object.mode_set(mode='POSE')
+
+#__CASES__
+# Each case prepares a fresh scene and returns the callable to time, or None when it does not apply.
+def case_manny_deform(context, rig):
+    if rig["obj"] is None or not rig["manny"]:
+        return None
+    enter_pose_mode(context, rig["obj"])
+    return lambda: bpy.ops.wryc.ot_create_manny_deform_bones('EXEC_DEFAULT')
+
+def case_manny_controller(context, rig):
+    if rig["obj"] is None or not rig["manny"]:
+        return None
+    enter_pose_mode(context, rig["obj"])
+    return lambda: bpy.ops.wryc.ot_create_manny_controller('EXEC_DEFAULT')
+
+def case_connect_deform(context, rig):
+    if rig["obj"] is None:
+        return None
+    src = synthetic_rigs.duplicate_armature(context, rig["obj"], "BenchSource")
+    settings = context.scene.deform_settings
+    settings.src_obj = src
+    settings.tgt_obj = rig["obj"]
+    settings.incremental = False
+    return lambda: bpy.ops.wryc.ot_connect_deform_armature('EXEC_DEFAULT')
+
+def case_connect_deform_incremental(context, rig):
+    if rig["obj"] is None:
+        return None
+    src = synthetic_rigs.duplicate_armature(context, rig["obj"], "BenchSource")
+    settings = context.scene.deform_settings
+    settings.src_obj = src
+    settings.tgt_obj = rig["obj"]
+    settings.incremental = True
+    bpy.ops.wryc.ot_connect_deform_armature('EXEC_DEFAULT')
+    return lambda: bpy.ops.wryc.ot_connect_deform_armature('EXEC_DEFAULT')
+
+def case_apply_mapping(context, rig):
+    if rig["obj"] is None:
+        return None
+    action = synthetic_rigs.create_keyed_action(rig["obj"], "BenchAction")
+    settings = context.scene.bone_mapping_settings
+    settings.mapping_actions.clear()
+    entry = settings.mapping_actions.add()
+    entry.name = action.name
+    entry.enabled = True
+    settings.mappings.clear()
+    for bone in rig["obj"].data.bones:
+        item = settings.mappings.add()
+        item.source = bone.name
+        item.target = f"{bone.name}_mapped"
+    return lambda: bpy.ops.wryc.ot_apply_mapping_to_actions('EXEC_DEFAULT')
+
+def case_mapping_generate(context, rig):
+    if rig["obj"] is None:
+        return None
+    src = synthetic_rigs.duplicate_armature(context, rig["obj"], "BenchSource")
+    settings = context.scene.bone_mapping_settings
+    settings.source_type = 'ARMATURE'
+    settings.source_armature = src.data
+    settings.target_armature = rig["obj"].data
+    return lambda: bpy.ops.wryc.ot_bone_mapping_generate('EXEC_DEFAULT')
+
+def case_custom_display(context, rig):
+    if rig["obj"] is None:
+        return None
+    shapes = [item[0] for item in context.scene.bone_display_settings.bl_rna.properties["bone_shape"].enum_items]
+    if not shapes or shapes[0] == "None":
+        return None
+    context.scene.bone_display_settings.bone_shape = shapes[0]
+    enter_pose_mode(context, rig["obj"])
+    bpy.ops.pose.select_all(action='SELECT')
+    return lambda: bpy.ops.wryc.ot_custom_display_bone('EXEC_DEFAULT')
+
+CASES = {
+    "manny_deform": case_manny_deform,
+    "manny_controller": case_manny_controller,
+    "connect_deform": case_connect_deform,
+    "connect_deform_incremental": case_connect_deform_incremental,
+    "apply_mapping_to_actions": case_apply_mapping,
+    "bone_mapping_generate": case_mapping_generate,
+    "custom_display_bone": case_custom_display,
+}
+
+#__RUNNER__
+def build_rig(context, rig_name, assets_folder):
+    if rig_name == "ue5_manny":
+        obj = synthetic_rigs.load_manny(context, assets_folder)
+        return {"obj": obj, "manny": True}
+
+    size = int(rig_name)
+    with_manny = size >= len(synthetic_rigs.manny_bone_specs())
+    obj = synthetic_rigs.create_armature(context, "BenchRig", size, with_manny=with_manny)
+    return {"obj": obj, "manny": with_manny}
+
+def run_case(context, case_name, rig_name, assets_folder, repeat):
+    times = []
+    bone_count = 0
+    for _ in range(repeat):
+        synthetic_rigs.reset_scene()
+        rig = build_rig(context, rig_name, assets_folder)
+        run = CASES[case_name](context, rig)
+        if run is None:
+            return {"skipped": True}
+        bone_count = len(rig["obj"].data.bones)
+
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    return {
+        "bones": bone_count,
+        "times": times,
+        "min": min(times),
+        "median": statistics.median(times),
+    }
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description="Benchmark BL Rig Tool generators in background Blender.")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", default="", help="Compare against a saved result file")
+    parser.add_argument("--threshold", type=float, default=1.10)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--cases", nargs="+", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-manny", action="store_true", help="Skip the bundled UE5 Manny armature")
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args()
+    context = bpy.context
+
+    addon_utils.enable(ADDON_MODULE, default_set=True)
+    addon = context.preferences.addons[ADDON_MODULE]
+    addon.preferences.general.set_defaults(force=True)
+    assets_folder = addon.preferences.assets_folder
+
+    rig_names = [str(size) for size in args.sizes]
+    if not args.no_manny:
+        rig_names.append("ue5_manny")
+
+    results = {}
+    for rig_name in rig_names:
+        for case_name in args.cases:
+            key = f"{case_name}[{rig_name}]"
+            results[key] = run_case(context, case_name, rig_name, assets_folder, args.repeat)
+            result = results[key]
+            if result.get("skipped"):
+                print(f"{key:<52} skipped")
+            else:
+                print(f"{key:<52} {result['median'] * 1000.0:>10.2f} ms  ({result['bones']} bones)")
+
+    addon_module = sys.modules.get(ADDON_MODULE)
+    data = {
+        "meta": {
+            "blender": bpy.app.version_string,
+            "addon": ".".join(str(v) for v in getattr(addon_module, "bl_info", {}).get("version", ())),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    print(f"Saved benchmark results: {args.output}")
+
+    if args.baseline:
+        rows, regressions = compare.compare_results(data, compare.load_results(args.baseline), args.threshold)
+        print(compare.format_rows(rows, args.threshold))
+        if regressions:
+            raise SystemExit(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+
+if __name__ == "__main__":
+    main()
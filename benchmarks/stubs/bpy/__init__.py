@@ -0,0 +1,632 @@
+# Pure-Python stand-in for the slice of Blender's bpy module the add-on helpers touch:
+# armatures, bones, edit/pose bones, constraints, bone collections and generic collections.
+# Edit bones and bones share one data object, so no mode syncing is needed; pose bones read the rest pose.
+import math
+import os
+from types import SimpleNamespace
+
+import mathutils
+
+from . import props, types, utils
+
+#__COLLECTIONS__
+class _PropCollection:
+    def __init__(self, factory=None):
+        self._items = []
+        self._factory = factory or (lambda: SimpleNamespace(name=""))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __bool__(self):
+        return True
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return self.get(key) is not None
+        return key in self._items
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            item = self.get(key)
+            if item is None:
+                raise KeyError(f"bpy_prop_collection[key]: key \"{key}\" not found")
+            return item
+        return self._items[key]
+
+    def get(self, key, default=None):
+        for item in self._items:
+            if item.name == key:
+                return item
+        return default
+
+    def keys(self):
+        return [item.name for item in self._items]
+
+    def values(self):
+        return list(self._items)
+
+    def items(self):
+        return [(item.name, item) for item in self._items]
+
+    def find(self, key):
+        for i, item in enumerate(self._items):
+            if item.name == key:
+                return i
+        return -1
+
+    def add(self):
+        item = self._factory()
+        self._items.append(item)
+        return item
+
+    def remove(self, item):
+        if isinstance(item, int):
+            del self._items[item]
+        else:
+            self._items.remove(item)
+
+    def clear(self):
+        self._items.clear()
+
+    def foreach_get(self, attr, seq):
+        values = []
+        for item in self._items:
+            value = getattr(item, attr)
+            values.extend(value) if hasattr(value, "__iter__") else values.append(value)
+        seq[:len(values)] = values
+
+    def foreach_set(self, attr, seq):
+        values = list(seq)
+        size = len(values) // len(self._items) if self._items else 0
+        for i, item in enumerate(self._items):
+            chunk = values[i * size:(i + 1) * size]
+            setattr(item, attr, chunk if size > 1 else chunk[0])
+
+    def _unique_name(self, name):
+        if self.get(name) is None:
+            return name
+        index = 1
+        while self.get(f"{name}.{index:03d}") is not None:
+            index += 1
+        return f"{name}.{index:03d}"
+
+class _IDProperties:
+    def __getitem__(self, key):
+        return self._id_props[key]
+
+    def __setitem__(self, key, value):
+        self._id_props[key] = value
+
+    def __delitem__(self, key):
+        del self._id_props[key]
+
+    def __contains__(self, key):
+        return key in self._id_props
+
+    def get(self, key, default=None):
+        return self._id_props.get(key, default)
+
+#__ARMATURE__
+THETA_SAFE = 1.0e-5
+THETA_CRITICAL = 1.0e-9
+
+def vec_roll_to_mat3(vec, roll):
+    nor = vec.normalized()
+    x, y, z = nor
+    theta = 1.0 + y
+    theta_alt = x * x + z * z
+    rows = [[0.0] * 3 for _ in range(3)]
+    if theta > THETA_SAFE or theta_alt > THETA_CRITICAL:
+        if theta <= THETA_SAFE:
+            theta = theta_alt * 0.5 + theta_alt * theta_alt * 0.125
+        # columns: (x axis, y axis = nor, z axis)
+        cols = [
+            (1.0 - x * x / theta, -x, -x * z / theta),
+            (x, y, z),
+            (-x * z / theta, -z, 1.0 - z * z / theta),
+        ]
+    else:
+        cols = [(-1.0, 0.0, 0.0), (0.0, -1.0, 0.0), (0.0, 0.0, 1.0)]
+    for j, col in enumerate(cols):
+        for i in range(3):
+            rows[i][j] = col[i]
+    return mathutils.Matrix.Rotation(roll, 3, nor) @ mathutils.Matrix(rows)
+
+class Bone(_IDProperties):
+    def __init__(self, armature, name):
+        self.id_data = armature
+        self.name = name
+        self.parent = None
+        self._head = mathutils.Vector((0.0, 0.0, 0.0))
+        self._tail = mathutils.Vector((0.0, 1.0, 0.0))
+        self.roll = 0.0
+        self.use_deform = True
+        self.use_connect = False
+        self.inherit_scale = 'FULL'
+        self.use_inherit_rotation = True
+        self.use_local_location = True
+        self.select = False
+        self.hide = False
+        self.show_wire = False
+        self.color = SimpleNamespace(palette='DEFAULT')
+        self.collections = []
+        self._id_props = {}
+
+    def __repr__(self):
+        return f"<Bone {self.name!r}>"
+
+    @property
+    def head(self):
+        return self._head
+
+    @head.setter
+    def head(self, value):
+        self._head = mathutils.Vector(value)
+
+    @property
+    def tail(self):
+        return self._tail
+
+    @tail.setter
+    def tail(self, value):
+        self._tail = mathutils.Vector(value)
+
+    @property
+    def children(self):
+        return [bone for bone in self.id_data.bones if bone.parent is self]
+
+    @property
+    def length(self):
+        return (self.tail - self.head).length
+
+    @length.setter
+    def length(self, value):
+        direction = (self.tail - self.head).normalized()
+        self.tail = self.head + direction * value
+
+    @property
+    def matrix(self):
+        mat = vec_roll_to_mat3(self.tail - self.head, self.roll).to_4x4()
+        mat.translation = self.head
+        return mat
+
+    @matrix.setter
+    def matrix(self, value):
+        length = self.length
+        rot = value.to_3x3().normalized()
+        y_axis = rot.col[1].normalized()
+        self.head = value.translation
+        self.tail = self.head + y_axis * length
+        base_x = vec_roll_to_mat3(y_axis, 0.0).col[0]
+        x_axis = rot.col[0].normalized()
+        self.roll = math.atan2(base_x.cross(x_axis).dot(y_axis), base_x.dot(x_axis))
+
+    def align_roll(self, vector):
+        y_axis = (self.tail - self.head).normalized()
+        base = vec_roll_to_mat3(y_axis, 0.0)
+        target = mathutils.Vector(vector) - y_axis * y_axis.dot(vector)
+        if target.length:
+            z_axis = base.col[2]
+            self.roll = math.atan2(z_axis.cross(target).dot(y_axis), z_axis.dot(target))
+
+    # Data bone accessors, edit and data bones share storage here
+    @property
+    def head_local(self):
+        return self.head.copy()
+
+    @property
+    def tail_local(self):
+        return self.tail.copy()
+
+    @property
+    def matrix_local(self):
+        return self.matrix
+
+class _BoneCollection(_PropCollection):
+    def __init__(self, armature):
+        super().__init__()
+        self.id_data = armature
+        self.active = None
+
+    def new(self, name):
+        bone = Bone(self.id_data, self._unique_name(name))
+        self._items.append(bone)
+        return bone
+
+    def remove(self, bone):
+        for child in bone.children:
+            child.parent = bone.parent
+            child.use_connect = False
+        self._items.remove(bone)
+
+class BoneCollection:
+    def __init__(self, armature, name):
+        self.id_data = armature
+        self.name = name
+        self._parent = None
+        self.children = []
+        self.bones = []
+        self.is_visible = True
+
+    @property
+    def parent(self):
+        return self._parent
+
+    @parent.setter
+    def parent(self, value):
+        if self._parent is not None:
+            self._parent.children.remove(self)
+        elif self in self.id_data.collections._items:
+            self.id_data.collections._items.remove(self)
+        self._parent = value
+        if value is not None:
+            value.children.append(self)
+        else:
+            self.id_data.collections._items.append(self)
+
+    def assign(self, bone):
+        bone = getattr(bone, "bone", bone)
+        if self not in bone.collections:
+            bone.collections.append(self)
+            self.bones.append(bone)
+        return True
+
+    def unassign(self, bone):
+        bone = getattr(bone, "bone", bone)
+        if self in bone.collections:
+            bone.collections.remove(self)
+            self.bones.remove(bone)
+
+class _BoneCollections(_PropCollection):
+    def __init__(self, armature):
+        super().__init__()
+        self.id_data = armature
+
+    def _walk(self):
+        stack = list(self._items)
+        while stack:
+            coll = stack.pop()
+            yield coll
+            stack.extend(coll.children)
+
+    def get(self, key, default=None):
+        for coll in self._walk():
+            if coll.name == key:
+                return coll
+        return default
+
+    def new(self, name, parent=None):
+        coll = BoneCollection(self.id_data, name)
+        self._items.append(coll)
+        if parent is not None:
+            coll.parent = parent
+        return coll
+
+    @property
+    def all(self):
+        return list(self._walk())
+
+class Armature(_IDProperties):
+    def __init__(self, name):
+        self.name = name
+        self.bones = _BoneCollection(self)
+        self.edit_bones = self.bones
+        self.collections = _BoneCollections(self)
+        self.use_mirror_x = False
+        self.display_type = 'OCTAHEDRAL'
+        self.users = 0
+        self._id_props = {}
+
+    @property
+    def name_full(self):
+        return self.name
+
+#__POSE__
+class Constraint:
+    def __init__(self, ctype):
+        self.type = ctype
+        self.name = ctype.replace('_', ' ').title()
+        self.target = None
+        self.subtarget = ""
+        self.influence = 1.0
+        self.mute = False
+
+    @property
+    def bl_rna(self):
+        # Every plain attribute behaves like an editable RNA property, "type" is fixed at creation.
+        properties = [
+            SimpleNamespace(identifier=key, is_readonly=key == "type", type='POINTER' if key == "target" else 'STRING')
+            for key in vars(self)
+        ]
+        return SimpleNamespace(properties=properties)
+
+class _ConstraintCollection(_PropCollection):
+    def new(self, type):
+        con = Constraint(type)
+        con.name = self._unique_name(con.name)
+        self._items.append(con)
+        return con
+
+class PoseBone(_IDProperties):
+    def __init__(self, obj, bone):
+        self.id_data = obj
+        self.bone = bone
+        self.constraints = _ConstraintCollection()
+        self.custom_shape = None
+        self.custom_shape_translation = mathutils.Vector((0.0, 0.0, 0.0))
+        self.custom_shape_rotation_euler = mathutils.Vector((0.0, 0.0, 0.0))
+        self.custom_shape_scale_xyz = mathutils.Vector((1.0, 1.0, 1.0))
+        self.use_custom_shape_bone_size = True
+        self.color = SimpleNamespace(palette='DEFAULT')
+        self.custom_shape_transform = None
+        self.lock_ik_x = self.lock_ik_y = self.lock_ik_z = False
+        self.lock_location = [False, False, False]
+        self.lock_rotation = [False, False, False]
+        self.lock_rotation_w = False
+        self.lock_scale = [False, False, False]
+        self.rotation_mode = 'QUATERNION'
+        self._id_props = {}
+
+    def __repr__(self):
+        return f"<PoseBone {self.name!r}>"
+
+    @property
+    def name(self):
+        return self.bone.name
+
+    @property
+    def parent(self):
+        return self.id_data.pose.bones.get(self.bone.parent.name) if self.bone.parent else None
+
+    @property
+    def children(self):
+        return [self.id_data.pose.bones[child.name] for child in self.bone.children]
+
+    @property
+    def child(self):
+        children = self.children
+        return children[0] if children else None
+
+    @property
+    def head(self):
+        return self.bone.head.copy()
+
+    @property
+    def tail(self):
+        return self.bone.tail.copy()
+
+    @property
+    def length(self):
+        return self.bone.length
+
+    @property
+    def matrix(self):
+        return self.bone.matrix
+
+    @property
+    def x_axis(self):
+        return self.bone.matrix.col[0].to_3d()
+
+    @property
+    def y_axis(self):
+        return self.bone.matrix.col[1].to_3d()
+
+    @property
+    def z_axis(self):
+        return self.bone.matrix.col[2].to_3d()
+
+    @property
+    def select(self):
+        return self.bone.select
+
+    @select.setter
+    def select(self, value):
+        self.bone.select = value
+
+class _PoseBones(_PropCollection):
+    def __init__(self, obj):
+        super().__init__()
+        self.id_data = obj
+        self._cache = {}
+
+    def _pose_bone(self, bone):
+        pb = self._cache.get(id(bone))
+        if pb is None or pb.bone is not bone:
+            pb = PoseBone(self.id_data, bone)
+            self._cache[id(bone)] = pb
+        return pb
+
+    def __len__(self):
+        return len(self.id_data.data.bones)
+
+    def __iter__(self):
+        return iter([self._pose_bone(bone) for bone in self.id_data.data.bones])
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._pose_bone(self.id_data.data.bones[key])
+        return self._pose_bone(self.id_data.data.bones[key])
+
+    def get(self, key, default=None):
+        bone = self.id_data.data.bones.get(key)
+        return self._pose_bone(bone) if bone is not None else default
+
+#__OBJECTS__
+class Object(_IDProperties):
+    def __init__(self, name, data=None):
+        self.name = name
+        self.data = data
+        if isinstance(data, Armature):
+            self.type = 'ARMATURE'
+        elif data is None:
+            self.type = 'EMPTY'
+        else:
+            self.type = getattr(data, "_object_type", 'MESH')
+        self.pose = SimpleNamespace(bones=_PoseBones(self)) if self.type == 'ARMATURE' else None
+        self.matrix_world = mathutils.Matrix.Identity(4)
+        self.location = mathutils.Vector((0.0, 0.0, 0.0))
+        self.mode = 'OBJECT'
+        self.parent = None
+        self.users_collection = []
+        self.modifiers = _PropCollection()
+        self.vertex_groups = _PropCollection()
+        self.animation_data = None
+        self._selected = False
+        self._id_props = {}
+
+    def __repr__(self):
+        return f"<Object {self.name!r}>"
+
+    def select_set(self, state):
+        self._selected = bool(state)
+
+    def select_get(self):
+        return self._selected
+
+class _IDCollection(_PropCollection):
+    def __init__(self, factory):
+        super().__init__()
+        self._new = factory
+
+    def new(self, name, *args, **kwargs):
+        block = self._new(self._unique_name(name), *args, **kwargs)
+        self._items.append(block)
+        return block
+
+    def remove(self, block, do_unlink=True):
+        self._items.remove(block)
+        if block in context.scene.objects:
+            context.scene.objects.unlink(block)
+
+class _SceneObjects(_PropCollection):
+    def link(self, obj):
+        if obj not in self._items:
+            self._items.append(obj)
+            obj.users_collection.append(context.scene.collection)
+
+    def unlink(self, obj):
+        self._items.remove(obj)
+
+class Action:
+    def __init__(self, name):
+        self.name = name
+        self.fcurves = _PropCollection()
+        self.groups = _PropCollection()
+
+class _Libraries(_PropCollection):
+    def load(self, filepath, link=False, relative=False):
+        raise OSError(f"bpy stand-in cannot read library files: {filepath}")
+
+data = SimpleNamespace(
+    filepath="",
+    objects=_IDCollection(Object),
+    armatures=_IDCollection(Armature),
+    actions=_IDCollection(Action),
+    libraries=_Libraries(),
+)
+
+#__CONTEXT__
+class _ViewLayerObjects(_PropCollection):
+    def __init__(self):
+        super().__init__()
+        self.active = None
+
+    def __iter__(self):
+        return iter(context.scene.collection.objects)
+
+class _Context:
+    def __init__(self):
+        self.scene = SimpleNamespace(collection=SimpleNamespace(objects=_SceneObjects(), children=[]))
+        self.scene.objects = self.scene.collection.objects
+        self.view_layer = SimpleNamespace(objects=_ViewLayerObjects(), update=lambda: None)
+        self.preferences = SimpleNamespace(view=SimpleNamespace(language="en_US"), addons=_PropCollection())
+        self.window_manager = SimpleNamespace()
+
+    @property
+    def object(self):
+        return self.view_layer.objects.active
+
+    active_object = object
+
+    @property
+    def collection(self):
+        return self.scene.collection
+
+    @property
+    def mode(self):
+        obj = self.object
+        if obj is None or obj.mode == 'OBJECT':
+            return 'OBJECT'
+        if obj.mode == 'EDIT':
+            return 'EDIT_ARMATURE' if obj.type == 'ARMATURE' else 'EDIT_MESH'
+        return obj.mode
+
+    @property
+    def selected_objects(self):
+        return [obj for obj in self.scene.objects if obj.select_get()]
+
+    @property
+    def selected_pose_bones(self):
+        obj = self.object
+        if obj is None or obj.type != 'ARMATURE' or obj.mode != 'POSE':
+            return []
+        return [pb for pb in obj.pose.bones if pb.bone.select]
+
+context = _Context()
+
+#__OPERATORS__
+def _mode_set(mode='OBJECT', toggle=False):
+    obj = context.object
+    if obj is not None:
+        obj.mode = mode
+    return {'FINISHED'}
+
+def _pose_select_all(action='TOGGLE'):
+    obj = context.object
+    for bone in obj.data.bones:
+        bone.select = action == 'SELECT' or (action == 'TOGGLE' and not bone.select)
+    return {'FINISHED'}
+
+def _finished(*args, **kwargs):
+    return {'FINISHED'}
+
+class _OpNamespace:
+    def __init__(self, operators=None):
+        self._operators = operators or {}
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self._operators.get(name, _finished)
+
+ops = SimpleNamespace(
+    object=_OpNamespace({"mode_set": _mode_set}),
+    pose=_OpNamespace({"select_all": _pose_select_all}),
+    constraint=_OpNamespace(),
+    wm=_OpNamespace(),
+    render=_OpNamespace(),
+    wryc=_OpNamespace(),
+)
+
+#__APP__
+app = SimpleNamespace(
+    version=(4, 2, 0),
+    version_string="4.2.0 (bpy stand-in)",
+    background=True,
+    handlers=SimpleNamespace(load_post=[], save_post=[], depsgraph_update_post=[], persistent=lambda func: func),
+    timers=SimpleNamespace(register=_finished, unregister=_finished, is_registered=lambda f: False),
+    translations=SimpleNamespace(register=_finished, unregister=_finished, locale="en_US"),
+)
+
+def _abspath(path, start=None, library=None):
+    if path.startswith("//"):
+        return os.path.join(start or os.getcwd(), path[2:])
+    return path
+
+path = SimpleNamespace(abspath=_abspath)
+
+msgbus = SimpleNamespace(subscribe_rna=_finished, clear_by_owner=_finished)
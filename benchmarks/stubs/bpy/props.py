@@ -0,0 +1,27 @@
+# Property definitions are only recorded, nothing is registered.
+class _PropertyDeferred:
+    __slots__ = ("function", "keywords")
+
+    def __init__(self, function, keywords):
+        self.function = function
+        self.keywords = keywords
+
+    def __repr__(self):
+        return f"<_PropertyDeferred {self.function.__name__} {self.keywords}>"
+
+def _deferred(name):
+    def function(**keywords):
+        return _PropertyDeferred(function, keywords)
+    function.__name__ = name
+    return function
+
+BoolProperty = _deferred("BoolProperty")
+BoolVectorProperty = _deferred("BoolVectorProperty")
+CollectionProperty = _deferred("CollectionProperty")
+EnumProperty = _deferred("EnumProperty")
+FloatProperty = _deferred("FloatProperty")
+FloatVectorProperty = _deferred("FloatVectorProperty")
+IntProperty = _deferred("IntProperty")
+IntVectorProperty = _deferred("IntVectorProperty")
+PointerProperty = _deferred("PointerProperty")
+StringProperty = _deferred("StringProperty")
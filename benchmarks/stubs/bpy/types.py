@@ -0,0 +1,36 @@
+# Every bpy.types name resolves to a plain Python class, so add-on classes can subclass them.
+class bpy_struct:
+    bl_rna = None
+
+    def report(self, type, message):
+        print(f"{'/'.join(sorted(type))}: {message}")
+
+class PropertyGroup(bpy_struct):
+    pass
+
+class Operator(bpy_struct):
+    pass
+
+class Panel(bpy_struct):
+    pass
+
+class Menu(bpy_struct):
+    pass
+
+class Header(bpy_struct):
+    pass
+
+class UIList(bpy_struct):
+    pass
+
+class AddonPreferences(bpy_struct):
+    pass
+
+_generated = {}
+
+def __getattr__(name):
+    if name.startswith("__"):
+        raise AttributeError(name)
+    if name not in _generated:
+        _generated[name] = type(name, (bpy_struct,), {})
+    return _generated[name]
@@ -0,0 +1,24 @@
+from types import SimpleNamespace
+
+class _PreviewCollection(dict):
+    def load(self, name, filepath, filetype):
+        preview = SimpleNamespace(icon_id=len(self) + 1, filepath=filepath)
+        self[name] = preview
+        return preview
+
+    def new(self, name):
+        return self.load(name, "", 'IMAGE')
+
+    def close(self):
+        self.clear()
+
+previews = SimpleNamespace(
+    new=_PreviewCollection,
+    remove=lambda pcoll: pcoll.close(),
+)
+
+def register_class(cls):
+    cls.is_registered = True
+
+def unregister_class(cls):
+    cls.is_registered = False
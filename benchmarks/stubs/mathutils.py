@@ -0,0 +1,284 @@
+# Pure-Python stand-in for the parts of Blender's mathutils used by the add-on helpers.
+import math
+
+class Vector:
+    __slots__ = ("_v",)
+
+    def __init__(self, seq=(0.0, 0.0, 0.0)):
+        self._v = [float(v) for v in seq]
+
+    # Access
+    def __len__(self):
+        return len(self._v)
+
+    def __iter__(self):
+        return iter(self._v)
+
+    def __getitem__(self, index):
+        return self._v[index]
+
+    def __setitem__(self, index, value):
+        self._v[index] = float(value)
+
+    def __repr__(self):
+        return f"Vector(({', '.join(f'{v:.4f}' for v in self._v)}))"
+
+    def __eq__(self, other):
+        return isinstance(other, Vector) and self._v == other._v
+
+    def _get(index):
+        return property(lambda self: self._v[index], lambda self, value: self.__setitem__(index, value))
+
+    x = _get(0)
+    y = _get(1)
+    z = _get(2)
+    w = _get(3)
+    del _get
+
+    # Arithmetic
+    def __add__(self, other):
+        return Vector(a + b for a, b in zip(self._v, other))
+
+    def __sub__(self, other):
+        return Vector(a - b for a, b in zip(self._v, other))
+
+    def __mul__(self, scalar):
+        if isinstance(scalar, Vector):
+            return Vector(a * b for a, b in zip(self._v, scalar))
+        return Vector(a * scalar for a in self._v)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar):
+        return Vector(a / scalar for a in self._v)
+
+    def __neg__(self):
+        return Vector(-a for a in self._v)
+
+    def __iadd__(self, other):
+        self._v = [a + b for a, b in zip(self._v, other)]
+        return self
+
+    def __isub__(self, other):
+        self._v = [a - b for a, b in zip(self._v, other)]
+        return self
+
+    def __imul__(self, scalar):
+        self._v = [a * scalar for a in self._v]
+        return self
+
+    # Products
+    def dot(self, other):
+        return sum(a * b for a, b in zip(self._v, other))
+
+    def cross(self, other):
+        ax, ay, az = self._v[:3]
+        bx, by, bz = other[0], other[1], other[2]
+        return Vector((ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx))
+
+    @property
+    def length(self):
+        return math.sqrt(self.dot(self))
+
+    @property
+    def length_squared(self):
+        return self.dot(self)
+
+    def normalized(self):
+        length = self.length
+        if length == 0.0:
+            return Vector(self._v)
+        return Vector(a / length for a in self._v)
+
+    def normalize(self):
+        self._v = self.normalized()._v
+
+    def angle(self, other, fallback=None):
+        len_a = self.length
+        len_b = Vector(other).length
+        if len_a == 0.0 or len_b == 0.0:
+            if fallback is not None:
+                return fallback
+            raise ValueError("Vector.angle(other): zero length vectors have no valid angle")
+        cos = max(-1.0, min(1.0, self.dot(other) / (len_a * len_b)))
+        return math.acos(cos)
+
+    def copy(self):
+        return Vector(self._v)
+
+    def to_3d(self):
+        return Vector((self._v + [0.0, 0.0, 0.0])[:3])
+
+    def to_4d(self):
+        return Vector((self._v + [0.0, 0.0, 0.0])[:3] + [1.0])
+
+    def to_tuple(self, precision=-1):
+        if precision < 0:
+            return tuple(self._v)
+        return tuple(round(v, precision) for v in self._v)
+
+class _MatrixColumns:
+    __slots__ = ("_m",)
+
+    def __init__(self, matrix):
+        self._m = matrix
+
+    def __getitem__(self, index):
+        return Vector(row[index] for row in self._m._rows)
+
+    def __setitem__(self, index, value):
+        for row, v in zip(self._m._rows, value):
+            row[index] = float(v)
+
+    def __len__(self):
+        return len(self._m._rows[0])
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+class Matrix:
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows=None):
+        if rows is None:
+            rows = [[1.0 if i == j else 0.0 for j in range(4)] for i in range(4)]
+        self._rows = [[float(v) for v in row] for row in rows]
+
+    @classmethod
+    def Identity(cls, size):
+        return cls([[1.0 if i == j else 0.0 for j in range(size)] for i in range(size)])
+
+    @classmethod
+    def Translation(cls, vector):
+        mat = cls.Identity(4)
+        for i in range(3):
+            mat._rows[i][3] = float(vector[i])
+        return mat
+
+    @classmethod
+    def Rotation(cls, angle, size, axis):
+        if isinstance(axis, str):
+            axis = {"X": (1, 0, 0), "Y": (0, 1, 0), "Z": (0, 0, 1)}[axis]
+        x, y, z = Vector(axis).normalized()
+        c, s = math.cos(angle), math.sin(angle)
+        t = 1.0 - c
+        rot = cls((
+            (t * x * x + c, t * x * y - s * z, t * x * z + s * y),
+            (t * x * y + s * z, t * y * y + c, t * y * z - s * x),
+            (t * x * z - s * y, t * y * z + s * x, t * z * z + c),
+        ))
+        return rot.to_4x4() if size == 4 else rot
+
+    @classmethod
+    def LocRotScale(cls, location, rotation, scale):
+        rot = rotation.to_3x3() if rotation is not None else cls.Identity(3)
+        scale = scale if scale is not None else (1.0, 1.0, 1.0)
+        mat = cls.Identity(4)
+        for i in range(3):
+            for j in range(3):
+                mat._rows[i][j] = rot._rows[i][j] * scale[j]
+        if location is not None:
+            for i in range(3):
+                mat._rows[i][3] = float(location[i])
+        return mat
+
+    # Access
+    def __len__(self):
+        return len(self._rows)
+
+    def __iter__(self):
+        return (Vector(row) for row in self._rows)
+
+    def __getitem__(self, index):
+        return Vector(self._rows[index])
+
+    def __setitem__(self, index, value):
+        self._rows[index] = [float(v) for v in value]
+
+    def __repr__(self):
+        return "Matrix((" + ", ".join(f"({', '.join(f'{v:.4f}' for v in row)})" for row in self._rows) + "))"
+
+    @property
+    def col(self):
+        return _MatrixColumns(self)
+
+    @property
+    def row(self):
+        return [Vector(row) for row in self._rows]
+
+    @property
+    def translation(self):
+        return Vector(row[3] for row in self._rows[:3])
+
+    @translation.setter
+    def translation(self, value):
+        for i in range(3):
+            self._rows[i][3] = float(value[i])
+
+    # Products
+    def __matmul__(self, other):
+        if isinstance(other, Matrix):
+            cols = list(zip(*other._rows))
+            return Matrix([[sum(a * b for a, b in zip(row, col)) for col in cols] for row in self._rows])
+
+        values = list(other)
+        size = len(self._rows)
+        if len(values) == size:
+            return Vector(sum(a * b for a, b in zip(row, values)) for row in self._rows)
+        if size == 4 and len(values) == 3:
+            result = [sum(a * b for a, b in zip(row, values + [1.0])) for row in self._rows]
+            w = result[3] if result[3] != 0.0 else 1.0
+            return Vector(v / w for v in result[:3])
+        raise ValueError("Matrix @ Vector: size mismatch")
+
+    # Conversion
+    def copy(self):
+        return Matrix(self._rows)
+
+    def to_3x3(self):
+        return Matrix([row[:3] for row in self._rows[:3]])
+
+    def to_4x4(self):
+        mat = Matrix.Identity(4)
+        for i in range(min(3, len(self._rows))):
+            for j in range(min(3, len(self._rows[i]))):
+                mat._rows[i][j] = self._rows[i][j]
+        if len(self._rows) == 4:
+            return self.copy()
+        return mat
+
+    def to_translation(self):
+        return self.translation
+
+    def transposed(self):
+        return Matrix(list(zip(*self._rows)))
+
+    def transpose(self):
+        self._rows = [list(r) for r in zip(*self._rows)]
+
+    def inverted(self, fallback=None):
+        size = len(self._rows)
+        aug = [row[:] + [1.0 if i == j else 0.0 for j in range(size)] for i, row in enumerate(self._rows)]
+        for col in range(size):
+            pivot = max(range(col, size), key=lambda r: abs(aug[r][col]))
+            if abs(aug[pivot][col]) < 1e-12:
+                if fallback is not None:
+                    return fallback
+                raise ValueError("Matrix.inverted(): matrix does not have an inverse")
+            aug[col], aug[pivot] = aug[pivot], aug[col]
+            div = aug[col][col]
+            aug[col] = [v / div for v in aug[col]]
+            for r in range(size):
+                if r != col and aug[r][col] != 0.0:
+                    factor = aug[r][col]
+                    aug[r] = [a - factor * b for a, b in zip(aug[r], aug[col])]
+        return Matrix([row[size:] for row in aug])
+
+    def normalized(self):
+        mat = self.copy()
+        for j in range(min(3, len(mat._rows))):
+            length = math.sqrt(sum(mat._rows[i][j] ** 2 for i in range(3)))
+            if length:
+                for i in range(3):
+                    mat._rows[i][j] /= length
+        return mat
@@ -0,0 +1,132 @@
+import os
+
+import bpy
+import mathutils
+
+# UE5 Manny bone names with a rough humanoid rest pose (Z up, facing -Y, left side on +X).
+SPINE_BONES = [
+    ("root", None, (0, 0, 0), (0, 0.2, 0)),
+    ("pelvis", "root", (0, 0, 0.95), (0, 0, 1.05)),
+    ("spine_01", "pelvis", (0, 0, 1.05), (0, 0.01, 1.13)),
+    ("spine_02", "spine_01", (0, 0.01, 1.13), (0, 0.02, 1.21)),
+    ("spine_03", "spine_02", (0, 0.02, 1.21), (0, 0.02, 1.29)),
+    ("spine_04", "spine_03", (0, 0.02, 1.29), (0, 0.01, 1.37)),
+    ("spine_05", "spine_04", (0, 0.01, 1.37), (0, 0, 1.45)),
+    ("neck_01", "spine_05", (0, 0, 1.45), (0, -0.01, 1.50)),
+    ("neck_02", "neck_01", (0, -0.01, 1.50), (0, -0.01, 1.55)),
+    ("head", "neck_02", (0, -0.01, 1.55), (0, -0.01, 1.75)),
+]
+
+FINGERS = ["thumb", "index", "middle", "ring", "pinky"]
+
+def side_bones(side, s):
+    bones = [
+        (f"clavicle{side}", "spine_05", (s * 0.02, 0, 1.40), (s * 0.15, 0, 1.42)),
+        (f"upperarm{side}", f"clavicle{side}", (s * 0.15, 0, 1.42), (s * 0.42, 0.03, 1.42)),
+        (f"lowerarm{side}", f"upperarm{side}", (s * 0.42, 0.03, 1.42), (s * 0.68, 0, 1.42)),
+        (f"hand{side}", f"lowerarm{side}", (s * 0.68, 0, 1.42), (s * 0.76, 0, 1.42)),
+        (f"upperarm_twist_01{side}", f"upperarm{side}", (s * 0.24, 0.01, 1.42), (s * 0.30, 0.02, 1.42)),
+        (f"upperarm_twist_02{side}", f"upperarm{side}", (s * 0.33, 0.02, 1.42), (s * 0.39, 0.03, 1.42)),
+        (f"lowerarm_twist_01{side}", f"lowerarm{side}", (s * 0.51, 0.02, 1.42), (s * 0.57, 0.01, 1.42)),
+        (f"lowerarm_twist_02{side}", f"lowerarm{side}", (s * 0.59, 0.01, 1.42), (s * 0.65, 0, 1.42)),
+        (f"thigh{side}", "pelvis", (s * 0.1, 0, 0.95), (s * 0.1, -0.03, 0.5)),
+        (f"calf{side}", f"thigh{side}", (s * 0.1, -0.03, 0.5), (s * 0.1, 0, 0.08)),
+        (f"foot{side}", f"calf{side}", (s * 0.1, 0, 0.08), (s * 0.1, -0.12, 0.02)),
+        (f"ball{side}", f"foot{side}", (s * 0.1, -0.12, 0.02), (s * 0.1, -0.2, 0.02)),
+        (f"thigh_twist_01{side}", f"thigh{side}", (s * 0.1, -0.01, 0.8), (s * 0.1, -0.02, 0.7)),
+        (f"thigh_twist_02{side}", f"thigh{side}", (s * 0.1, -0.02, 0.65), (s * 0.1, -0.03, 0.55)),
+        (f"calf_twist_01{side}", f"calf{side}", (s * 0.1, -0.02, 0.35), (s * 0.1, -0.01, 0.25)),
+        (f"calf_twist_02{side}", f"calf{side}", (s * 0.1, -0.01, 0.2), (s * 0.1, 0, 0.1)),
+    ]
+
+    for i, finger in enumerate(FINGERS):
+        y = (i - 2) * 0.015
+        parent = f"hand{side}"
+        x = 0.70
+        if finger != "thumb":
+            bones.append((f"{finger}_metacarpal{side}", parent, (s * x, y, 1.42), (s * 0.76, y, 1.42)))
+            parent = f"{finger}_metacarpal{side}"
+            x = 0.76
+        for j in range(1, 4):
+            name = f"{finger}_0{j}{side}"
+            bones.append((name, parent, (s * x, y, 1.42), (s * (x + 0.025), y, 1.415)))
+            parent = name
+            x += 0.025
+
+    return bones
+
+def manny_bone_specs():
+    return SPINE_BONES + side_bones("_l", 1) + side_bones("_r", -1)
+
+def filler_bone_specs(count, chain_length=20, parent="spine_03"):
+    specs = []
+    chain = 0
+    while len(specs) < count:
+        prev = parent
+        base = mathutils.Vector(((chain % 10 - 4.5) * 0.02, 0.1, 1.25 - (chain // 10) * 0.01))
+        for i in range(min(chain_length, count - len(specs))):
+            name = f"tail_{chain:03d}_{i:03d}"
+            head = base + mathutils.Vector((0, i * 0.02, 0))
+            specs.append((name, prev, tuple(head), tuple(head + mathutils.Vector((0, 0.02, 0)))))
+            prev = name
+        chain += 1
+    return specs
+
+def create_armature(context, name, bone_count, with_manny=True):
+    specs = manny_bone_specs() if with_manny else []
+    specs += filler_bone_specs(max(0, bone_count - len(specs)), parent="spine_03" if with_manny else None)
+
+    arm = bpy.data.armatures.new(name)
+    obj = bpy.data.objects.new(name, arm)
+    context.scene.collection.objects.link(obj)
+    context.view_layer.objects.active = obj
+    obj.select_set(True)
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    for bone_name, parent_name, head, tail in specs:
+        eb = arm.edit_bones.new(bone_name)
+        eb.head = head
+        eb.tail = tail
+        if parent_name:
+            eb.parent = arm.edit_bones[parent_name]
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    return obj
+
+def duplicate_armature(context, obj, name):
+    new_obj = obj.copy()
+    new_obj.data = obj.data.copy()
+    new_obj.name = name
+    new_obj.data.name = name
+    context.scene.collection.objects.link(new_obj)
+    return new_obj
+
+def load_manny(context, assets_folder):
+    manny_file = os.path.join(assets_folder, "SKM_Manny.blend")
+    if not os.path.exists(manny_file):
+        return None
+
+    bpy.ops.wryc.ot_add_ue5_manny('EXEC_DEFAULT', import_mesh=False)
+    for obj in context.scene.objects:
+        if obj.type == 'ARMATURE':
+            return obj
+    return None
+
+def create_keyed_action(obj, name, frames=(1, 10)):
+    obj.animation_data_create()
+    action = bpy.data.actions.new(name)
+    obj.animation_data.action = action
+    for pb in obj.pose.bones:
+        for frame in frames:
+            pb.keyframe_insert("location", frame=frame, group=pb.name)
+    obj.animation_data.action = None
+    return action
+
+def reset_scene():
+    if bpy.context.object and bpy.context.object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for collection in (bpy.data.armatures, bpy.data.actions, bpy.data.curves, bpy.data.meshes):
+        for block in list(collection):
+            collection.remove(block)
@@ -0,0 +1,17 @@
+# Runs the add-on helpers with plain CPython: the pure-Python bpy/mathutils stand-ins in benchmarks/stubs are
+# used when the tests do not run inside Blender.
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(TESTS_DIR)
+BENCH_DIR = os.path.join(REPO_ROOT, "benchmarks")
+
+for path in (BENCH_DIR, REPO_ROOT):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+try:
+    import bpy
+except ImportError:
+    sys.path.insert(0, os.path.join(BENCH_DIR, "stubs"))
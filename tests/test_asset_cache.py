@@ -0,0 +1,104 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from BLRigTool.addons.BLRigTool.functions import AddonFunctions, AssetCache, ShapeLibraryIndex
+
+@pytest.fixture
+def roots(tmp_path):
+    share = tmp_path / "share"
+    (share / "icons").mkdir(parents=True)
+    (share / "BoneShapesLibrary.blend").write_bytes(b"BLENDER shapes")
+    (share / "icons" / "Circle_0.png").write_bytes(b"png circle")
+    (share / "notes.txt").write_text("not mirrored")
+    return str(share), str(tmp_path / "cache")
+
+def shift_mtime(path, seconds=10):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+def test_sync_mirror_states(roots):
+    share, cache = roots
+    counts = AssetCache.sync_mirror(share, cache)
+    assert counts["FETCHED"] == 2
+    assert sorted(AssetCache.get_manifest(cache)) == ["BoneShapesLibrary.blend", "icons/Circle_0.png"]
+    assert not os.path.exists(os.path.join(cache, "notes.txt"))
+
+    assert AssetCache.sync_mirror(share, cache)["UNCHANGED"] == 2
+
+    shift_mtime(os.path.join(share, "BoneShapesLibrary.blend"))
+    local_stamp = AssetCache.get_file_stamp(os.path.join(cache, "BoneShapesLibrary.blend"))
+    assert AssetCache.sync_file(share, cache, "BoneShapesLibrary.blend") == "TOUCHED"
+    assert AssetCache.get_file_stamp(os.path.join(cache, "BoneShapesLibrary.blend")) == local_stamp
+
+    with open(os.path.join(share, "icons", "Circle_0.png"), "wb") as f:
+        f.write(b"png circle, rendered again")
+    shift_mtime(os.path.join(share, "icons", "Circle_0.png"))
+    assert AssetCache.sync_file(share, cache, "icons/Circle_0.png") == "FETCHED"
+    with open(os.path.join(cache, "icons", "Circle_0.png"), "rb") as f:
+        assert f.read() == b"png circle, rendered again"
+
+    os.remove(os.path.join(share, "icons", "Circle_0.png"))
+    assert AssetCache.sync_mirror(share, cache)["REMOVED"] == 1
+    assert not os.path.exists(os.path.join(cache, "icons", "Circle_0.png"))
+
+def test_unreachable_share_keeps_the_mirror(roots, tmp_path):
+    share, cache = roots
+    AssetCache.sync_mirror(share, cache)
+    with pytest.raises(OSError):
+        AssetCache.sync_mirror(str(tmp_path / "offline"), cache)
+    assert os.path.exists(os.path.join(cache, "BoneShapesLibrary.blend"))
+
+def test_manifest_survives_a_new_session(roots):
+    share, cache = roots
+    AssetCache.sync_mirror(share, cache)
+    AssetCache._manifests.pop(cache)
+    assert sorted(AssetCache.get_manifest(cache)) == ["BoneShapesLibrary.blend", "icons/Circle_0.png"]
+
+def test_resolve_root_reads_the_share_until_the_mirror_is_filled(roots):
+    share, cache = roots
+    assert AssetCache.resolve_root(share, cache) == share
+    AssetCache._revalidating[cache].join(10)
+    assert AssetCache.resolve_root(share, cache) == cache
+
+def test_resolve_root_backs_off_after_a_failed_sync(tmp_path, monkeypatch):
+    share, cache = str(tmp_path / "offline"), str(tmp_path / "cache")
+    assert AssetCache.resolve_root(share, cache) == share
+    AssetCache._revalidating[cache].join(10)
+    assert cache in AssetCache._failures
+
+    started = []
+    monkeypatch.setattr(AssetCache, "revalidate_async", lambda *args: started.append(args))
+    assert AssetCache.resolve_root(share, cache) == share
+    assert started == []
+
+    monkeypatch.setattr(AssetCache, "RETRY_INTERVAL", -1.0)
+    AssetCache.resolve_root(share, cache)
+    assert started == [(share, cache)]
+
+def test_write_back_and_remove(roots):
+    share, cache = roots
+    AssetCache.sync_mirror(share, cache)
+    icon = os.path.join(cache, "icons", "Cube_0.png")
+    with open(icon, "wb") as f:
+        f.write(b"png cube")
+
+    assert AssetCache.write_back(share, cache, icon)
+    assert os.path.exists(os.path.join(share, "icons", "Cube_0.png"))
+    assert AssetCache.sync_file(share, cache, "icons/Cube_0.png") == "UNCHANGED"
+
+    assert AssetCache.remove_file(share, cache, icon)
+    assert not os.path.exists(os.path.join(share, "icons", "Cube_0.png"))
+    assert "icons/Cube_0.png" not in AssetCache.get_manifest(cache)
+    assert not AssetCache.write_back(share, cache, os.path.join(share, "outside.png"))
+
+def test_shape_library_is_warmed_from_the_finished_mirror(roots, monkeypatch):
+    share, cache = roots
+    pref = SimpleNamespace(use_asset_cache=True, assets_folder=share, asset_cache_folder=cache, shape_libraries=[])
+    monkeypatch.setattr(AddonFunctions, "get_preferences", lambda: pref)
+    warmed = []
+    monkeypatch.setattr(ShapeLibraryIndex, "warm_library", lambda blend_paths, extra_paths: warmed.append(blend_paths))
+
+    AddonFunctions.warm_shape_library().join(10)
+    assert warmed == [[os.path.join(cache, "BoneShapesLibrary.blend")]]
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+import time
+
+from BLRigTool.addons.BLRigTool.functions import BatchBuilder
+
+#stands in for BatchWorker.py: one json line per file, the second file waits for "go"
+FAKE_WORKER = """
+import json, os, sys, time
+output, files = sys.argv[1], sys.argv[2:]
+with open(output, "w", encoding="utf-8") as f:
+    for index, filepath in enumerate(files):
+        while index and not os.path.exists(output + ".go"):
+            time.sleep(0.01)
+        f.write(json.dumps([{"file": filepath, "object": "Armature", "ok": True, "steps": [], "time": 0.0}]) + "\\n")
+        f.flush()
+"""
+
+def make_worker(tmp_path, files, script=FAKE_WORKER):
+    output = str(tmp_path / "worker.jsonl")
+    log_path = str(tmp_path / "worker.log")
+    with open(log_path, "w", encoding="utf-8") as log:
+        proc = subprocess.Popen([sys.executable, "-c", script, output, *files], stdout=log, stderr=subprocess.STDOUT)
+    return {"files": files, "output": output, "log": log_path, "proc": proc, "offset": 0, "done": set()}
+
+def poll_until(workers, condition, timeout=10.0):
+    results = []
+    deadline = time.monotonic() + timeout
+    while not condition(results) and time.monotonic() < deadline:
+        results += BatchBuilder.poll_workers(workers)
+        time.sleep(0.01)
+    return results
+
+def test_results_arrive_per_file(tmp_path):
+    workers = [make_worker(tmp_path, ["a.blend", "b.blend"])]
+
+    results = poll_until(workers, lambda results: results)
+    assert [result["file"] for result in results] == ["a.blend"]
+    assert not BatchBuilder.workers_finished(workers)
+
+    (tmp_path / "worker.jsonl.go").touch()
+    results = poll_until(workers, lambda results: BatchBuilder.workers_finished(workers))
+    assert [result["file"] for result in results] == ["b.blend"]
+    assert not (tmp_path / "worker.jsonl").exists()
+
+def test_crashed_worker_fails_its_remaining_files(tmp_path):
+    script = "import json, sys\nopen(sys.argv[1], 'w').write(json.dumps([{'file': sys.argv[2], 'object': '', 'ok': True, 'steps': [], 'time': 0.0}]) + '\\n')\nsys.exit(3)"
+    workers = [make_worker(tmp_path, ["a.blend", "b.blend"], script)]
+
+    results = poll_until(workers, lambda results: BatchBuilder.workers_finished(workers))
+    assert [(result["file"], result["ok"]) for result in results] == [("a.blend", True), ("b.blend", False)]
+    assert "exit code 3" in results[1]["error"]
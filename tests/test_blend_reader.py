@@ -0,0 +1,48 @@
+import gzip
+import os
+import shutil
+
+import pytest
+
+from BLRigTool.addons.BLRigTool.functions import BlendReader
+
+LIBRARY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "BLRigTool", "addons", "BLRigTool", "assets", "BoneShapesLibrary.blend",
+)
+
+def test_lists_the_library_objects():
+    names = BlendReader.read_object_names(LIBRARY_PATH)
+    assert len(names) == 24
+    assert {"Circle_0", "Cube_0", "Ball_0"} <= set(names)
+
+def test_gzip_file_lists_the_same_objects(tmp_path):
+    compressed = str(tmp_path / "Compressed.blend")
+    with open(LIBRARY_PATH, "rb") as src, gzip.open(compressed, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    assert BlendReader.read_object_names(compressed) == BlendReader.read_object_names(LIBRARY_PATH)
+
+def test_header():
+    with BlendReader.open_blend(LIBRARY_PATH) as f:
+        header = BlendReader.read_header(f)
+    assert header["pointer_size"] in (4, 8)
+    assert header["endian"] in ("<", ">")
+
+def test_names_are_cached_per_file_stamp(tmp_path):
+    blend_path = str(tmp_path / "Shapes.blend")
+    shutil.copy(LIBRARY_PATH, blend_path)
+    assert BlendReader.get_cached_object_names(blend_path) is None
+
+    names = BlendReader.list_object_names(blend_path)
+    assert BlendReader.get_cached_object_names(blend_path) == names
+
+    stat = os.stat(blend_path)
+    os.utime(blend_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert BlendReader.get_cached_object_names(blend_path) is None
+
+@pytest.mark.parametrize("data", [b"", b"NOTBLEND0000", b"BLENDER-v404"])
+def test_broken_files_raise_read_errors(tmp_path, data):
+    blend_path = tmp_path / "Broken.blend"
+    blend_path.write_bytes(data)
+    with pytest.raises(BlendReader.READ_ERRORS):
+        BlendReader.read_object_names(str(blend_path))
@@ -0,0 +1,17 @@
+from BLRigTool.addons.BLRigTool.functions import BoneClassifier
+
+def test_first_matching_rule_wins():
+    rules = [("CTL_", "control"), ("CTL_IK_", "ik")]
+    assert BoneClassifier.classify_bones(["CTL_IK_hand", "CTL_foot"], rules) == {"control": ["CTL_IK_hand", "CTL_foot"]}
+
+def test_longer_prefix_with_higher_priority():
+    rules = [("CTL_IK_", "ik"), ("CTL_", "control")]
+    assert BoneClassifier.classify_bones(["CTL_IK_hand", "CTL_foot"], rules) == {"ik": ["CTL_IK_hand"], "control": ["CTL_foot"]}
+
+def test_empty_prefix_matches_every_bone_at_its_priority():
+    rules = [("TGT_", "target"), ("", "other"), ("CTL_", "control")]
+    groups = BoneClassifier.classify_bones(["TGT_hand", "CTL_foot", "spine"], rules)
+    assert groups == {"target": ["TGT_hand"], "other": ["CTL_foot", "spine"]}
+
+def test_unmatched_bones_are_left_out():
+    assert BoneClassifier.classify_bones(["spine"], [("TGT_", "target")]) == {}
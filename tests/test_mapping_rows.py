@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+
+import bench_helpers
+from BLRigTool.addons.BLRigTool.functions import AddonFunctions, BoneMappingStore
+
+def make_settings(arm, pairs):
+    mappings = [SimpleNamespace(source=source, target=target) for source, target in pairs]
+    return SimpleNamespace(
+        target_armature=arm, mappings=mappings, use_compact_storage=False, mapping_blob="", page_start=0,
+        as_pointer=lambda: id(mappings),
+    )
+
+def test_renamed_bone_refreshes_the_rows():
+    arm = bench_helpers.build_rig().data
+    settings = make_settings(arm, [("Hand_L", "hand_l")])
+    assert AddonFunctions.get_mapping_rows(settings)["unmatched"] == [False]
+
+    arm.bones["hand_l"].name = "hand_left"
+    AddonFunctions.mapping_depsgraph_handler(None, SimpleNamespace(id_type_updated=lambda id_type: id_type == 'ARMATURE'))
+    assert AddonFunctions.get_mapping_rows(settings)["unmatched"] == [True]
+
+def test_other_depsgraph_updates_keep_the_rows():
+    arm = bench_helpers.build_rig().data
+    settings = make_settings(arm, [("Hand_L", "hand_l")])
+    rows = AddonFunctions.get_mapping_rows(settings)
+    AddonFunctions.mapping_depsgraph_handler(None, SimpleNamespace(id_type_updated=lambda id_type: id_type == 'OBJECT'))
+    assert AddonFunctions.get_mapping_rows(settings) is rows
+    assert AddonFunctions.get_drawn_mapping_rows(settings) is rows
+
+def test_undo_handler_refreshes_the_rows():
+    arm = bench_helpers.build_rig().data
+    settings = make_settings(arm, [("Hand_L", "hand_l")])
+    rows = AddonFunctions.get_mapping_rows(settings)
+    assert AddonFunctions.get_mapping_rows(settings) is rows
+
+    AddonFunctions.mapping_undo_handler(None, None)
+    assert AddonFunctions.get_mapping_rows(settings) is not rows
+
+def test_compact_page_flags_duplicates_on_other_pages():
+    arm = bench_helpers.build_rig().data
+    settings = make_settings(arm, [])
+    settings.use_compact_storage = True
+    settings.page_start = 1
+    BoneMappingStore.write_pairs(settings, [("Hand_L", "hand_l"), ("Foot_L", "foot_l"), ("Palm_L", "hand_l")])
+    settings.mappings = [SimpleNamespace(source=source, target=target) for source, target in [("Foot_L", "foot_l"), ("Palm_L", "hand_l")]]
+    AddonFunctions.bump_mapping_generation()
+
+    rows = AddonFunctions.get_mapping_rows(settings)
+    assert rows["duplicate"] == [False, True]
+    assert rows["search"] == ["foot_l\nfoot_l", "palm_l\nhand_l"]
@@ -0,0 +1,91 @@
+import math
+
+import bpy
+import mathutils
+import numpy as np
+import pytest
+
+import bench_helpers
+from BLRigTool.addons.BLRigTool.functions import AddonFunctions, MirrorRig
+
+@pytest.fixture
+def rig():
+    return bench_helpers.build_rig()
+
+def test_mirror_name():
+    assert MirrorRig.mirror_name("hand_l", ("_l", "_r")) == "hand_r"
+    assert MirrorRig.mirror_name("hand.L.001", (".L", ".R")) == "hand.R.001"
+    assert MirrorRig.mirror_name("hand_r", ("_l", "_r")) is None
+
+def test_limit_rotation_is_reflected_across_x(rig):
+    con = rig.pose.bones["hand_l"].constraints.new(type='LIMIT_ROTATION')
+    con.min_x, con.max_x = -0.5, 1.0
+    con.min_y, con.max_y = -0.2, 0.7
+    con.min_z, con.max_z = -0.1, 0.3
+
+    new_con = MirrorRig.clone_constraint(con, rig.pose.bones["hand_r"], ("_l", "_r"))
+    assert (new_con.min_x, new_con.max_x) == (-0.5, 1.0)
+    assert (new_con.min_y, new_con.max_y) == (-0.7, 0.2)
+    assert (new_con.min_z, new_con.max_z) == (-0.3, 0.1)
+
+def test_clone_constraint_mirrors_the_subtarget(rig):
+    con = rig.pose.bones["hand_l"].constraints.new(type='COPY_ROTATION')
+    con.subtarget = "lowerarm_l"
+
+    new_con = MirrorRig.clone_constraint(con, rig.pose.bones["hand_r"], ("_l", "_r"))
+    assert new_con.subtarget == "lowerarm_r"
+
+def add_foot_target(rig, name, head):
+    #the foot target of the leg controller with its configured shape rotation, flipped on the left only
+    bpy.ops.object.mode_set(mode='EDIT')
+    eb = rig.data.edit_bones.new(name)
+    eb.head = head
+    eb.tail = (head[0], head[1] + 0.1, head[2])
+    bpy.ops.object.mode_set(mode='POSE')
+    pb = rig.pose.bones[name]
+    pb.custom_shape_rotation_euler = [math.radians(90), math.radians(90), 0.0]
+    AddonFunctions.flip_left_shape(pb)
+    return pb
+
+def test_mirrored_foot_target_matches_a_two_sided_build():
+    two_sided = bench_helpers.build_rig()
+    add_foot_target(two_sided, "TB_foot_l", (0.1, 0.0, 0.0))
+    expected = add_foot_target(two_sided, "TB_foot_r", (-0.1, 0.0, 0.0))
+
+    mirrored = bench_helpers.build_rig()
+    snapshot = MirrorRig.take_snapshot(mirrored)
+    left = add_foot_target(mirrored, "TB_foot_l", (0.1, 0.0, 0.0))
+    MirrorRig.mirror_generated(mirrored, snapshot, ("_l", "_r"))
+
+    right = mirrored.pose.bones["TB_foot_r"]
+    assert list(right.custom_shape_rotation_euler) == list(expected.custom_shape_rotation_euler)
+    assert list(left.custom_shape_rotation_euler) != list(right.custom_shape_rotation_euler)
+
+def test_limit_location_x_is_reflected(rig):
+    con = rig.pose.bones["hand_l"].constraints.new(type='LIMIT_LOCATION')
+    con.min_x, con.max_x = -0.1, 0.4
+    con.use_min_x, con.use_max_x = False, True
+    con.min_y, con.max_y = -0.2, 0.3
+
+    new_con = MirrorRig.clone_constraint(con, rig.pose.bones["hand_r"], ("_l", "_r"))
+    assert (new_con.min_x, new_con.max_x) == (-0.4, 0.1)
+    assert (new_con.use_min_x, new_con.use_max_x) == (True, False)
+    assert (new_con.min_y, new_con.max_y) == (-0.2, 0.3)
+
+def test_child_of_inverse_matrix_is_reflected(rig):
+    con = rig.pose.bones["hand_l"].constraints.new(type='CHILD_OF')
+    con.inverse_matrix = mathutils.Matrix(((1, 0, 0, 0.5), (0, 1, 0, 0.2), (0, 0, 1, 0), (0, 0, 0, 1)))
+
+    new_con = MirrorRig.clone_constraint(con, rig.pose.bones["hand_r"], ("_l", "_r"))
+    assert np.allclose(np.array(new_con.inverse_matrix), [(1, 0, 0, -0.5), (0, 1, 0, 0.2), (0, 0, 1, 0), (0, 0, 0, 1)])
+
+def test_unknown_constraint_types_are_not_mirrored():
+    rig = bench_helpers.build_rig()
+    snapshot = MirrorRig.take_snapshot(rig)
+    rig.pose.bones["hand_l"].constraints.new(type='TRANSFORM')
+    rig.pose.bones["hand_l"].constraints.new(type='COPY_ROTATION')
+
+    _, cloned, skipped = MirrorRig.mirror_generated(rig, snapshot, ("_l", "_r"))
+    assert cloned == 1
+    assert skipped == ["hand_l: Transform"]
+    assert [con.type for con in rig.pose.bones["hand_r"].constraints] == ['COPY_ROTATION']
@@ -0,0 +1,38 @@
+import math
+
+import numpy as np
+import pytest
+
+import bench_helpers
+from BLRigTool.addons.BLRigTool.functions import PoleSolver
+
+LIMBS = [("upperarm_l", "lowerarm_l", "hand_l"), ("thigh_l", "calf_l", "foot_l"), ("upperarm_r", "lowerarm_r", "hand_r")]
+
+@pytest.fixture(scope="module")
+def rig():
+    return bench_helpers.build_rig()
+
+def test_pole_sits_on_the_bend_side():
+    upper = [(0.0, 0.0, 1.0)]
+    lower = [(0.0, 0.2, 0.5)]
+    end = [(0.0, 0.0, 0.0)]
+    pole = PoleSolver.solve_pole_positions(upper, lower, end, [(1.0, 0.0, 0.0)], distance=0.3)
+    assert np.allclose(pole, [(0.0, 0.5, 0.5)])
+
+def test_straight_limb_uses_the_fallback_axis():
+    upper = [(0.0, 0.0, 1.0)]
+    lower = [(0.0, 0.0, 0.5)]
+    end = [(0.0, 0.0, 0.0)]
+    pole = PoleSolver.solve_pole_positions(upper, lower, end, [(2.0, 0.0, 0.0)], distance=0.3)
+    assert np.allclose(pole, [(0.3, 0.0, 0.5)])
+
+def test_batch_matches_per_limb_reference(rig):
+    results = PoleSolver.compute_limb_poles(rig, LIMBS)
+    assert len(results) == len(LIMBS)
+    for (upper, lower, end), (pole, angle) in zip(LIMBS, results):
+        reference = bench_helpers.compute_pole_position(rig, upper, lower, end)
+        assert (pole - reference).length < 1e-4
+        assert math.isclose(angle, bench_helpers.compute_pole_angle(rig, upper, end, reference), abs_tol=1e-4)
+
+def test_no_limbs():
+    assert PoleSolver.compute_limb_poles(None, []) == []
@@ -0,0 +1,119 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from BLRigTool.addons.BLRigTool.functions import RenameEngine
+
+class Item:
+    def __init__(self, owner, name):
+        self.owner = owner
+        self._name = name
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        #names are cut to Blender's 63 byte limit, Blender would then silently pick "value.001" on a clash,
+        #the engine must never get there with a taken name
+        value = value.encode("utf-8")[:63].decode("utf-8", errors="ignore")
+        assert value not in self.owner.names(), f"{value} is already taken"
+        self._name = value
+
+class Items:
+    def __init__(self, names):
+        self.items = [Item(self, name) for name in names]
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def names(self):
+        return {item.name for item in self.items}
+
+    def keys(self):
+        return [item.name for item in self.items]
+
+def make_props(**values):
+    props = {
+        "rename_mode": 'FIND_REPLACE',
+        "find_str": "",
+        "replace_str": "",
+        "prefix_str": "",
+        "suffix_str": "",
+        "mapping_direction": 'SOURCE_TO_TARGET',
+        "case_rule": 'LOWER',
+    }
+    props.update(values)
+    return SimpleNamespace(**props)
+
+def test_find_replace():
+    plan = RenameEngine.compile_rename(make_props(find_str="_l", replace_str="_L"))
+    assert plan("upperarm_l") == "upperarm_L"
+
+def test_prefix_suffix():
+    plan = RenameEngine.compile_rename(make_props(rename_mode='REMOVE_PREFIX_SUFFIX', prefix_str="DEF_", suffix_str=".001"))
+    assert plan("DEF_spine.001") == "spine"
+
+def test_regex():
+    plan = RenameEngine.compile_rename(make_props(rename_mode='REGEX', find_str=r"^(\w+)_(l|r)$", replace_str=r"\2_\1"))
+    assert plan("hand_l") == "l_hand"
+
+def test_invalid_regex_pattern():
+    with pytest.raises(ValueError):
+        RenameEngine.compile_rename(make_props(rename_mode='REGEX', find_str="("))
+
+@pytest.mark.parametrize("replace_str", [r"\3", r"\q", r"\g<side>"])
+def test_invalid_regex_replacement(replace_str):
+    with pytest.raises(ValueError):
+        RenameEngine.compile_rename(make_props(rename_mode='REGEX', find_str=r"^(\w+)_(l|r)$", replace_str=replace_str))
+
+def test_bone_mapping_both_directions():
+    mappings = [("Hips", "pelvis"), ("Spine", "spine_01"), ("", "root")]
+    plan = RenameEngine.compile_rename(make_props(rename_mode='BONE_MAPPING'), mappings)
+    assert plan("Hips") == "pelvis" and plan("root") == "root"
+    plan = RenameEngine.compile_rename(make_props(rename_mode='BONE_MAPPING', mapping_direction='TARGET_TO_SOURCE'), mappings)
+    assert plan("spine_01") == "Spine"
+
+def test_conflicts_are_rejected():
+    renames, conflicts = RenameEngine.plan_renames(["a", "b", "c"], {"a": "c", "b": "x"}.get)
+    assert renames == {"b": "x"}
+    assert conflicts == [("a", "c")]
+
+def test_rename_onto_a_kept_name():
+    renames, conflicts = RenameEngine.plan_renames(["a_l", "a_L"], lambda name: name.lower())
+    assert renames == {}
+    assert conflicts == [("a_L", "a_l")]
+
+def test_swap_goes_through_a_temporary_name():
+    items = Items(["a", "b"])
+    renames, conflicts = RenameEngine.plan_renames(items.keys(), {"a": "b", "b": "a"}.get)
+    assert not conflicts
+    RenameEngine.apply_renames(items, renames)
+    assert [item.name for item in items] == ["b", "a"]
+
+def test_swap_of_long_names():
+    #a temporary name built from a 60 character name is cut to the name limit and would hit the third bone
+    long_a = "DEF_" + "x" * 54 + "_a"
+    long_b = "DEF_" + "x" * 54 + "_b"
+    items = Items([long_a, long_b, f"{long_a}.re"])
+    renames, conflicts = RenameEngine.plan_renames(items.keys(), {long_a: long_b, long_b: long_a}.get)
+    assert not conflicts
+    RenameEngine.apply_renames(items, renames)
+    assert [item.name for item in items] == [long_b, long_a, f"{long_a}.re"]
+
+def test_random_permutations_never_clash():
+    rng = random.Random(7)
+    for _ in range(300):
+        names = [f"bone_{i}" for i in range(rng.randint(1, 12))]
+        targets = names + [f"new_{i}" for i in range(4)]
+        mapping = {name: rng.choice(targets) for name in names if rng.random() < 0.7}
+        items = Items(names)
+        renames, conflicts = RenameEngine.plan_renames(items.keys(), lambda name: mapping.get(name, name))
+        RenameEngine.apply_renames(items, renames)
+
+        final = {old: item.name for old, item in zip(names, items)}
+        assert len(set(final.values())) == len(names)
+        for old, new in renames.items():
+            assert final[old] == new
@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+
+import bench_helpers
+from BLRigTool.addons.BLRigTool.functions import BatchBuilder, RigRecipe
+
+class OperatorProperties:
+    #operator history entry properties, every attribute is an editable RNA property
+    def __init__(self, **values):
+        vars(self).update(values)
+
+    @property
+    def bl_rna(self):
+        return SimpleNamespace(properties=[SimpleNamespace(identifier=key, type='STRING') for key in vars(self)])
+
+def make_operator(idname, **values):
+    properties = OperatorProperties(**values)
+    if RigRecipe.SELECTION_PROPERTY not in values:
+        properties.recorded_selection = ""
+    return SimpleNamespace(bl_idname=idname, properties=properties)
+
+def record_display_step(bones):
+    op = make_operator("WRYC_OT_ot_custom_display_bone")
+    RigRecipe.store_selection(op.properties, bones)
+    return RigRecipe.record_recipe([op])["steps"][0]
+
+def test_recorded_selection_becomes_the_step_selection():
+    rig = bench_helpers.build_rig()
+    step = record_display_step([rig.pose.bones["hand_l"], rig.pose.bones["hand_r"]])
+    assert step["select"] == ["hand_l", "hand_r"]
+    assert RigRecipe.SELECTION_PROPERTY not in step["params"]
+
+def test_steps_without_a_recorded_selection_keep_the_default():
+    op = make_operator("WRYC_OT_ot_set_inverse_all_child_of")
+    assert RigRecipe.record_recipe([op])["steps"][0]["select"] == "ALL"
+
+def test_selection_is_part_of_the_step_hash():
+    rig = bench_helpers.build_rig()
+    context = SimpleNamespace(scene=SimpleNamespace(bone_display_settings=OperatorProperties(bone_shape="Circle_0")))
+    hands = record_display_step([rig.pose.bones["hand_l"], rig.pose.bones["hand_r"]])
+    feet = record_display_step([rig.pose.bones["foot_l"], rig.pose.bones["foot_r"]])
+    assert RigRecipe.step_hash(context, hands, "source") != RigRecipe.step_hash(context, feet, "source")
+
+def test_recorded_selection_is_restored():
+    rig = bench_helpers.build_rig()
+    BatchBuilder.select_step_bones(rig, ["hand_l", "hand_r"])
+    selected = [pb.name for pb in rig.pose.bones if pb.bone.select]
+    assert selected == ["hand_l", "hand_r"]
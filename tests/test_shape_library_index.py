@@ -0,0 +1,44 @@
+import os
+import shutil
+
+import pytest
+
+from BLRigTool.addons.BLRigTool.functions import ShapeLibraryIndex
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "BLRigTool", "addons", "BLRigTool", "assets")
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+    #the names must come from the block reader, building the full index links the library into the file
+    def build_index(*args):
+        raise AssertionError("The full index was built for a name lookup")
+    monkeypatch.setattr(ShapeLibraryIndex, "build_index", build_index)
+    monkeypatch.setitem(ShapeLibraryIndex._index_folder, "value", str(tmp_path / "index"))
+    blend_path = str(tmp_path / "Shapes.blend")
+    shutil.copy(os.path.join(ASSETS_DIR, "BoneShapesLibrary.blend"), blend_path)
+    return blend_path
+
+def test_names_are_read_without_building_the_index(library, tmp_path):
+    names = ShapeLibraryIndex.get_library_names(library, str(tmp_path))
+    assert len(names) == 24 and "Circle_0" in names
+    assert not os.path.exists(ShapeLibraryIndex.get_index_path(library))
+
+def test_names_are_not_read_without_load(library, tmp_path):
+    assert ShapeLibraryIndex.get_library_names(library, str(tmp_path), load=False) is None
+
+def test_merged_index_takes_names_from_the_highest_layer(library, tmp_path):
+    override = str(tmp_path / "Override.blend")
+    shutil.copy(library, override)
+    merged = ShapeLibraryIndex.get_merged_index([override, library], str(tmp_path))
+    assert len(merged["names"]) == 24
+    assert ShapeLibraryIndex.get_shape_owner(merged, "Circle_0") == override
+
+def test_sidecars_are_kept_out_of_the_library_folder(library, tmp_path):
+    other = str(tmp_path / "other" / "Shapes.blend")
+    index_path = ShapeLibraryIndex.get_index_path(library)
+    assert os.path.dirname(index_path) == str(tmp_path / "index")
+    assert index_path != ShapeLibraryIndex.get_index_path(other)
+
+    ShapeLibraryIndex.write_index(library, {"version": ShapeLibraryIndex.INDEX_VERSION})
+    assert os.path.exists(index_path)
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".json")]